@@ -0,0 +1,81 @@
+"""Nifty animated Qt widgets.
+
+The names below are loaded lazily: importing nifty does not import Qt or any
+nifty submodule, each submodule is only imported the first time one of its
+names is accessed from the package.
+"""
+import importlib
+
+
+# Public name -> (submodule, attribute).
+_LAZY_ATTRIBUTES = {
+    # Widgets:
+    "LayoutDirection": ("widgets", "LayoutDirection"),
+    "ShowMode": ("widgets", "ShowMode"),
+    "SuspendPolicy": ("widgets", "SuspendPolicy"),
+    "Widget": ("widgets", "Widget"),
+    "MainWindow": ("widgets", "MainWindow"),
+    "PushButton": ("widgets", "PushButton"),
+    "AnimatedToggle": ("widgets", "AnimatedToggle"),
+    "ShowScheduler": ("widgets", "ShowScheduler"),
+    "ShowOperation": ("widgets", "ShowOperation"),
+    "suspend_animations": ("widgets", "suspend_animations"),
+    "resume_animations": ("widgets", "resume_animations"),
+    "batch_build": ("widgets", "batch_build"),
+    "create_push_buttons": ("widgets", "create_push_buttons"),
+    "create_push_button_grid": ("widgets", "create_push_button_grid"),
+    "VirtualWidget": ("containers", "VirtualWidget"),
+    "PulseButtonView": ("views", "PulseButtonView"),
+    # Animations:
+    "PropertyAnimation": ("animations", "PropertyAnimation"),
+    "ParallelAnimationGroup": ("animations", "ParallelAnimationGroup"),
+    "SequentialAnimationGroup": ("animations", "SequentialAnimationGroup"),
+    "PropertyAnimationGroup": ("animations", "PropertyAnimationGroup"),
+    "create_combined_property_animation": ("animations", "create_combined_property_animation"),
+    "enable_shared_driver": ("animations", "enable_shared_driver"),
+    "disable_shared_driver": ("animations", "disable_shared_driver"),
+    "running_animation_count": ("animations", "running_animation_count"),
+    "AnimationPriority": ("animations", "AnimationPriority"),
+    "set_animation_budget": ("animations", "set_animation_budget"),
+    "eviction_counts": ("animations", "eviction_counts"),
+    "lerp": ("animations", "lerp"),
+    "lerp_colors": ("animations", "lerp_colors"),
+    "evaluate_batch": ("animations", "evaluate_batch"),
+    # Themes and quality:
+    "Theme": ("themes", "Theme"),
+    "ThemeHandle": ("themes", "ThemeHandle"),
+    "default_theme": ("themes", "default_theme"),
+    "QualityLevel": ("quality", "QualityLevel"),
+    "enable_adaptive_quality": ("quality", "enable_adaptive_quality"),
+    "disable_adaptive_quality": ("quality", "disable_adaptive_quality"),
+    "PerformanceOverlay": ("profiling", "PerformanceOverlay"),
+    "PulseAtlasCache": ("atlases", "PulseAtlasCache"),
+    "enable_pulse_atlases": ("atlases", "enable_pulse_atlases"),
+    "disable_pulse_atlases": ("atlases", "disable_pulse_atlases"),
+    # Specs:
+    "load_spec": ("loader", "load_spec"),
+}
+
+__all__ = sorted(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(in_attribute_name: str):
+
+    try:
+
+        module_name, attribute_name = _LAZY_ATTRIBUTES[in_attribute_name]
+
+    except KeyError:
+
+        raise AttributeError(f"module '{__name__}' has no attribute '{in_attribute_name}'") from None
+
+    attribute = getattr(importlib.import_module(f".{module_name}", __name__), attribute_name)
+    # Cache on the package, so later lookups never reach __getattr__ again.
+    globals()[in_attribute_name] = attribute
+
+    return attribute
+
+
+def __dir__():
+
+    return sorted(set(globals()) | set(__all__))
@@ -1,28 +1,419 @@
+import collections
+import enum
+import functools
+
 from Qt import QtCore
+from Qt import QtGui
+
+from . import repaint
+from . import utilities
+
+
+_shared_driver = None
 
+# Top level nifty animations that have been started and not yet stopped, in start order.
+_active_animations = {}
 
-class PropertyAnimation(QtCore.QPropertyAnimation):
+# The most nifty animations allowed to run at once, None for no limit.
+_animation_budget = None
+# Animations snapped to their end by the budget, counted by priority.
+_eviction_counts = collections.Counter()
+
+
+class AnimationPriority(enum.IntEnum):
+	"""Which animations keep running once more are started than the animation budget allows.
+
+	When the budget is exceeded the lowest priority animations, oldest first,
+	are snapped to their end values.
+	"""
+
+	trailing = 0
+	hover = 1
+	normal = 2
+	feedback = 3
+	show = 4
+
+
+class AnimationDriver(QtCore.QObject):
+	"""Advances every nifty animation started while it is enabled from one clock.
+
+	Driven animations are started and immediately paused, so Qt's own animation
+	timer leaves them alone, then scrubbed forward with setCurrentTime on each
+	tick. Qt stops an animation once it reaches its end, at which point it is
+	dropped from the active set, and the timer idles while the set is empty.
+	"""
+
+	ticked = QtCore.Signal()
+
+	def __init__(self, in_interval=16, in_parent=None):
+
+		super().__init__(in_parent)
+
+		self._active_animations = {}
+		self._clock = QtCore.QElapsedTimer()
+		self._clock.start()
+
+		self._timer = QtCore.QTimer(self)
+		self._timer.setTimerType(QtCore.Qt.PreciseTimer)
+		self._timer.setInterval(in_interval)
+		self._timer.timeout.connect(self._on_tick_)
+
+	def drive(self, in_animation):
+		"""Take over ticking in_animation, starting it if it is stopped."""
+
+		if in_animation.state() == QtCore.QAbstractAnimation.Stopped:
+			QtCore.QAbstractAnimation.start(in_animation)
+
+		QtCore.QAbstractAnimation.pause(in_animation)
+		self._active_animations[in_animation] = (self._clock.elapsed(), in_animation.currentTime())
+		if not self._timer.isActive():
+			self._timer.start()
+
+	def release(self, in_animation):
+		"""Stop ticking in_animation, leaving its state untouched."""
+
+		self._active_animations.pop(in_animation, None)
+
+	def release_all(self):
+		"""Hand every driven animation back to Qt's own animation timer."""
+
+		for animation in tuple(self._active_animations):
+			self.release(animation)
+			try:
+				QtCore.QAbstractAnimation.resume(animation)
+			except RuntimeError:
+				pass
+
+		self._timer.stop()
+
+	def is_driving(self, in_animation):
+
+		return in_animation in self._active_animations
+
+	def active_animation_count(self):
+
+		return len(self._active_animations)
+
+	@QtCore.Slot()
+	def _on_tick_(self):
+
+		now = self._clock.elapsed()
+		with repaint.batch_updates():
+			self._tick_animations_(now)
+
+		if not self._active_animations:
+			self._timer.stop()
+
+		self.ticked.emit()
+
+	def _tick_animations_(self, in_now):
+
+		for animation, (start_time, start_position) in tuple(self._active_animations.items()):
+
+			try:
+				if animation.state() != QtCore.QAbstractAnimation.Paused:
+					# Stopped, or resumed by something other than the driver.
+					self.release(animation)
+					continue
+
+				elapsed = in_now - start_time
+				if animation.direction() == QtCore.QAbstractAnimation.Backward:
+					animation.setCurrentTime(max(start_position - elapsed, 0))
+
+				else:
+					total_duration = animation.totalDuration()
+					position = start_position + elapsed
+					animation.setCurrentTime(position if total_duration < 0 else min(position, total_duration))
+
+				if animation.state() == QtCore.QAbstractAnimation.Stopped:
+					self.release(animation)
+
+			except RuntimeError:
+				# The underlying C++ animation has been deleted.
+				self.release(animation)
+
+
+def enable_shared_driver(in_interval=16):
+	"""Route every nifty animation started from now on through a single driver.
+
+	Args:
+		in_interval (int): The tick interval of the driver in milliseconds.
+
+	Returns:
+		AnimationDriver: The shared driver.
+	"""
+
+	global _shared_driver
+	if _shared_driver is None:
+		_shared_driver = AnimationDriver(in_interval=in_interval)
+
+	return _shared_driver
+
+
+def disable_shared_driver():
+	"""Hand any driven animations back to Qt and stop using the shared driver."""
+
+	global _shared_driver
+	driver, _shared_driver = _shared_driver, None
+	if driver is not None:
+		driver.release_all()
+		driver.deleteLater()
+
+
+def get_shared_driver():
+
+	return _shared_driver
+
+
+def is_running(in_animation):
+	"""Whether in_animation is running, either on Qt's timer or the shared driver.
+
+	Animations ticked by the shared driver sit in the Paused state, so checking
+	state() == Running alone is not enough once the driver is enabled.
+	"""
+
+	state = in_animation.state()
+	if state == QtCore.QAbstractAnimation.Running:
+		return True
+
+	if state != QtCore.QAbstractAnimation.Paused or _shared_driver is None:
+		return False
+
+	root_animation = in_animation
+	while root_animation.group() is not None:
+		root_animation = root_animation.group()
+
+	return _shared_driver.is_driving(root_animation)
+
+
+def active_animations(in_target=None):
+	"""Get the top level nifty animations that have been started and not yet stopped.
+
+	Args:
+		in_target (QtCore.QObject): Only return animations targeting this object.
+
+	Returns:
+		tuple: The animations, oldest first.
+	"""
+
+	if in_target is None:
+		return tuple(_active_animations)
+
+	return tuple(animation for animation in _active_animations if get_animation_target(animation) is in_target)
+
+
+def running_animation_count():
+
+	return sum(1 for animation in _active_animations if is_running(animation))
+
+
+def get_animation_target(in_animation):
+	"""Get the object a property animation, or the first animation of a group, targets."""
+
+	if isinstance(in_animation, QtCore.QPropertyAnimation):
+		return in_animation.targetObject()
+
+	if isinstance(in_animation, QtCore.QAnimationGroup) and in_animation.animationCount():
+		return get_animation_target(in_animation.animationAt(0))
+
+	return None
+
+
+def fast_forward(in_animation):
+	"""Jump in_animation to its end values, stopping it."""
+
+	total_duration = in_animation.totalDuration()
+	if total_duration < 0:
+		return in_animation.stop()
+
+	return in_animation.setCurrentTime(total_duration)
+
+
+def set_animation_budget(in_max_count=None):
+	"""Limit how many nifty animations run at once.
+
+	Args:
+		in_max_count (int): The budget, None to let any number run.
+
+	Returns:
+		None
+	"""
+
+	global _animation_budget
+	_animation_budget = None if in_max_count is None else max(int(in_max_count), 1)
+	_enforce_animation_budget_()
+
+
+def get_animation_budget():
+
+	return _animation_budget
+
+
+def eviction_counts():
+	"""Get how many animations the budget has snapped to their end, by AnimationPriority."""
+
+	return {priority: _eviction_counts[priority] for priority in AnimationPriority}
+
+
+def reset_eviction_counts():
+
+	_eviction_counts.clear()
+
+
+def get_priority(in_animation):
+
+	return getattr(in_animation, "_priority", AnimationPriority.normal)
+
+
+def _enforce_animation_budget_():
+	"""Snap the lowest priority running animations, oldest first, to their end until the budget is met."""
+
+	if _animation_budget is None:
+		return
+
+	while True:
+		running_animations = [animation for animation in _active_animations if is_running(animation)]
+		if len(running_animations) <= _animation_budget:
+			return
+
+		# min is stable, so of the lowest priority animations the oldest is evicted.
+		evicted_animation = min(running_animations, key=get_priority)
+		_eviction_counts[get_priority(evicted_animation)] += 1
+		_active_animations.pop(evicted_animation, None)
+		fast_forward(evicted_animation)
+
+
+def _track_active_animation_(in_animation):
+
+	if in_animation.group() is not None:
+		return
+
+	if not getattr(in_animation, "_tracking_finished", False):
+		in_animation.finished.connect(in_animation._on_finished_)
+		in_animation._tracking_finished = True
+
+	_active_animations.pop(in_animation, None)
+	_active_animations[in_animation] = None
+
+
+def scale_duration(in_duration):
+	"""Scale in_duration for the current quality level, see quality.scale_duration."""
+
+	quality = utilities.get_loaded_module("quality")
+
+	return in_duration if quality is None else quality.scale_duration(in_duration)
+
+
+def should_snap():
+	"""Whether animations jump straight to their end values, see quality.should_snap."""
+
+	quality = utilities.get_loaded_module("quality")
+
+	return quality is not None and quality.should_snap()
+
+
+def _apply_quality_scale_(in_animation):
+	"""Rescale the durations of in_animation, and any animations it groups, for the current quality level."""
+
+	if isinstance(in_animation, PropertyAnimation):
+		QtCore.QPropertyAnimation.setDuration(in_animation, int(scale_duration(in_animation.base_duration())))
+
+	elif isinstance(in_animation, QtCore.QAnimationGroup):
+		for index in range(in_animation.animationCount()):
+			_apply_quality_scale_(in_animation.animationAt(index))
+
+
+class _DrivenAnimationMixin_(object):
+	"""Defers to the shared AnimationDriver, when enabled, instead of Qt's timer."""
+
+	def start(self):
+
+		self.started.emit()
+		_track_active_animation_(self)
+		_apply_quality_scale_(self)
+		if should_snap() and self.totalDuration() >= 0:
+			# Frames are over budget, jump straight to the end values.
+			super().start()
+			return self.setCurrentTime(self.totalDuration())
+
+		if _shared_driver is not None:
+			_shared_driver.drive(self)
+
+		else:
+			super().start()
+
+		_enforce_animation_budget_()
+
+	def set_priority(self, in_priority):
+		"""Set the AnimationPriority deciding whether the animation budget snaps this animation to its end."""
+
+		self._priority = in_priority
+
+	def priority(self):
+
+		return get_priority(self)
+
+	def pause(self):
+
+		if _shared_driver is not None:
+			_shared_driver.release(self)
+
+		return super().pause()
+
+	def resume(self):
+
+		if _shared_driver is not None and self.state() == QtCore.QAbstractAnimation.Paused:
+			return _shared_driver.drive(self)
+
+		return super().resume()
+
+	def stop(self):
+
+		_active_animations.pop(self, None)
+		if _shared_driver is not None:
+			_shared_driver.release(self)
+
+		return super().stop()
+
+	def is_running(self):
+
+		return is_running(self)
+
+	def _on_finished_(self):
+
+		_active_animations.pop(self, None)
+
+
+class PropertyAnimation(_DrivenAnimationMixin_, QtCore.QPropertyAnimation):
 	"""
 	"""
 	started = QtCore.Signal()
 
-	def __init__(self, in_widget, in_property_name, in_range, in_duration=150, in_parent=None):
+	def __init__(self, in_widget, in_property_name, in_range=None, in_duration=150, in_parent=None):
 
 		super().__init__(in_widget, bytes(in_property_name, encoding="utf-8"), in_parent if in_parent else in_widget)
 
-		_start_value, _end_value = in_range
-		self.setStartValue(_start_value)
-		self.setEndValue(_end_value)
+		# Without a range the animation starts from the property's current value.
+		if in_range is not None:
+			_start_value, _end_value = in_range
+			self.setStartValue(_start_value)
+			self.setEndValue(_end_value)
+
 		self.setDuration(in_duration)
 		self.setEasingCurve(QtCore.QEasingCurve.InQuad)
 
-	def start(self):
+	def setDuration(self, in_duration):
+		"""Set the duration at full quality, the adaptive quality controller may shorten it."""
 
-		self.started.emit()
-		return super().start()
+		self._base_duration = in_duration
+		return super().setDuration(int(scale_duration(in_duration)))
+
+	def base_duration(self):
+
+		return self._base_duration
 
 
-class ParallelAnimationGroup(QtCore.QParallelAnimationGroup):
+class ParallelAnimationGroup(_DrivenAnimationMixin_, QtCore.QParallelAnimationGroup):
 	"""
 	"""
 
@@ -34,13 +425,8 @@ class ParallelAnimationGroup(QtCore.QParallelAnimationGroup):
 		for animation in in_animations:
 			self.addAnimation(animation)
 
-	def start(self):
-
-		self.started.emit()
-		return super().start()
-
 
-class SequentialAnimationGroup(QtCore.QSequentialAnimationGroup):
+class SequentialAnimationGroup(_DrivenAnimationMixin_, QtCore.QSequentialAnimationGroup):
 	"""
 	"""
 
@@ -49,38 +435,204 @@ class SequentialAnimationGroup(QtCore.QSequentialAnimationGroup):
 	def __init__(self, in_animations):
 
 		super().__init__()
+		for animation in in_animations:
+			self.addAnimation(animation)
 
-	def start(self):
 
-		self.started.emit()
-		return self._super.start()
+class PropertyAnimationGroup(ParallelAnimationGroup):
+	"""Animates several properties of one widget over the same range in parallel.
+	"""
 
+	def __init__(self, in_widget, in_property_names, in_range=None, in_duration=150):
 
-class PropertyAnimationGroup(ParallelAnimationGroup):
+		super().__init__(
+			PropertyAnimation(
+				in_widget, property_name, in_range, in_duration=in_duration
+			) for property_name in in_property_names
+		)
+
+
+def create_combined_property_animation(in_widget, in_property_names, in_range, in_duration=150):
+
+	return PropertyAnimationGroup(in_widget, in_property_names, in_range, in_duration=in_duration)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_numpy_():
+	"""Import NumPy the first time a batch helper needs it, None when it is unavailable.
+
+	Kept out of the module imports so scalar animations never pay for it.
 	"""
+
+	try:
+		import numpy
+	except ImportError:
+		return None
+
+	return numpy
+
+
+def _to_array_(in_values, in_converter=None):
+	"""Convert in_values to a NumPy array, or a list when NumPy is unavailable.
+
+	Scalars are returned untouched so they broadcast against the other arguments.
 	"""
 
-	def __init__(self, in_property_names):
+	if isinstance(in_values, (int, float)):
+		return in_values
 
-		super().__init__()
+	numpy = _get_numpy_()
+	if in_converter is not None:
+		if not isinstance(in_values, (list, tuple)) and (numpy is None or not isinstance(in_values, numpy.ndarray)):
+			in_values = (in_values,)
 
-	def start(self):
+		if len(in_values) and not isinstance(in_values[0], (int, float, list, tuple)) and (
+			numpy is None or not isinstance(in_values[0], numpy.ndarray)
+		):
+			in_values = [in_converter(value) for value in in_values]
 
-		self.started.emit()
-		return self._super.start()
+	if numpy is not None:
+		return numpy.asarray(in_values, dtype=float)
 
+	return list(in_values)
 
-def create_combined_property_animation(in_widget, in_property_names, in_range, in_duration=150):
 
-	animations = (
-		PropertyAnimation(
-			in_widget, property_name, in_range, in_duration=in_duration
-		) for property_name in in_property_names
-	)
+def _lerp_lists_(in_start, in_end, in_value):
+	"""The pure Python fallback of lerp for sequences, used without NumPy."""
+
+	sequences = [argument for argument in (in_start, in_end, in_value) if isinstance(argument, list)]
+	length = len(sequences[0])
 
-	return ParallelAnimationGroup(animations)
+	def _get_(in_argument, in_index):
+		return in_argument[in_index] if isinstance(in_argument, list) else in_argument
+
+	return [
+		lerp(_get_(in_start, index), _get_(in_end, index), _get_(in_value, index))
+		for index in range(length)
+	]
 
 
 def lerp(in_start, in_end, in_value):
+	"""Linearly interpolate from in_start to in_end.
+
+	Scalars behave as before. Any argument may also be a sequence or NumPy
+	array, in which case many values are interpolated in one call, with
+	scalars broadcast against the sequences.
+	"""
+
+	if isinstance(in_start, (int, float)) and isinstance(in_end, (int, float)) and isinstance(in_value, (int, float)):
+		return ((in_end - in_start) * in_value) + in_start
+
+	in_start, in_end, in_value = _to_array_(in_start), _to_array_(in_end), _to_array_(in_value)
+	numpy = _get_numpy_()
+	if numpy is None:
+		return _lerp_lists_(in_start, in_end, in_value)
+
+	if numpy.ndim(in_value) == 1 and numpy.ndim(in_start) == 2:
+		# One progress value per row of components, such as colours or points.
+		in_value = in_value[:, numpy.newaxis]
 
 	return ((in_end - in_start) * in_value) + in_start
+
+
+def _color_to_components_(in_color):
+
+	return in_color.redF(), in_color.greenF(), in_color.blueF(), in_color.alphaF()
+
+
+def _point_to_components_(in_point):
+
+	return in_point.x(), in_point.y()
+
+
+def _size_to_components_(in_size):
+
+	return in_size.width(), in_size.height()
+
+
+def lerp_colors(in_start_colors, in_end_colors, in_values):
+	"""Interpolate QColors, or rows of RGBA floats, returning one RGBA row per colour."""
+
+	return lerp(
+		_to_array_(in_start_colors, _color_to_components_), _to_array_(in_end_colors, _color_to_components_), in_values
+	)
+
+
+def lerp_points(in_start_points, in_end_points, in_values):
+	"""Interpolate QPoint/QPointFs, or rows of x and y, returning one row per point."""
+
+	return lerp(
+		_to_array_(in_start_points, _point_to_components_), _to_array_(in_end_points, _point_to_components_), in_values
+	)
+
+
+def lerp_sizes(in_start_sizes, in_end_sizes, in_values):
+	"""Interpolate QSize/QSizeFs, or rows of width and height, returning one row per size."""
+
+	return lerp(
+		_to_array_(in_start_sizes, _size_to_components_), _to_array_(in_end_sizes, _size_to_components_), in_values
+	)
+
+
+def to_colors(in_components):
+	"""Convert rows of RGBA floats, as returned by lerp_colors, back to QColors."""
+
+	return [QtGui.QColor.fromRgbF(*(min(max(float(value), 0.0), 1.0) for value in row)) for row in in_components]
+
+
+class EasingTable(object):
+	"""A QEasingCurve sampled into a lookup table.
+
+	Evaluating the table linearly interpolates between neighbouring samples,
+	and accepts a single progress value or a whole array of them at once.
+	"""
+
+	def __init__(self, in_easing_type=QtCore.QEasingCurve.InQuad, in_resolution=256):
+
+		easing_curve = QtCore.QEasingCurve(in_easing_type)
+		self._resolution = max(in_resolution, 2)
+		self._samples = [
+			easing_curve.valueForProgress(index / (self._resolution - 1)) for index in range(self._resolution)
+		]
+		numpy = _get_numpy_()
+		if numpy is not None:
+			self._positions = numpy.linspace(0.0, 1.0, self._resolution)
+			self._sample_array = numpy.asarray(self._samples)
+
+	def __call__(self, in_progress):
+
+		if isinstance(in_progress, (int, float)):
+			position = min(max(in_progress, 0.0), 1.0) * (self._resolution - 1)
+			index = min(int(position), self._resolution - 2)
+
+			return lerp(self._samples[index], self._samples[index + 1], position - index)
+
+		numpy = _get_numpy_()
+		if numpy is not None:
+			return numpy.interp(numpy.clip(_to_array_(in_progress), 0.0, 1.0), self._positions, self._sample_array)
+
+		return [self(progress) for progress in in_progress]
+
+
+@functools.lru_cache(maxsize=None)
+def get_easing_table(in_easing_type=QtCore.QEasingCurve.InQuad, in_resolution=256):
+	"""Get the cached EasingTable for an easing type and resolution."""
+
+	return EasingTable(in_easing_type, in_resolution)
+
+
+def evaluate_batch(in_start_values, in_end_values, in_progress, in_easing_type=QtCore.QEasingCurve.InQuad, in_resolution=256):
+	"""Evaluate many eased animations in a single vectorized step.
+
+	Args:
+		in_start_values: The start value of each animation.
+		in_end_values: The end value of each animation.
+		in_progress: The linear progress, from 0 to 1, of each animation.
+		in_easing_type (QtCore.QEasingCurve.Type): The easing shared by the batch.
+		in_resolution (int): The number of samples in the easing table.
+
+	Returns:
+		The current value of each animation.
+	"""
+
+	return lerp(in_start_values, in_end_values, get_easing_table(in_easing_type, in_resolution)(in_progress))
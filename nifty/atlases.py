@@ -0,0 +1,595 @@
+"""Pulse frame atlases, rasterized on a worker thread pool and cached on disk.
+
+A pulse is a filled circle whose radius grows from 0 to its full radius
+while its colour moves along a fixed ramp, so for a given size, pair of
+colours and device pixel ratio every frame it can show is known up front.
+Atlases hold those frames in a single QImage strip, indexed by radius, which
+turns painting a pulse into a table lookup and one blit.
+
+Atlases are rendered off the GUI thread and written to a versioned cache
+under utilities.get_cache_directory, later sessions memory-map them instead
+of rendering them again.
+"""
+import collections
+import hashlib
+import math
+import mmap
+import os
+import struct
+import sys
+import time
+
+from Qt import QtCore
+from Qt import QtGui
+
+from . import animations
+from . import utilities
+
+
+# Increment whenever the atlas file layout or frame rendering changes, invalidating every cached atlas.
+FORMAT_VERSION = 1
+
+_MAGIC = b"NFTA"
+# Magic, format version, frame count, image width, image height, bytes per line and device pixel ratio.
+_HEADER = struct.Struct("<4sIIIIId")
+# The x offset and size, in pixels, of each frame.
+_FRAME = struct.Struct("<II")
+
+
+class PulseAtlas(object):
+    """The frames of a pulse packed left to right into one premultiplied ARGB32 image.
+
+    Frame n is the pulse at n / (frame count - 1) of its full radius, each
+    frame is a square cell just large enough for its circle.
+    """
+
+    def __init__(
+        self,
+        in_image: QtGui.QImage,
+        in_frames: list,
+        in_full_radius: float,
+        in_device_pixel_ratio: float,
+        in_buffer=None,
+    ):
+
+        self.image = in_image
+        self.full_radius = in_full_radius
+        self.device_pixel_ratio = in_device_pixel_ratio
+        self._frames = in_frames
+        # The memory map a loaded image reads its pixels from, it must outlive the image.
+        self._buffer = in_buffer
+
+    # Public Methods:
+    def frame_count(self) -> int:
+
+        return len(self._frames)
+
+    def memory_size(self) -> int:
+
+        return self.image.bytesPerLine() * self.image.height()
+
+    def draw(self, in_painter: QtGui.QPainter, in_center, in_radius: float) -> None:
+        """Blit the frame closest to in_radius, centred on in_center.
+
+        Args:
+            in_painter (QtGui.QPainter): The active painter.
+            in_center (QtCore.QPoint | QtCore.QPointF): The centre of the pulse.
+            in_radius (float): The radius of the pulse in logical pixels.
+
+        Returns:
+            None
+        """
+
+        last_index = len(self._frames) - 1
+        index = round(min(max(in_radius / self.full_radius, 0.0), 1.0) * last_index)
+        if index == 0:
+
+            return
+
+        offset, size = self._frames[index]
+        logical_size = size / self.device_pixel_ratio
+        in_painter.drawImage(
+            QtCore.QRectF(
+                in_center.x() - logical_size / 2, in_center.y() - logical_size / 2, logical_size, logical_size
+            ),
+            self.image,
+            QtCore.QRectF(offset, 0, size, size),
+        )
+
+
+def render_pulse_atlas(
+    in_full_radius: float,
+    in_color_at_zero: QtGui.QColor,
+    in_color_at_full: QtGui.QColor,
+    in_frame_count: int = 24,
+    in_device_pixel_ratio: float = 1.0,
+) -> PulseAtlas:
+    """Rasterize the frames of a pulse, safe to call from any thread.
+
+    Args:
+        in_full_radius (float): The radius of the last frame in logical pixels.
+        in_color_at_zero (QtGui.QColor): The colour of the pulse as its radius reaches 0.
+        in_color_at_full (QtGui.QColor): The colour of the pulse at its full radius.
+        in_frame_count (int): The number of frames, including the empty first frame.
+        in_device_pixel_ratio (float): The device pixel ratio of the target.
+
+    Returns:
+        PulseAtlas: The atlas.
+    """
+
+    last_index = in_frame_count - 1
+    radii = [in_full_radius * in_device_pixel_ratio * index / last_index for index in range(in_frame_count)]
+    sizes = [math.ceil(2 * radius) + 2 for radius in radii]
+    frames = []
+    offset = 0
+    for size in sizes:
+
+        frames.append((offset, size))
+        offset += size
+
+    colors = animations.to_colors(
+        animations.lerp_colors(
+            [in_color_at_zero] * in_frame_count,
+            [in_color_at_full] * in_frame_count,
+            [index / last_index for index in range(in_frame_count)],
+        )
+    )
+
+    image = QtGui.QImage(offset, sizes[-1], QtGui.QImage.Format_ARGB32_Premultiplied)
+    image.fill(QtCore.Qt.transparent)
+    painter = QtGui.QPainter(image)
+    painter.setRenderHint(QtGui.QPainter.Antialiasing)
+    painter.setPen(QtCore.Qt.NoPen)
+    for radius, (frame_offset, size), color in zip(radii[1:], frames[1:], colors[1:]):
+
+        painter.setBrush(color)
+        painter.drawEllipse(QtCore.QPointF(frame_offset + size / 2, size / 2), radius, radius)
+
+    painter.end()
+
+    return PulseAtlas(image, frames, in_full_radius, in_device_pixel_ratio)
+
+
+def _write_atlas_(in_path: str, in_atlas: PulseAtlas) -> None:
+
+    image = in_atlas.image
+    header = _HEADER.pack(
+        _MAGIC, FORMAT_VERSION, in_atlas.frame_count(), image.width(), image.height(), image.bytesPerLine(),
+        in_atlas.device_pixel_ratio,
+    )
+    os.makedirs(os.path.dirname(in_path), exist_ok=True)
+    # Written aside and moved into place, so other processes never map a partial atlas.
+    temporary_path = f"{in_path}.{os.getpid()}.{id(in_atlas)}.tmp"
+    with open(temporary_path, "wb") as atlas_file:
+
+        atlas_file.write(header)
+        for frame in in_atlas._frames:
+
+            atlas_file.write(_FRAME.pack(*frame))
+
+        atlas_file.write(bytes(image.constBits())[: in_atlas.memory_size()])
+
+    os.replace(temporary_path, in_path)
+
+
+def _read_atlas_(in_path: str, in_full_radius: float) -> PulseAtlas:
+    """Memory-map a cached atlas, returning None if it is missing, truncated or from another format version."""
+
+    try:
+
+        with open(in_path, "rb") as atlas_file:
+
+            buffer = mmap.mmap(atlas_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    except (OSError, ValueError):
+
+        return None
+
+    try:
+
+        # Marks the atlas as recently used, see PulseAtlasCache.prune_disk_cache.
+        os.utime(in_path)
+
+    except OSError:
+
+        pass
+
+    if len(buffer) < _HEADER.size:
+
+        # Closed straight away, rather than holding the mapping and its file open until collected.
+        buffer.close()
+        return None
+
+    magic, version, frame_count, width, height, bytes_per_line, device_pixel_ratio = _HEADER.unpack_from(buffer)
+    pixels_offset = _HEADER.size + frame_count * _FRAME.size
+    if magic != _MAGIC or version != FORMAT_VERSION or len(buffer) != pixels_offset + bytes_per_line * height:
+
+        buffer.close()
+        return None
+
+    frames = [_FRAME.unpack_from(buffer, _HEADER.size + index * _FRAME.size) for index in range(frame_count)]
+    # The image reads its pixels straight from the mapped pages, nothing is copied or decoded.
+    image = QtGui.QImage(
+        memoryview(buffer)[pixels_offset:], width, height, bytes_per_line, QtGui.QImage.Format_ARGB32_Premultiplied
+    )
+
+    return PulseAtlas(image, frames, in_full_radius, device_pixel_ratio, buffer)
+
+
+def _prune_directory_(in_root_directory: str, in_current_directory: str, in_disk_limit: int) -> int:
+    """Delete stale and least recently used atlases under in_root_directory, see PulseAtlasCache.prune_disk_cache.
+
+    Only touches the file system, so it is safe to run on a pool thread.
+    """
+
+    stale_paths = []
+    atlas_entries = []
+    abandoned_time = time.time() - 60 * 60
+    try:
+
+        with os.scandir(in_root_directory) as directories:
+
+            for directory in directories:
+
+                if not directory.is_dir():
+
+                    continue
+
+                is_current = directory.path == in_current_directory
+                for entry in os.scandir(directory.path):
+
+                    entry_stat = entry.stat()
+                    if not is_current:
+
+                        stale_paths.append(entry.path)
+
+                    elif entry.name.endswith(".atlas"):
+
+                        atlas_entries.append((entry_stat.st_mtime, entry_stat.st_size, entry.path))
+
+                    elif entry_stat.st_mtime < abandoned_time:
+
+                        stale_paths.append(entry.path)
+
+    except OSError:
+
+        return 0
+
+    atlas_entries.sort()
+    total_size = sum(size for _, size, _ in atlas_entries)
+    while atlas_entries and total_size > in_disk_limit:
+
+        _, size, path = atlas_entries.pop(0)
+        stale_paths.append(path)
+        total_size -= size
+
+    deleted_count = 0
+    for path in stale_paths:
+
+        try:
+
+            os.remove(path)
+            deleted_count += 1
+
+        except OSError:
+
+            # Still mapped on platforms that lock mapped files, or removed by another process.
+            pass
+
+    return deleted_count
+
+
+class _AtlasSignals_(QtCore.QObject):
+
+    rendered = QtCore.Signal(object, object, float)
+    pruned = QtCore.Signal(int)
+
+
+class _AtlasTask_(QtCore.QRunnable):
+    """Renders one atlas on a pool thread, then writes it to the disk cache."""
+
+    def __init__(self, in_key: tuple, in_path: str, in_signals: _AtlasSignals_):
+
+        super().__init__()
+
+        self._key = in_key
+        self._path = in_path
+        self._signals = in_signals
+
+    def run(self):
+
+        full_radius, color_at_zero, color_at_full, frame_count, device_pixel_ratio = self._key
+        start_time = time.perf_counter()
+        atlas = None
+        try:
+
+            atlas = render_pulse_atlas(
+                full_radius,
+                QtGui.QColor.fromRgba(color_at_zero),
+                QtGui.QColor.fromRgba(color_at_full),
+                frame_count,
+                device_pixel_ratio,
+            )
+            try:
+
+                _write_atlas_(self._path, atlas)
+
+            except OSError:
+
+                # An unwritable cache only costs rendering the atlas again next session.
+                pass
+
+        finally:
+
+            # Always delivered, queued to the GUI thread which owns the atlas cache,
+            # so a failed render never leaves its key pending. None marks a failure.
+            self._signals.rendered.emit(self._key, atlas, time.perf_counter() - start_time)
+
+
+class _PruneTask_(QtCore.QRunnable):
+    """Prunes the disk cache on a pool thread, so its directory scan never runs in the paint path."""
+
+    def __init__(
+        self, in_root_directory: str, in_current_directory: str, in_disk_limit: int, in_signals: _AtlasSignals_
+    ):
+
+        super().__init__()
+
+        self._root_directory = in_root_directory
+        self._current_directory = in_current_directory
+        self._disk_limit = in_disk_limit
+        self._signals = in_signals
+
+    def run(self):
+
+        deleted_count = 0
+        try:
+
+            deleted_count = _prune_directory_(self._root_directory, self._current_directory, self._disk_limit)
+
+        finally:
+
+            # Always delivered, so the cache can queue the next prune.
+            self._signals.pruned.emit(deleted_count)
+
+
+class PulseAtlasCache(QtCore.QObject):
+    """A least recently used cache of pulse atlases, filled by a thread pool and a disk cache.
+
+    get_atlas never blocks on rendering: a missing atlas is memory-mapped
+    from disk when it was rendered by an earlier session, otherwise it is
+    queued on the thread pool and None is returned until it is ready, so
+    callers fall back to rendering.draw_pulse in the meantime.
+    """
+
+    atlas_ready = QtCore.Signal(object)
+
+    # Milliseconds renders are batched for before the disk cache is pruned on the thread pool.
+    _PRUNE_DELAY = 5000
+
+    def __init__(
+        self,
+        in_frame_count: int = 24,
+        in_memory_limit: int = 64 * 2 ** 20,
+        in_cache_directory: str = None,
+        in_disk_limit: int = 256 * 2 ** 20,
+        in_thread_pool: QtCore.QThreadPool = None,
+        in_parent: QtCore.QObject = None,
+    ):
+
+        super().__init__(in_parent)
+
+        self._frame_count = max(in_frame_count, 2)
+        self._memory_limit = in_memory_limit
+        self._memory_used = 0
+        self._disk_limit = in_disk_limit
+        self._root_directory = os.path.join(utilities.get_cache_directory(in_cache_directory), "atlases")
+        self._directory = os.path.join(self._root_directory, f"v{FORMAT_VERSION}-{sys.byteorder}")
+        self._thread_pool = QtCore.QThreadPool.globalInstance() if in_thread_pool is None else in_thread_pool
+        self._atlases = collections.OrderedDict()
+        # Key -> task, the task is kept alive here until its atlas is delivered.
+        self._pending_tasks = {}
+        # Keys whose render raised, they fall back to the sprite cache rather than being retried every paint.
+        self._failed_keys = set()
+        self._signals = _AtlasSignals_(self)
+        self._signals.rendered.connect(self._on_rendered_)
+        self._signals.pruned.connect(self._on_pruned_)
+        # The running prune task, kept alive here until it reports back, see _queue_prune_.
+        self._prune_task = None
+        self._prune_timer = QtCore.QTimer(self)
+        self._prune_timer.setSingleShot(True)
+        self._prune_timer.setInterval(self._PRUNE_DELAY)
+        self._prune_timer.timeout.connect(self._on_prune_timeout_)
+
+        self.hits = 0
+        self.disk_loads = 0
+        self.renders = 0
+        self.render_time = 0.0
+        self.failures = 0
+        self.evictions = 0
+        self.disk_prunes = 0
+
+        # Once up front, later prunes are batched after renders and run on the thread pool.
+        self.prune_disk_cache()
+
+    # Slots:
+    @QtCore.Slot(object, object, float)
+    def _on_rendered_(self, in_key: tuple, in_atlas: PulseAtlas, in_render_time: float) -> None:
+
+        self._pending_tasks.pop(in_key, None)
+        if in_atlas is None:
+
+            self.failures += 1
+            self._failed_keys.add(in_key)
+
+            return
+
+        self.renders += 1
+        self.render_time += in_render_time
+        self._insert_(in_key, in_atlas)
+        self._queue_prune_()
+        self.atlas_ready.emit(in_key)
+
+    @QtCore.Slot()
+    def _on_prune_timeout_(self) -> None:
+
+        self._prune_task = _PruneTask_(self._root_directory, self._directory, self._disk_limit, self._signals)
+        self._thread_pool.start(self._prune_task)
+
+    @QtCore.Slot(int)
+    def _on_pruned_(self, in_deleted_count: int) -> None:
+
+        self._prune_task = None
+        self.disk_prunes += 1
+
+    # Public Methods:
+    def get_atlas(
+        self,
+        in_full_radius: float,
+        in_color_at_zero: QtGui.QColor,
+        in_color_at_full: QtGui.QColor,
+        in_device_pixel_ratio: float = 1.0,
+    ) -> PulseAtlas:
+        """Get the atlas of a pulse, starting to load it if it is not already cached.
+
+        Args:
+            in_full_radius (float): The radius of the pulse at the end of its ramp, in logical pixels.
+            in_color_at_zero (QtGui.QColor): The colour of the pulse as its radius reaches 0.
+            in_color_at_full (QtGui.QColor): The colour of the pulse at its full radius.
+            in_device_pixel_ratio (float): The device pixel ratio of the target.
+
+        Returns:
+            PulseAtlas: The atlas, or None while it is still being rendered.
+        """
+
+        key = (
+            round(in_full_radius, 1), in_color_at_zero.rgba(), in_color_at_full.rgba(), self._frame_count,
+            in_device_pixel_ratio,
+        )
+        atlas = self._atlases.get(key)
+        if atlas is not None:
+
+            self.hits += 1
+            self._atlases.move_to_end(key)
+
+            return atlas
+
+        if key in self._pending_tasks or key in self._failed_keys:
+
+            return None
+
+        path = os.path.join(self._directory, f"{hashlib.sha256(repr(key).encode()).hexdigest()}.atlas")
+        atlas = _read_atlas_(path, key[0])
+        if atlas is not None:
+
+            self.disk_loads += 1
+            self._insert_(key, atlas)
+
+            return atlas
+
+        task = _AtlasTask_(key, path, self._signals)
+        self._pending_tasks[key] = task
+        self._thread_pool.start(task)
+
+        return None
+
+    def prune_disk_cache(self) -> int:
+        """Keep the disk cache under its size limit, deleting the least recently used atlases first.
+
+        Atlases of other format versions, and temporary files abandoned by an
+        interrupted write, are deleted outright. Loading an atlas refreshes its
+        modification time, so atlases in use are the last to go.
+
+        Returns:
+            int: The number of files deleted.
+        """
+
+        return _prune_directory_(self._root_directory, self._directory, self._disk_limit)
+
+    def pending_count(self) -> int:
+
+        return len(self._pending_tasks)
+
+    def wait_for_pending(self, in_timeout: int = -1) -> bool:
+        """Block until every queued atlas is rendered and delivered, mostly useful for benchmarks and tests."""
+
+        finished = self._thread_pool.waitForDone(in_timeout)
+        QtCore.QCoreApplication.sendPostedEvents(self)
+
+        return finished and not self._pending_tasks
+
+    def statistics(self) -> dict:
+
+        return {
+            "hits": self.hits,
+            "disk_loads": self.disk_loads,
+            "renders": self.renders,
+            "render_time": self.render_time,
+            "failures": self.failures,
+            "evictions": self.evictions,
+            "disk_prunes": self.disk_prunes,
+            "atlases": len(self._atlases),
+            "pending": len(self._pending_tasks),
+            "memory_used": self._memory_used,
+            "memory_limit": self._memory_limit,
+        }
+
+    def clear(self) -> None:
+
+        # Pending tasks are left to finish, their atlases are cached as they arrive.
+        self._atlases.clear()
+        self._memory_used = 0
+
+    # Private Methods:
+    def _insert_(self, in_key: tuple, in_atlas: PulseAtlas) -> None:
+
+        self._atlases[in_key] = in_atlas
+        self._memory_used += in_atlas.memory_size()
+        while self._memory_used > self._memory_limit and len(self._atlases) > 1:
+
+            _, evicted_atlas = self._atlases.popitem(last=False)
+            self._memory_used -= evicted_atlas.memory_size()
+            self.evictions += 1
+
+    def _queue_prune_(self) -> None:
+        """Prune the disk cache on the thread pool once a burst of renders has settled.
+
+        Renders finishing while a prune is already running are covered by the
+        prune that follows the next render.
+        """
+
+        if self._prune_task is None and not self._prune_timer.isActive():
+
+            self._prune_timer.start()
+
+
+_cache = None
+
+
+def enable_pulse_atlases(*args, **kwargs) -> PulseAtlasCache:
+    """Create the global atlas cache, arguments are passed to PulseAtlasCache.
+
+    Until it is enabled pulses are drawn with rendering.draw_pulse alone.
+    """
+
+    global _cache
+    if _cache is None:
+
+        _cache = PulseAtlasCache(*args, **kwargs)
+
+    return _cache
+
+
+def disable_pulse_atlases() -> None:
+
+    global _cache
+    cache, _cache = _cache, None
+    if cache is not None:
+
+        cache.clear()
+        cache.deleteLater()
+
+
+def get_pulse_atlas_cache() -> PulseAtlasCache:
+
+    return _cache
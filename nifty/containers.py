@@ -0,0 +1,207 @@
+import math
+
+from Qt import QtCore
+from Qt import QtWidgets
+
+from . import widgets
+
+
+def _bind_display_text_(in_widget: QtWidgets.QWidget, in_index: QtCore.QModelIndex) -> None:
+
+    in_widget.setText(str(in_index.data(QtCore.Qt.DisplayRole) or ""))
+
+
+class VirtualWidget(widgets.Widget):
+    """A scrolling nifty container fed from a data model, which recycles its item widgets.
+
+    Only enough item widgets to fill the viewport, plus an overscan margin
+    above and below it, are ever created. As the view scrolls, widgets that
+    leave the viewport are moved and re-bound to the rows entering it, so
+    memory and construction time depend on the viewport size rather than the
+    number of rows in the model.
+
+    Args:
+        in_width (int): The width of the container.
+        in_height (int): The height of the container.
+        in_model (QtCore.QAbstractItemModel): The rows to display.
+        in_item_height (int): The height of each row.
+        in_widget_factory (callable): Creates an item widget, defaults to a PushButton.
+        in_bind (callable): Called with an item widget and the QModelIndex it now
+            shows, defaults to setting the widget's text from the display role.
+        in_overscan (int): The number of extra rows kept above and below the viewport.
+    """
+
+    def __init__(
+        self,
+        in_width: int,
+        in_height: int,
+        in_model: QtCore.QAbstractItemModel = None,
+        in_item_height: int = 30,
+        in_widget_factory=None,
+        in_bind=None,
+        in_overscan: int = 2,
+        **kwargs
+    ):
+
+        widgets.Widget.__init__(self, in_width, in_height, in_layout=QtWidgets.QHBoxLayout, **kwargs)
+
+        self._model = None
+        self._item_height = in_item_height
+        self._widget_factory = in_widget_factory or self._create_push_button_
+        self._bind = in_bind or _bind_display_text_
+        self._overscan = in_overscan
+
+        # The recycled item widgets and the row each is currently bound to.
+        self._pool = []
+        self._bound_rows = []
+
+        self.layout().setContentsMargins(0, 0, 0, 0)
+        self.layout().setSpacing(0)
+        self._viewport = QtWidgets.QWidget(self)
+        self._scroll_bar = QtWidgets.QScrollBar(QtCore.Qt.Vertical, self)
+        self._scroll_bar.setSingleStep(in_item_height)
+        self._scroll_bar.valueChanged.connect(self._on_scrolled_)
+        self.layout().addWidget(self._viewport)
+        self.layout().addWidget(self._scroll_bar)
+
+        if in_model is not None:
+
+            self.set_model(in_model)
+
+    # Slots:
+    @QtCore.Slot()
+    def _on_model_changed_(self) -> None:
+
+        self._bound_rows = [None] * len(self._pool)
+        self._update_scroll_range_()
+        self._relayout_()
+
+    @QtCore.Slot(QtCore.QModelIndex, QtCore.QModelIndex)
+    def _on_data_changed_(self, in_top_left: QtCore.QModelIndex, in_bottom_right: QtCore.QModelIndex) -> None:
+
+        for position, row in enumerate(self._bound_rows):
+
+            if row is not None and in_top_left.row() <= row <= in_bottom_right.row():
+
+                self._bind(self._pool[position], self._model.index(row, 0))
+
+    @QtCore.Slot(int)
+    def _on_scrolled_(self, in_value: int) -> None:
+
+        self._relayout_()
+
+    # Public Methods:
+    def model(self) -> QtCore.QAbstractItemModel:
+
+        return self._model
+
+    def set_model(self, in_model: QtCore.QAbstractItemModel) -> None:
+
+        if self._model is not None:
+
+            self._model.modelReset.disconnect(self._on_model_changed_)
+            self._model.layoutChanged.disconnect(self._on_model_changed_)
+            self._model.rowsInserted.disconnect(self._on_model_changed_)
+            self._model.rowsRemoved.disconnect(self._on_model_changed_)
+            self._model.dataChanged.disconnect(self._on_data_changed_)
+
+        self._model = in_model
+        in_model.modelReset.connect(self._on_model_changed_)
+        in_model.layoutChanged.connect(self._on_model_changed_)
+        in_model.rowsInserted.connect(self._on_model_changed_)
+        in_model.rowsRemoved.connect(self._on_model_changed_)
+        in_model.dataChanged.connect(self._on_data_changed_)
+        self._on_model_changed_()
+
+    def item_widgets(self) -> tuple:
+        """Get every item widget created so far, bound or not."""
+
+        return tuple(self._pool)
+
+    def widget_for_row(self, in_row: int) -> QtWidgets.QWidget:
+        """Get the item widget currently showing in_row, or None if it is not in the viewport."""
+
+        try:
+
+            return self._pool[self._bound_rows.index(in_row)]
+
+        except ValueError:
+
+            return None
+
+    def scroll_to_row(self, in_row: int) -> None:
+
+        self._scroll_bar.setValue(in_row * self._item_height)
+
+    # Private Methods:
+    def _create_push_button_(self) -> widgets.PushButton:
+
+        return widgets.PushButton("", self._width, self._item_height)
+
+    def _get_row_count_(self) -> int:
+
+        return 0 if self._model is None else self._model.rowCount()
+
+    def _update_scroll_range_(self) -> None:
+
+        viewport_height = self._viewport.height()
+        self._scroll_bar.setPageStep(viewport_height)
+        self._scroll_bar.setRange(0, max(self._get_row_count_() * self._item_height - viewport_height, 0))
+
+    def _relayout_(self) -> None:
+        """Position and bind just enough item widgets to cover the viewport."""
+
+        row_count = self._get_row_count_()
+        viewport_width = self._viewport.width()
+        scroll_position = self._scroll_bar.value()
+        first_row = max(scroll_position // self._item_height - self._overscan, 0)
+        required_count = min(
+            math.ceil(self._viewport.height() / self._item_height) + 1 + self._overscan * 2, row_count
+        )
+
+        while len(self._pool) < required_count:
+
+            item_widget = self._widget_factory()
+            item_widget.setParent(self._viewport)
+            self._pool.append(item_widget)
+            self._bound_rows.append(None)
+
+        # Row n is always shown by slot n % pool size, so scrolling by a row only
+        # re-binds the slot of the row that left, the rest just move.
+        pool_size = len(self._pool)
+        slot_rows = [None] * pool_size
+        for row in range(first_row, min(first_row + required_count, row_count)):
+
+            slot_rows[row % pool_size] = row
+
+        for position, (item_widget, row) in enumerate(zip(self._pool, slot_rows)):
+
+            if row is None:
+
+                item_widget.setVisible(False)
+                self._bound_rows[position] = None
+                continue
+
+            if self._bound_rows[position] != row:
+
+                self._bind(item_widget, self._model.index(row, 0))
+                self._bound_rows[position] = row
+
+            item_widget.setGeometry(
+                0, row * self._item_height - scroll_position, viewport_width, self._item_height
+            )
+            # setVisible rather than show, as the nifty show animation resets the widget's size.
+            item_widget.setVisible(True)
+
+    # Qt Methods:
+    def resizeEvent(self, event):
+
+        result = super().resizeEvent(event)
+        self._update_scroll_range_()
+        self._relayout_()
+
+        return result
+
+    def wheelEvent(self, event):
+
+        return QtWidgets.QApplication.sendEvent(self._scroll_bar, event)
@@ -0,0 +1,268 @@
+"""Build nifty widget trees from JSON specs.
+
+A spec describes one widget per object::
+
+    {
+        "type": "Widget",
+        "width": 500,
+        "height": 200,
+        "layout_direction": "vertical",
+        "layout": "vertical",
+        "children": [
+            {"type": "PushButton", "text": "BUTTON", "width": 100, "height": 100, "repeat": 4}
+        ]
+    }
+
+Specs are compiled into a flat build plan, which is cached on disk keyed by
+the sha256 of the spec and the plan format version, so later runs skip
+straight to building the widgets.
+"""
+import hashlib
+import json
+import os
+import re
+
+from Qt import QtWidgets
+
+from . import utilities
+from . import widgets
+
+
+# Increment whenever the plan layout changes, invalidating every cached plan.
+FORMAT_VERSION = 2
+
+_WIDGET_TYPES = ("Widget", "PushButton", "AnimatedToggle")
+_LAYOUTS = {
+    "vertical": QtWidgets.QVBoxLayout,
+    "horizontal": QtWidgets.QHBoxLayout,
+    "grid": QtWidgets.QGridLayout,
+}
+_SNAKE_CASE = re.compile(r"[a-z][a-z0-9]*(_[a-z0-9]+)*")
+_SPEC_KEYS = {
+    "type", "width", "height", "layout_direction", "show_mode", "layout", "columns", "text", "properties",
+    "children", "repeat",
+}
+
+
+def _get_integer_(in_spec: dict, in_key: str, in_path: str, in_default: int = None, in_minimum: int = 0) -> int:
+
+    value = in_spec.get(in_key, in_default)
+    if not isinstance(value, int) or isinstance(value, bool) or value < in_minimum:
+
+        raise ValueError(f"{in_path}: '{in_key}' must be an integer of at least {in_minimum}, got {value!r}")
+
+    return value
+
+
+def _get_choice_(in_spec: dict, in_key: str, in_choices, in_default: str, in_path: str) -> str:
+
+    value = in_spec.get(in_key, in_default)
+    if value not in in_choices:
+
+        raise ValueError(f"{in_path}: '{in_key}' must be one of {', '.join(in_choices)}, got {value!r}")
+
+    return value
+
+
+def _compile_setters_(in_properties: dict, in_type_name: str, in_path: str) -> list:
+    """Resolve snake case property names, such as minimum_height, to their Qt setters once, at compile time."""
+
+    if not isinstance(in_properties, dict):
+
+        raise ValueError(f"{in_path}: 'properties' must be an object")
+
+    widget_class = getattr(widgets, in_type_name)
+    setters = []
+    for name, value in in_properties.items():
+
+        if not _SNAKE_CASE.fullmatch(name):
+
+            raise ValueError(f"{in_path}: property {name!r} must be snake case, such as minimum_height")
+
+        setter_name = widgets.convert_attribute_name(f"set_{name}")
+        if not hasattr(widget_class, setter_name):
+
+            raise ValueError(f"{in_path}: {in_type_name} has no setter {setter_name} for property {name!r}")
+
+        setters.append([setter_name, value if isinstance(value, list) else [value]])
+
+    return setters
+
+
+def _compile_node_(in_spec: dict, in_path: str, io_nodes: list, io_children: list) -> list:
+    """Append the plan nodes of in_spec, and its children, returning the indices of its own nodes."""
+
+    if not isinstance(in_spec, dict):
+
+        raise ValueError(f"{in_path}: expected an object")
+
+    unknown_keys = set(in_spec) - _SPEC_KEYS
+    if unknown_keys:
+
+        raise ValueError(f"{in_path}: unknown key(s) {', '.join(sorted(unknown_keys))}")
+
+    type_name = _get_choice_(in_spec, "type", _WIDGET_TYPES, None, in_path)
+    width = _get_integer_(in_spec, "width", in_path)
+    height = _get_integer_(in_spec, "height", in_path)
+    layout_direction = _get_choice_(
+        in_spec, "layout_direction", widgets.LayoutDirection.__members__, "horizontal", in_path
+    )
+    show_mode = _get_choice_(in_spec, "show_mode", widgets.ShowMode.__members__, "resize", in_path)
+    layout = _get_choice_(in_spec, "layout", _LAYOUTS, "vertical", in_path)
+    columns = _get_integer_(in_spec, "columns", in_path, 1, 1) if layout == "grid" else None
+    text = str(in_spec.get("text", ""))
+    setters = _compile_setters_(in_spec.get("properties", {}), type_name, in_path)
+    repeat = _get_integer_(in_spec, "repeat", in_path, 1, 1)
+    children = in_spec.get("children", ())
+    if not isinstance(children, (list, tuple)):
+
+        raise ValueError(f"{in_path}: 'children' must be a list")
+
+    if type_name != "Widget" and children:
+
+        raise ValueError(f"{in_path}: only a Widget can have children")
+
+    indices = []
+    for _ in range(repeat):
+
+        index = len(io_nodes)
+        io_nodes.append([type_name, width, height, layout_direction, show_mode, layout, columns, text, setters])
+        io_children.append([])
+        for child_number, child_spec in enumerate(children):
+
+            io_children[index].extend(
+                _compile_node_(child_spec, f"{in_path}.children[{child_number}]", io_nodes, io_children)
+            )
+
+        indices.append(index)
+
+    return indices
+
+
+def compile_spec(in_spec: dict) -> dict:
+    """Compile a spec into a flat build plan.
+
+    Args:
+        in_spec (dict): The root widget spec.
+
+    Returns:
+        dict: The plan: every widget, depth first, and the children of each.
+            Raises a ValueError describing the first invalid entry.
+    """
+
+    nodes = []
+    children = []
+    root_indices = _compile_node_(in_spec, "root", nodes, children)
+    if len(root_indices) != 1:
+
+        raise ValueError("root: the root widget cannot be repeated")
+
+    return {"version": FORMAT_VERSION, "nodes": nodes, "children": children}
+
+
+def load_plan(in_path: str, in_cache_directory: str = None) -> dict:
+    """Get the build plan of a spec file, compiling and caching it if it is not already cached.
+
+    Args:
+        in_path (str): The JSON spec file.
+        in_cache_directory (str): Where plans are cached, see utilities.get_cache_directory.
+
+    Returns:
+        dict: The build plan.
+    """
+
+    with open(in_path, "rb") as spec_file:
+
+        spec_bytes = spec_file.read()
+
+    digest = hashlib.sha256(f"{FORMAT_VERSION}:".encode() + spec_bytes).hexdigest()
+    cache_directory = utilities.get_cache_directory(in_cache_directory)
+    cache_path = os.path.join(cache_directory, f"{digest}.json")
+    try:
+
+        with open(cache_path, "r") as cache_file:
+
+            plan = json.load(cache_file)
+
+        if plan.get("version") == FORMAT_VERSION:
+
+            return plan
+
+    except (OSError, ValueError):
+
+        pass
+
+    plan = compile_spec(json.loads(spec_bytes))
+    try:
+
+        os.makedirs(cache_directory, exist_ok=True)
+        # Written aside and moved into place, so other processes never read a partial plan.
+        temporary_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w") as cache_file:
+
+            json.dump(plan, cache_file, separators=(",", ":"))
+
+        os.replace(temporary_path, cache_path)
+
+    except OSError:
+
+        # An unwritable cache only costs compiling the spec again next time.
+        pass
+
+    return plan
+
+
+def build_plan(in_plan: dict) -> QtWidgets.QWidget:
+    """Build the widget tree described by a plan, returning its root.
+
+    Every widget is created first, then children are added to their parents
+    deepest first, so each subtree is complete before it is attached and each
+    layout only runs a single pass.
+    """
+
+    if in_plan.get("version") != FORMAT_VERSION:
+
+        raise ValueError(f"Unsupported build plan version {in_plan.get('version')!r}, expected {FORMAT_VERSION}")
+
+    nodes = in_plan["nodes"]
+    built_widgets = []
+    for type_name, width, height, layout_direction, show_mode, layout, _, text, setters in nodes:
+
+        kwargs = {
+            "in_layout_direction": widgets.LayoutDirection[layout_direction],
+            "in_show_mode": widgets.ShowMode[show_mode],
+        }
+        if type_name == "PushButton":
+
+            widget = widgets.PushButton(text, width, height, **kwargs)
+
+        elif type_name == "AnimatedToggle":
+
+            widget = widgets.AnimatedToggle(width, height, **kwargs)
+
+        else:
+
+            widget = widgets.Widget(width, height, in_layout=_LAYOUTS[layout], **kwargs)
+
+        for setter_name, arguments in setters:
+
+            getattr(widget, setter_name)(*arguments)
+
+        built_widgets.append(widget)
+
+    for index in range(len(nodes) - 1, -1, -1):
+
+        child_indices = in_plan["children"][index]
+        if child_indices:
+
+            built_widgets[index].addWidgets(
+                [built_widgets[child_index] for child_index in child_indices], in_column_count=nodes[index][6]
+            )
+
+    return built_widgets[0]
+
+
+def load_spec(in_path: str, in_cache_directory: str = None) -> QtWidgets.QWidget:
+    """Build the widget tree described by a JSON spec file, using its cached plan when there is one."""
+
+    return build_plan(load_plan(in_path, in_cache_directory))
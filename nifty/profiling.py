@@ -0,0 +1,261 @@
+import functools
+import time
+
+from Qt import QtCore
+from Qt import QtGui
+from Qt import QtWidgets
+
+from . import animations
+
+
+_MISSING = object()
+
+# Classes whose paintEvent is timed while a PerformanceOverlay is attached.
+_paint_classes = []
+# (class, attribute name) -> the attribute the hook replaced.
+_original_attributes = {}
+_attached_count = 0
+
+# Class name -> [paint count, cumulative seconds].
+_paint_statistics = {}
+_counters = {"paints": 0, "animation_starts": 0}
+
+
+def register_paint_class(in_class) -> None:
+    """Time in_class.paintEvent whenever a PerformanceOverlay is attached.
+
+    Registering is free, the hook is only installed while an overlay is attached.
+    """
+
+    if in_class in _paint_classes:
+
+        return
+
+    _paint_classes.append(in_class)
+    if _attached_count:
+
+        _instrument_paint_event_(in_class)
+
+
+def get_paint_statistics() -> list:
+    """Get (class name, paint count, cumulative seconds) for each timed paintEvent, slowest first."""
+
+    return sorted(
+        ((name, count, seconds) for name, (count, seconds) in _paint_statistics.items()),
+        key=lambda item: item[2],
+        reverse=True,
+    )
+
+
+def get_counters() -> dict:
+
+    return dict(_counters)
+
+
+def reset_statistics() -> None:
+
+    _paint_statistics.clear()
+    for name in _counters:
+
+        _counters[name] = 0
+
+
+def _replace_attribute_(in_class, in_name: str, in_attribute) -> None:
+
+    _original_attributes[(in_class, in_name)] = in_class.__dict__.get(in_name, _MISSING)
+    setattr(in_class, in_name, in_attribute)
+
+
+def _instrument_paint_event_(in_class) -> None:
+
+    if (in_class, "paintEvent") in _original_attributes:
+
+        return
+
+    paint_event = in_class.paintEvent
+    class_name = in_class.__qualname__
+
+    @functools.wraps(paint_event)
+    def _timed_paint_event_(self, event):
+
+        start_time = time.perf_counter()
+        try:
+
+            return paint_event(self, event)
+
+        finally:
+
+            statistics = _paint_statistics.setdefault(class_name, [0, 0.0])
+            statistics[0] += 1
+            statistics[1] += time.perf_counter() - start_time
+            _counters["paints"] += 1
+
+    _replace_attribute_(in_class, "paintEvent", _timed_paint_event_)
+
+
+def _instrument_animation_start_(in_class) -> None:
+
+    start = in_class.start
+
+    @functools.wraps(start)
+    def _counted_start_(self, *args):
+
+        _counters["animation_starts"] += 1
+
+        return start(self, *args)
+
+    _replace_attribute_(in_class, "start", _counted_start_)
+
+
+def _install_hooks_() -> None:
+
+    from . import widgets
+
+    register_paint_class(widgets.PushButton)
+    register_paint_class(widgets.AnimatedToggle)
+    for paint_class in _paint_classes:
+
+        _instrument_paint_event_(paint_class)
+
+    for animation_class in (
+        animations.PropertyAnimation, animations.ParallelAnimationGroup, animations.SequentialAnimationGroup
+    ):
+
+        _instrument_animation_start_(animation_class)
+
+
+def _uninstall_hooks_() -> None:
+
+    for (hooked_class, name), attribute in _original_attributes.items():
+
+        if attribute is _MISSING:
+
+            delattr(hooked_class, name)
+
+        else:
+
+            setattr(hooked_class, name, attribute)
+
+    _original_attributes.clear()
+
+
+class PerformanceOverlay(QtWidgets.QWidget):
+    """A live heads up display of nifty performance, drawn over its host widget.
+
+    Shows the frames per second of the host window, the number of running
+    nifty animations, repaints per second and the slowest paintEvent
+    implementations by cumulative time. The timing hooks it relies on are
+    only installed while at least one overlay is attached.
+    """
+
+    def __init__(self, in_refresh_interval: int = 500, in_slowest_count: int = 5):
+
+        super().__init__()
+
+        self._slowest_count = in_slowest_count
+        self._host = None
+        self._frame_count = 0
+        self._last_paint_count = 0
+        self._lines = ()
+
+        self._clock = QtCore.QElapsedTimer()
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setInterval(in_refresh_interval)
+        self._refresh_timer.timeout.connect(self._on_refresh_)
+
+        self.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents)
+        self.setFont(QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.FixedFont))
+
+    # Slots:
+    @QtCore.Slot()
+    def _on_refresh_(self) -> None:
+
+        seconds = max(self._clock.restart() / 1000, 1e-6)
+        paint_count = _counters["paints"]
+        lines = [
+            f"FPS:        {self._frame_count / seconds:7.1f}",
+            f"Animations: {animations.running_animation_count():7d}",
+            f"Repaints/s: {(paint_count - self._last_paint_count) / seconds:7.1f}",
+        ]
+        self._frame_count = 0
+        self._last_paint_count = paint_count
+
+        for name, count, cumulative_seconds in get_paint_statistics()[:self._slowest_count]:
+
+            lines.append(f"{name:<16.16}{cumulative_seconds * 1000:9.1f} ms /{count:6d}")
+
+        self._lines = lines
+        metrics = self.fontMetrics()
+        self.resize(
+            max(metrics.horizontalAdvance(line) for line in lines) + 16, metrics.lineSpacing() * len(lines) + 12
+        )
+        self.raise_()
+        self.update()
+
+    # Public Methods:
+    def attach(self, in_host: QtWidgets.QWidget) -> None:
+        """Attach the overlay to the top left of a MainWindow, Widget or any other widget."""
+
+        global _attached_count
+        if self._host is not None:
+
+            self.detach()
+
+        self._host = in_host
+        self.setParent(in_host)
+        self.move(4, 4)
+        in_host.window().installEventFilter(self)
+
+        _attached_count += 1
+        if _attached_count == 1:
+
+            _install_hooks_()
+
+        self._clock.start()
+        self._refresh_timer.start()
+        self._on_refresh_()
+        self.show()
+
+    def detach(self) -> None:
+
+        global _attached_count
+        if self._host is None:
+
+            return
+
+        self._refresh_timer.stop()
+        self._host.window().removeEventFilter(self)
+        self._host = None
+        self.hide()
+        self.setParent(None)
+
+        _attached_count -= 1
+        if not _attached_count:
+
+            _uninstall_hooks_()
+
+    # Qt Methods:
+    def eventFilter(self, in_object, in_event):
+
+        # Every update request the window receives is a frame it composites.
+        if in_event.type() == QtCore.QEvent.UpdateRequest:
+
+            self._frame_count += 1
+
+        return False
+
+    def paintEvent(self, event):
+
+        painter = QtGui.QPainter(self)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setPen(QtCore.Qt.NoPen)
+        painter.setBrush(QtGui.QColor(0, 0, 0, 170))
+        painter.drawRoundedRect(self.rect(), 4, 4)
+
+        painter.setPen(QtCore.Qt.white)
+        line_spacing = self.fontMetrics().lineSpacing()
+        for index, line in enumerate(self._lines):
+
+            painter.drawText(8, 6 + self.fontMetrics().ascent() + line_spacing * index, line)
+
+        painter.end()
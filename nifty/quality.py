@@ -0,0 +1,176 @@
+import collections
+import enum
+import time
+
+from Qt import QtCore
+
+
+class QualityLevel(enum.IntEnum):
+
+    full = 0
+    no_antialiasing = 1
+    short_durations = 2
+    snap = 3
+
+
+class QualityController(QtCore.QObject):
+    """Steps nifty rendering and animation quality down while frames run over budget.
+
+    Frame times are measured as the overrun of a precise timer firing twice
+    per frame budget: how much later than its interval each tick arrives.
+    An idle event loop records close to 0 ms, while anything blocking it
+    (paint, layout or user code) records the time it blocked past the tick.
+    Measuring the gap between ticks instead could never drop below the
+    interval, so quality would never recover. Values can also be fed in
+    with record_frame_time, such as measured paint durations.
+
+    Each step down, in order, turns off antialiasing in paintEvent, shortens
+    PropertyAnimation durations, then snaps animations straight to their end.
+    Once frames recover the controller steps back up one level at a time.
+    """
+
+    level_changed = QtCore.Signal(int)
+
+    def __init__(
+        self,
+        in_frame_budget: float = 1000 / 60,
+        in_sample_count: int = 30,
+        in_recovery_ratio: float = 0.75,
+        in_duration_scale: float = 0.5,
+        in_parent: QtCore.QObject = None,
+    ):
+
+        super().__init__(in_parent)
+
+        self._frame_budget = in_frame_budget
+        self._recovery_ratio = in_recovery_ratio
+        self._duration_scale = in_duration_scale
+        self._frame_times = collections.deque(maxlen=in_sample_count)
+        self._level = QualityLevel.full
+
+        # Each transition is recorded as (timestamp, old level, new level, average frame time).
+        self.history = []
+
+        self._clock = QtCore.QElapsedTimer()
+        self._timer = QtCore.QTimer(self)
+        self._timer.setTimerType(QtCore.Qt.PreciseTimer)
+        # Sampled at half the budget, so normal scheduler jitter stays well under it.
+        self._timer.setInterval(max(int(in_frame_budget / 2), 1))
+        self._timer.timeout.connect(self._on_frame_)
+
+    # Slots:
+    @QtCore.Slot()
+    def _on_frame_(self) -> None:
+
+        self.record_frame_time(max(self._clock.restart() - self._timer.interval(), 0))
+
+    # Public Methods:
+    def start(self) -> None:
+
+        self._clock.start()
+        self._timer.start()
+
+    def stop(self) -> None:
+
+        self._timer.stop()
+        self._frame_times.clear()
+
+    def level(self) -> QualityLevel:
+
+        return self._level
+
+    def set_level(self, in_level: QualityLevel) -> None:
+
+        in_level = QualityLevel(in_level)
+        if in_level == self._level:
+
+            return
+
+        average_frame_time = sum(self._frame_times) / len(self._frame_times) if self._frame_times else 0.0
+        self.history.append((time.time(), self._level, in_level, average_frame_time))
+        self._level = in_level
+        self._frame_times.clear()
+        self.level_changed.emit(int(in_level))
+
+    def record_frame_time(self, in_frame_time: float) -> None:
+        """Record how long a frame blocked the event loop in milliseconds, stepping quality up or down as needed."""
+
+        self._frame_times.append(in_frame_time)
+        if len(self._frame_times) < self._frame_times.maxlen:
+
+            return
+
+        average_frame_time = sum(self._frame_times) / len(self._frame_times)
+        if average_frame_time > self._frame_budget and self._level < QualityLevel.snap:
+
+            self.set_level(self._level + 1)
+
+        elif average_frame_time < self._frame_budget * self._recovery_ratio and self._level > QualityLevel.full:
+
+            self.set_level(self._level - 1)
+
+    def antialiasing_enabled(self) -> bool:
+
+        return self._level < QualityLevel.no_antialiasing
+
+    def scale_duration(self, in_duration: float) -> float:
+
+        if self._level >= QualityLevel.short_durations:
+
+            return in_duration * self._duration_scale
+
+        return in_duration
+
+    def should_snap(self) -> bool:
+
+        return self._level >= QualityLevel.snap
+
+
+_controller = None
+
+
+def enable_adaptive_quality(*args, **kwargs) -> QualityController:
+    """Create and start the global quality controller, arguments are passed to QualityController."""
+
+    global _controller
+    if _controller is None:
+
+        _controller = QualityController(*args, **kwargs)
+        _controller.start()
+
+    return _controller
+
+
+def disable_adaptive_quality() -> None:
+
+    global _controller
+    controller, _controller = _controller, None
+    if controller is not None:
+
+        controller.stop()
+        controller.deleteLater()
+
+
+def get_controller() -> QualityController:
+
+    return _controller
+
+
+def get_level() -> QualityLevel:
+
+    return QualityLevel.full if _controller is None else _controller.level()
+
+
+def antialiasing_enabled() -> bool:
+
+    return _controller is None or _controller.antialiasing_enabled()
+
+
+def scale_duration(in_duration: float) -> float:
+
+    return in_duration if _controller is None else _controller.scale_duration(in_duration)
+
+
+def should_snap() -> bool:
+
+    return _controller is not None and _controller.should_snap()
@@ -0,0 +1,298 @@
+import collections
+import math
+
+from Qt import QtCore
+from Qt import QtGui
+
+from . import utilities
+
+
+class SpriteCache(object):
+    """A least recently used cache of pre-rasterized pulse and static layer sprites.
+
+    Sprites are keyed by quantized radius, colour, alpha and device pixel
+    ratio, so an animated pulse turns into a handful of pixmap blits rather
+    than antialiased path rasterization on every frame. The colour of a pulse
+    is interpolated every frame, so its channels are quantized as well, or
+    two frames at the same radius would rarely share a sprite.
+    """
+
+    def __init__(
+        self,
+        in_memory_limit: int = 32 * 2 ** 20,
+        in_radius_step: float = 1.0,
+        in_alpha_step: int = 4,
+        in_color_step: int = 8,
+    ):
+
+        self._sprites = collections.OrderedDict()
+        self._memory_limit = in_memory_limit
+        self._memory_used = 0
+        self._radius_step = in_radius_step
+        self._alpha_step = in_alpha_step
+        self._color_step = in_color_step
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # Public Methods:
+    def get_pulse_sprite(self, in_radius: float, in_color: QtGui.QColor, in_device_pixel_ratio: float = 1.0) -> QtGui.QPixmap:
+        """Get a transparent pixmap with a filled circle centred in it.
+
+        Args:
+            in_radius (float): The radius of the circle in logical pixels.
+            in_color (QtGui.QColor): The fill colour of the circle.
+            in_device_pixel_ratio (float): The device pixel ratio of the target.
+
+        Returns:
+            QtGui.QPixmap: The sprite, with its device pixel ratio already set.
+        """
+
+        radius = max(round(in_radius / self._radius_step) * self._radius_step, self._radius_step)
+        red, green, blue = (
+            _quantize_channel_(channel, self._color_step) for channel in (in_color.red(), in_color.green(), in_color.blue())
+        )
+        alpha = _quantize_channel_(in_color.alpha(), self._alpha_step)
+        key = (radius, red, green, blue, alpha, in_device_pixel_ratio)
+
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+
+            self.hits += 1
+            self._sprites.move_to_end(key)
+
+            return sprite
+
+        self.misses += 1
+        sprite = self._render_pulse_sprite_(radius, QtGui.QColor(red, green, blue, alpha), in_device_pixel_ratio)
+        self._insert_(key, sprite)
+
+        return sprite
+
+    def get_rounded_rect_sprite(
+        self,
+        in_size: QtCore.QSizeF,
+        in_radius: float,
+        in_color: QtGui.QColor,
+        in_pen_color: QtGui.QColor = None,
+        in_device_pixel_ratio: float = 1.0,
+    ) -> QtGui.QPixmap:
+        """Get a transparent pixmap with a filled rounded rect drawn one logical pixel in from its top left.
+
+        Used for static layers, such as the track of a toggle, that only
+        change when the widget is resized or moved to a screen of a different
+        device pixel ratio.
+
+        Args:
+            in_size (QtCore.QSizeF): The size of the rect in logical pixels.
+            in_radius (float): The x and y radius of the rounded corners.
+            in_color (QtGui.QColor): The fill colour of the rect.
+            in_pen_color (QtGui.QColor): The outline colour of the rect, None for no outline.
+            in_device_pixel_ratio (float): The device pixel ratio of the target.
+
+        Returns:
+            QtGui.QPixmap: The sprite, with its device pixel ratio already set.
+        """
+
+        pen_rgba = None if in_pen_color is None else in_pen_color.rgba()
+        key = (
+            "rounded_rect", round(in_size.width(), 2), round(in_size.height(), 2), round(in_radius, 2),
+            in_color.rgba(), pen_rgba, in_device_pixel_ratio,
+        )
+
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+
+            self.hits += 1
+            self._sprites.move_to_end(key)
+
+            return sprite
+
+        self.misses += 1
+        sprite = self._render_rounded_rect_sprite_(in_size, in_radius, in_color, in_pen_color, in_device_pixel_ratio)
+        self._insert_(key, sprite)
+
+        return sprite
+
+    def statistics(self) -> dict:
+
+        lookups = self.hits + self.misses
+
+        return {
+            "hits": self.hits,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "sprites": len(self._sprites),
+            "memory_used": self._memory_used,
+            "memory_limit": self._memory_limit,
+        }
+
+    def reset_statistics(self) -> None:
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def clear(self) -> None:
+
+        self._sprites.clear()
+        self._memory_used = 0
+
+    # Private Methods:
+    def _insert_(self, in_key, in_sprite: QtGui.QPixmap) -> None:
+
+        self._sprites[in_key] = in_sprite
+        self._memory_used += _get_pixmap_memory_(in_sprite)
+        while self._memory_used > self._memory_limit and len(self._sprites) > 1:
+
+            _, evicted_sprite = self._sprites.popitem(last=False)
+            self._memory_used -= _get_pixmap_memory_(evicted_sprite)
+            self.evictions += 1
+
+    @staticmethod
+    def _render_pulse_sprite_(in_radius: float, in_color: QtGui.QColor, in_device_pixel_ratio: float) -> QtGui.QPixmap:
+
+        size = math.ceil(2 * in_radius * in_device_pixel_ratio) + 2
+        sprite = QtGui.QPixmap(size, size)
+        sprite.setDevicePixelRatio(in_device_pixel_ratio)
+        sprite.fill(QtCore.Qt.transparent)
+
+        center = size / in_device_pixel_ratio / 2
+        painter = QtGui.QPainter(sprite)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setPen(QtCore.Qt.NoPen)
+        painter.setBrush(in_color)
+        painter.drawEllipse(QtCore.QPointF(center, center), in_radius, in_radius)
+        painter.end()
+
+        return sprite
+
+    @staticmethod
+    def _render_rounded_rect_sprite_(
+        in_size: QtCore.QSizeF,
+        in_radius: float,
+        in_color: QtGui.QColor,
+        in_pen_color: QtGui.QColor,
+        in_device_pixel_ratio: float,
+    ) -> QtGui.QPixmap:
+
+        sprite = QtGui.QPixmap(
+            math.ceil((in_size.width() + 2) * in_device_pixel_ratio),
+            math.ceil((in_size.height() + 2) * in_device_pixel_ratio),
+        )
+        sprite.setDevicePixelRatio(in_device_pixel_ratio)
+        sprite.fill(QtCore.Qt.transparent)
+
+        painter = QtGui.QPainter(sprite)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setPen(QtCore.Qt.NoPen if in_pen_color is None else QtGui.QPen(in_pen_color))
+        painter.setBrush(in_color)
+        painter.drawRoundedRect(QtCore.QRectF(QtCore.QPointF(1, 1), in_size), in_radius, in_radius)
+        painter.end()
+
+        return sprite
+
+
+class LayerRegions(object):
+    """Tracks the area each animated layer of a widget covered on its last frame.
+
+    Property setters hand the rect their layer now covers to invalidate and
+    update only the returned region, which also covers the area the layer
+    occupied on the previous frame so nothing is left behind.
+    """
+
+    def __init__(self):
+
+        self._rects = {}
+
+    def invalidate(self, in_layer: str, in_rect) -> QtGui.QRegion:
+        """Record the rect in_layer now covers.
+
+        Args:
+            in_layer (str): The name of the layer.
+            in_rect (QtCore.QRect | QtGui.QRegion): The area the layer covers on the next frame.
+
+        Returns:
+            QtGui.QRegion: The region to repaint.
+        """
+
+        previous_rect = self._rects.get(in_layer)
+        self._rects[in_layer] = in_rect
+        region = QtGui.QRegion(in_rect)
+        if previous_rect is not None and previous_rect != in_rect:
+
+            region = region.united(previous_rect)
+
+        return region
+
+    def release(self, in_layer: str) -> QtCore.QRect:
+        """Forget in_layer once it is no longer drawn.
+
+        Returns:
+            QtCore.QRect: The rect it last covered, which needs repainting, or None.
+        """
+
+        return self._rects.pop(in_layer, None)
+
+
+def antialiasing_enabled() -> bool:
+    """Whether painting is antialiased at the current quality level, see quality.antialiasing_enabled."""
+
+    quality = utilities.get_loaded_module("quality")
+
+    return quality is None or quality.antialiasing_enabled()
+
+
+def get_circle_rect(in_center, in_radius: float, in_margin: int = 2) -> QtCore.QRect:
+    """Get the integer rect covering a circle, padded for antialiasing and sprite rounding."""
+
+    radius = math.ceil(in_radius) + in_margin
+    diameter = radius * 2 + 1
+
+    return QtCore.QRect(int(in_center.x()) - radius, int(in_center.y()) - radius, diameter, diameter)
+
+
+def _quantize_channel_(in_value: int, in_step: int) -> int:
+
+    return min(round(in_value / in_step) * in_step, 255)
+
+
+def _get_pixmap_memory_(in_pixmap: QtGui.QPixmap) -> int:
+
+    return in_pixmap.width() * in_pixmap.height() * max(in_pixmap.depth() // 8, 1)
+
+
+pulse_sprite_cache = SpriteCache()
+
+
+def draw_pulse(
+    in_painter: QtGui.QPainter,
+    in_center,
+    in_radius: float,
+    in_color: QtGui.QColor,
+    in_cache: SpriteCache = None,
+) -> None:
+    """Draw a filled pulse circle by blitting a cached sprite.
+
+    Args:
+        in_painter (QtGui.QPainter): The active painter.
+        in_center (QtCore.QPoint | QtCore.QPointF): The centre of the pulse.
+        in_radius (float): The radius of the pulse.
+        in_color (QtGui.QColor): The colour of the pulse.
+        in_cache (SpriteCache): The cache to use, defaults to pulse_sprite_cache.
+
+    Returns:
+        None
+    """
+
+    if in_radius <= 0 or in_color.alpha() == 0:
+
+        return
+
+    cache = pulse_sprite_cache if in_cache is None else in_cache
+    device_pixel_ratio = in_painter.device().devicePixelRatioF()
+    sprite = cache.get_pulse_sprite(in_radius, in_color, device_pixel_ratio)
+    half_size = sprite.width() / device_pixel_ratio / 2
+    in_painter.drawPixmap(QtCore.QPointF(in_center.x() - half_size, in_center.y() - half_size), sprite)
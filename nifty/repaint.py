@@ -0,0 +1,158 @@
+import contextlib
+import weakref
+
+from Qt import QtCore
+from Qt import QtGui
+
+
+class UpdateBatcher(object):
+    """Coalesces repaint requests so each widget is updated at most once per batch.
+
+    Requests made outside of an explicit batch are flushed together on the
+    next event loop iteration, so any number of property changes within one
+    iteration or animation tick produce a single update() per widget.
+    """
+
+    def __init__(self):
+
+        self._pending_regions = {}
+        self._repaint_counts = weakref.WeakKeyDictionary()
+        self._batch_depth = 0
+        self._flush_scheduled = False
+
+        self.request_count = 0
+        self.repaint_count = 0
+
+    # Public Methods:
+    def request_update(self, in_widget, in_region=None) -> None:
+        """Queue a repaint of in_widget.
+
+        Args:
+            in_widget (QtWidgets.QWidget): The widget to repaint.
+            in_region (QtGui.QRegion | QtCore.QRect): The area to repaint,
+                defaults to the whole widget.
+
+        Returns:
+            None
+        """
+
+        self.request_count += 1
+        if in_widget in self._pending_regions:
+
+            pending_region = self._pending_regions[in_widget]
+            if pending_region is not None:
+
+                self._pending_regions[in_widget] = None if in_region is None else pending_region.united(in_region)
+
+        else:
+
+            self._pending_regions[in_widget] = None if in_region is None else QtGui.QRegion(in_region)
+
+        if not self._batch_depth and not self._flush_scheduled:
+
+            self._flush_scheduled = True
+            QtCore.QTimer.singleShot(0, self.flush)
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Hold every repaint request until the outermost batch exits."""
+
+        self._batch_depth += 1
+        try:
+
+            yield self
+
+        finally:
+
+            self._batch_depth -= 1
+            if not self._batch_depth:
+
+                self.flush()
+
+    def flush(self) -> None:
+
+        self._flush_scheduled = False
+        pending_regions, self._pending_regions = self._pending_regions, {}
+        for widget, region in pending_regions.items():
+
+            try:
+
+                if _is_obscured_(widget):
+
+                    # Nothing of the widget can be seen, so let it suspend its animations.
+                    on_obscured = getattr(type(widget), "_on_obscured_", None)
+                    if on_obscured is not None:
+
+                        on_obscured(widget)
+
+                    continue
+
+                if region is None:
+
+                    widget.update()
+
+                else:
+
+                    widget.update(region)
+
+            except RuntimeError:
+
+                # The underlying C++ widget has been deleted.
+                continue
+
+            self.repaint_count += 1
+            self._repaint_counts[widget] = self._repaint_counts.get(widget, 0) + 1
+
+    def get_repaint_count(self, in_widget) -> int:
+
+        return self._repaint_counts.get(in_widget, 0)
+
+    def statistics(self) -> dict:
+
+        return {"requests": self.request_count, "repaints": self.repaint_count}
+
+    def reset_statistics(self) -> None:
+
+        self.request_count = 0
+        self.repaint_count = 0
+        self._repaint_counts.clear()
+
+
+def _is_obscured_(in_widget) -> bool:
+
+    return not in_widget.isVisible() or in_widget.window().isMinimized() or in_widget.visibleRegion().isEmpty()
+
+
+update_batcher = UpdateBatcher()
+
+
+def request_update(in_widget, in_region=None) -> None:
+
+    update_batcher.request_update(in_widget, in_region)
+
+
+def batch_updates():
+    """Context manager for setting several nifty properties at once with a single repaint per widget.
+
+    Example:
+        with repaint.batch_updates():
+            button.mouse_enter_pulse_radius = 10
+            button.mouse_enter_pulse_color = color
+    """
+
+    return update_batcher.batch()
+
+
+def get_repaint_count(in_widget) -> int:
+
+    return update_batcher.get_repaint_count(in_widget)
+
+
+def statistics() -> dict:
+
+    return update_batcher.statistics()
+
+
+def reset_statistics() -> None:
+
+    update_batcher.reset_statistics()
@@ -0,0 +1,143 @@
+import weakref
+
+from Qt import QtCore
+from Qt import QtGui
+
+from . import repaint
+
+
+_DEFAULT_PARAMETERS = {
+    "accent_color": "#00B0FF",
+    "border_color": "black",
+    "bar_color": QtCore.Qt.gray,
+    "checked_color": "#00B0FF",
+    "handle_color": QtCore.Qt.white,
+    "pulse_unchecked_color": "#44999999",
+}
+
+
+def _create_color_(in_color, in_alpha: int = None) -> QtGui.QColor:
+
+    color = QtGui.QColor(in_color)
+    if in_alpha is not None:
+
+        color.setAlpha(in_alpha)
+
+    return color
+
+
+def _create_lighter_color_(in_color: QtGui.QColor, in_alpha: int = None) -> QtGui.QColor:
+
+    return _create_color_(in_color.lighter(), in_alpha)
+
+
+class Theme(object):
+    """An immutable set of colours, brushes and pens shared by nifty widgets.
+
+    Every widget using a theme references the same objects rather than
+    allocating its own copies, so they must be treated as read-only.
+    Use derive to create a modified copy.
+
+    Args:
+        **kwargs: Overrides for accent_color, border_color, bar_color,
+            checked_color, handle_color and pulse_unchecked_color.
+    """
+
+    __slots__ = ("_parameters", "_values")
+
+    def __init__(self, **kwargs):
+
+        unknown_parameters = set(kwargs) - set(_DEFAULT_PARAMETERS)
+        if unknown_parameters:
+
+            raise TypeError(f"Unknown theme parameter(s): {', '.join(sorted(unknown_parameters))}")
+
+        parameters = dict(_DEFAULT_PARAMETERS, **kwargs)
+
+        # PushButton:
+        accent_color = _create_color_(parameters["accent_color"], 75)
+        accent_light_color = _create_lighter_color_(accent_color, 250)
+        mouse_enter_pulse_start_color = _create_lighter_color_(accent_color, 50)
+
+        # AnimatedToggle:
+        checked_color = _create_color_(parameters["checked_color"])
+        checked_bar_color = _create_lighter_color_(checked_color)
+
+        values = {
+            "mouse_enter_pulse_start_color": mouse_enter_pulse_start_color,
+            "mouse_enter_pulse_end_color": accent_color,
+            "mouse_leave_pulse_start_color": accent_color,
+            "mouse_leave_pulse_end_color": mouse_enter_pulse_start_color,
+            "mouse_press_pulse_start_color": accent_color,
+            "mouse_press_pulse_end_color": accent_light_color,
+            "mouse_release_pulse_start_color": accent_light_color,
+            "mouse_release_pulse_end_color": accent_color,
+            "border_pen": QtGui.QPen(_create_color_(parameters["border_color"])),
+            "checked_color": checked_color,
+            "handle_color": _create_color_(parameters["handle_color"]),
+            "bar_brush": QtGui.QBrush(_create_color_(parameters["bar_color"])),
+            "bar_checked_brush": QtGui.QBrush(checked_bar_color),
+            "pulse_unchecked_color": _create_color_(parameters["pulse_unchecked_color"]),
+            "pulse_checked_color": _create_color_(checked_bar_color, 75),
+            "transparent_pen": QtGui.QPen(QtCore.Qt.transparent),
+            "light_grey_pen": QtGui.QPen(QtCore.Qt.lightGray),
+        }
+
+        object.__setattr__(self, "_parameters", parameters)
+        object.__setattr__(self, "_values", values)
+
+    def __getattr__(self, in_attribute_name: str):
+
+        try:
+
+            return self._values[in_attribute_name]
+
+        except KeyError:
+
+            raise AttributeError(f"'Theme' object has no attribute '{in_attribute_name}'") from None
+
+    def __setattr__(self, in_attribute_name: str, in_value):
+
+        raise AttributeError("Theme objects are immutable, use Theme.derive to create a modified copy.")
+
+    def derive(self, **kwargs) -> "Theme":
+        """Create a new theme with some parameters changed."""
+
+        return Theme(**dict(self._parameters, **kwargs))
+
+
+class ThemeHandle(object):
+    """A shared reference to a theme, held by every widget styled with it.
+
+    Widgets read colours through handle.theme, so set_theme restyles all of
+    them at once by swapping a single reference, without rebuilding any of
+    their animations. Colours a widget holds between frames, such as a
+    hovered pulse at rest, are refreshed by its _apply_theme_ hook, which
+    also retargets animations that are running.
+    """
+
+    def __init__(self, in_theme: Theme = None):
+
+        self.theme = Theme() if in_theme is None else in_theme
+        self._widgets = weakref.WeakSet()
+
+    def register(self, in_widget) -> None:
+
+        self._widgets.add(in_widget)
+
+    def set_theme(self, in_theme: Theme) -> None:
+
+        self.theme = in_theme
+        with repaint.batch_updates():
+
+            for widget in tuple(self._widgets):
+
+                apply_theme = getattr(widget, "_apply_theme_", None)
+                if apply_theme is not None:
+
+                    apply_theme()
+
+                repaint.request_update(widget)
+
+
+default_theme = ThemeHandle()
@@ -1,3 +1,5 @@
+import os
+import sys
 import time
 
 
@@ -12,3 +14,54 @@ def time_execution(in_function, *args, in_loop_count=1, **kwargs):
 	print(f"{in_loop_count} execution(s) of '{in_function.__name__}' took: {time_taken} seconds")
 
 	return result
+
+
+def time_per_call(in_function, *args, in_loop_count=10000, **kwargs):
+	"""Return the average time, in seconds, of a single call to in_function."""
+
+	start_time = time.perf_counter()
+	for _ in range(in_loop_count):
+		in_function(*args, **kwargs)
+
+	return (time.perf_counter() - start_time) / in_loop_count
+
+
+def get_resident_memory():
+	"""Return the resident memory of the current process in bytes, or None if it cannot be read."""
+
+	try:
+		import psutil
+	except ImportError:
+		psutil = None
+
+	if psutil is not None:
+		return psutil.Process().memory_info().rss
+
+	try:
+		with open("/proc/self/statm") as statm:
+			return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+	except (OSError, ValueError, AttributeError):
+		return None
+
+
+def get_cache_directory(in_cache_directory: str = None) -> str:
+	"""Get the nifty cache directory: in_cache_directory, $NIFTY_CACHE_DIR or ~/.cache/nifty."""
+
+	return (
+		in_cache_directory
+		or os.environ.get("NIFTY_CACHE_DIR")
+		or os.path.join(os.path.expanduser("~"), ".cache", "nifty")
+	)
+
+
+def get_loaded_module(in_module_name: str):
+	"""Get the nifty submodule in_module_name if it has already been imported, otherwise None.
+
+	Optional subsystems, such as the adaptive quality controller or the pulse
+	atlas cache, can only be enabled by importing their module. Hot paths ask
+	for them through this, so they are never imported just to find out they
+	are disabled.
+	"""
+
+	return sys.modules.get(f"{__package__}.{in_module_name}")
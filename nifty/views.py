@@ -0,0 +1,576 @@
+from Qt import QtCore
+from Qt import QtGui
+from Qt import QtWidgets
+
+from . import animations
+from . import rendering
+from . import repaint
+from . import themes
+
+
+# Durations in milliseconds, matching PushButton.
+_PULSE_DURATION = 250
+_PRESS_PULSE_DURATION = _PULSE_DURATION * 0.75
+_BORDER_DURATION = 200
+
+# Values of PulseButtonView._border_states.
+_BORDER_HIDDEN = 0
+_BORDER_ANIMATING = 1
+_BORDER_SHOWN = 2
+
+
+def _lerp_color_(in_start: QtGui.QColor, in_end: QtGui.QColor, in_value: float) -> QtGui.QColor:
+
+    return QtGui.QColor.fromRgbF(
+        *(animations.lerp(start, end, in_value) for start, end in zip(in_start.getRgbF(), in_end.getRgbF()))
+    )
+
+
+class _Pulse_(object):
+    """The animation state of one pulse of one item."""
+
+    __slots__ = ("location", "start_time", "duration", "radius_range", "color_range", "radius", "color", "running")
+
+    def __init__(self):
+
+        self.location = QtCore.QPoint(0, 0)
+        self.start_time = 0
+        self.duration = 0.0
+        self.radius_range = (0.0, 0.0)
+        self.color_range = None
+        self.radius = 0.0
+        self.color = QtGui.QColor(QtCore.Qt.transparent)
+        self.running = False
+
+    def start(self, in_time: int, in_duration: float, in_radius_range: tuple, in_color_range: tuple) -> None:
+
+        self.start_time = in_time
+        self.duration = 0.0 if animations.should_snap() else animations.scale_duration(in_duration)
+        self.radius_range = in_radius_range
+        self.color_range = in_color_range
+        self.running = True
+        self.advance(in_time)
+
+    def advance(self, in_time: int) -> None:
+
+        progress = 1.0 if self.duration <= 0 else min((in_time - self.start_time) / self.duration, 1.0)
+        eased_progress = animations.get_easing_table()(progress)
+        self.radius = animations.lerp(self.radius_range[0], self.radius_range[1], eased_progress)
+        self.color = _lerp_color_(self.color_range[0], self.color_range[1], eased_progress)
+        self.running = progress < 1.0
+
+
+class _ItemState_(object):
+    """The animation state of one item, only held while the item has something to draw or animate."""
+
+    __slots__ = (
+        "enter", "press", "release", "leave_location", "border_start_time", "border_show_time",
+        "pressed", "leave_queued", "release_queued",
+    )
+
+    def __init__(self):
+
+        self.enter = _Pulse_()
+        self.press = _Pulse_()
+        self.release = _Pulse_()
+        self.leave_location = QtCore.QPoint(0, 0)
+        self.border_start_time = None
+        self.border_show_time = 0.0
+        self.pressed = False
+        self.leave_queued = False
+        self.release_queued = False
+
+    def is_animating(self) -> bool:
+
+        return (
+            self.enter.running or self.press.running or self.release.running or self.border_start_time is not None
+        )
+
+    def is_idle(self) -> bool:
+
+        return not (self.is_animating() or self.pressed or self.enter.radius > 0)
+
+
+class PulseButtonDelegate(QtWidgets.QStyledItemDelegate):
+    """Paints the items of a PulseButtonView with the PushButton pulses and border."""
+
+    def paint(self, painter, option, index):
+
+        view = self.parent()
+        row = index.row()
+        state = view._get_item_state_(row)
+        border_show_time = view._get_border_show_time_(row)
+        item_rect = option.rect
+        origin = item_rect.topLeft()
+
+        painter.save()
+        painter.setClipRect(item_rect, QtCore.Qt.IntersectClip)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, rendering.antialiasing_enabled())
+
+        if state is not None:
+
+            for pulse, visible in (
+                (state.enter, True),
+                (state.press, state.press.running or state.pressed),
+                (state.release, state.release.running),
+            ):
+
+                if visible:
+
+                    rendering.draw_pulse(painter, origin + pulse.location, pulse.radius, pulse.color)
+
+        if border_show_time > 0.0:
+
+            border_left = animations.lerp(item_rect.center().x(), item_rect.left(), border_show_time)
+            border_width = animations.lerp(0.0, item_rect.width(), border_show_time)
+            painter.setBrush(QtCore.Qt.transparent)
+            painter.setPen(view._theme.theme.border_pen)
+            painter.drawRect(QtCore.QRectF(border_left, item_rect.top(), border_width, item_rect.height()))
+
+        text = index.data(QtCore.Qt.DisplayRole)
+        if text:
+
+            painter.setPen(option.palette.color(QtGui.QPalette.ButtonText))
+            painter.drawText(item_rect, QtCore.Qt.AlignCenter, str(text))
+
+        painter.restore()
+
+    def sizeHint(self, option, index):
+
+        return self.parent().item_size()
+
+
+class PulseButtonView(QtWidgets.QListView):
+    """Draws every row of a model as a nifty PushButton, using a single widget.
+
+    The pulses and border reveal of PushButton are painted by a delegate
+    and animated from one timer. Animation state is only held for the
+    items that are animating, pressed or hovered, plus one byte per item
+    recording whether its border has been revealed, so tens of thousands
+    of buttons cost little more than one widget.
+
+    Args:
+        in_model (QtCore.QAbstractItemModel): The buttons to display, one per row.
+        in_item_size (QtCore.QSize): The size of each button.
+        in_theme (themes.ThemeHandle): The theme to draw with, defaults to themes.default_theme.
+        in_parent (QtWidgets.QWidget): The parent widget.
+    """
+
+    mouse_enter = QtCore.Signal(int)
+    mouse_press = QtCore.Signal(int)
+    mouse_release = QtCore.Signal(int)
+    mouse_leave = QtCore.Signal(int)
+
+    def __init__(
+        self,
+        in_model: QtCore.QAbstractItemModel = None,
+        in_item_size: QtCore.QSize = None,
+        in_theme: themes.ThemeHandle = None,
+        in_parent: QtWidgets.QWidget = None,
+    ):
+
+        super().__init__(in_parent)
+
+        self._item_size = QtCore.QSize(100, 30) if in_item_size is None else in_item_size
+        self._theme = themes.default_theme if in_theme is None else in_theme
+        self._theme.register(self.viewport())
+
+        # Row -> _ItemState_, for the rows that have something to draw or animate.
+        self._item_states = {}
+        self._border_states = bytearray()
+        self._hovered_row = -1
+        self._pressed_row = -1
+
+        self._clock = QtCore.QElapsedTimer()
+        self._clock.start()
+        self._timer = QtCore.QTimer(self)
+        self._timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self._timer.setInterval(16)
+        self._timer.timeout.connect(self._on_tick_)
+
+        self.setViewMode(QtWidgets.QListView.IconMode)
+        self.setMovement(QtWidgets.QListView.Static)
+        self.setResizeMode(QtWidgets.QListView.Adjust)
+        self.setUniformItemSizes(True)
+        self.setGridSize(self._item_size)
+        self.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        self.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.setMouseTracking(True)
+        self.setItemDelegate(PulseButtonDelegate(self))
+
+        if in_model is not None:
+
+            self.setModel(in_model)
+
+    # Slots:
+    @QtCore.Slot()
+    def _on_model_reset_(self) -> None:
+
+        self._item_states.clear()
+        self._border_states = bytearray(0 if self.model() is None else self.model().rowCount())
+        self._hovered_row = -1
+        self._pressed_row = -1
+
+    @QtCore.Slot(QtCore.QModelIndex, int, int)
+    def _on_rows_inserted_(self, in_parent: QtCore.QModelIndex, in_first: int, in_last: int) -> None:
+        """Shift the state of the rows after the insertion, the new rows reveal their border once visible."""
+
+        count = in_last - in_first + 1
+        self._item_states = {
+            row + count if row >= in_first else row: state for row, state in self._item_states.items()
+        }
+        self._border_states[in_first:in_first] = bytes(count)
+        self._hovered_row = self._get_shifted_row_(self._hovered_row, in_first, count)
+        self._pressed_row = self._get_shifted_row_(self._pressed_row, in_first, count)
+
+    @QtCore.Slot(QtCore.QModelIndex, int, int)
+    def _on_rows_removed_(self, in_parent: QtCore.QModelIndex, in_first: int, in_last: int) -> None:
+        """Drop the state of the removed rows and shift the state of the rows after them."""
+
+        count = in_last - in_first + 1
+        self._item_states = {
+            row - count if row > in_last else row: state
+            for row, state in self._item_states.items() if not in_first <= row <= in_last
+        }
+        del self._border_states[in_first:in_last + 1]
+        self._hovered_row = self._get_shifted_row_(self._hovered_row, in_first, -count)
+        self._pressed_row = self._get_shifted_row_(self._pressed_row, in_first, -count)
+
+    @QtCore.Slot()
+    def _on_tick_(self) -> None:
+
+        now = self._clock.elapsed()
+        with repaint.batch_updates():
+
+            for row, state in tuple(self._item_states.items()):
+
+                self._advance_item_(row, state, now)
+
+        if not any(state.is_animating() for state in self._item_states.values()):
+
+            self._timer.stop()
+
+    # Public Methods:
+    def item_size(self) -> QtCore.QSize:
+
+        return self._item_size
+
+    def animating_item_count(self) -> int:
+
+        return sum(state.is_animating() for state in self._item_states.values())
+
+    # Private Methods:
+    def _get_item_state_(self, in_row: int, in_create: bool = False) -> _ItemState_:
+
+        state = self._item_states.get(in_row)
+        if state is None and in_create:
+
+            state = self._item_states[in_row] = _ItemState_()
+
+        return state
+
+    def _get_border_show_time_(self, in_row: int) -> float:
+        """Read only, as it is called while painting, reveals are started by _reveal_visible_rows_."""
+
+        border_state = self._border_states[in_row] if in_row < len(self._border_states) else _BORDER_SHOWN
+        if border_state == _BORDER_SHOWN:
+
+            return 1.0
+
+        state = self._item_states.get(in_row)
+
+        return 0.0 if state is None else state.border_show_time
+
+    @staticmethod
+    def _get_shifted_row_(in_row: int, in_first: int, in_count: int) -> int:
+        """Get where in_row moves to once in_count rows are inserted at in_first, removed for a negative count."""
+
+        if in_row < in_first:
+
+            return in_row
+
+        if in_count < 0 and in_row < in_first - in_count:
+
+            return -1
+
+        return in_row + in_count
+
+    def _get_visible_rows_(self) -> range:
+        """Get the rows laid out in the viewport, from the first item of its first and last lines."""
+
+        row_count = 0 if self.model() is None else self.model().rowCount()
+        viewport_rect = self.viewport().rect()
+        first_index = self.indexAt(QtCore.QPoint(0, viewport_rect.top()))
+        if not row_count or not first_index.isValid():
+
+            return range(0)
+
+        last_index = self.indexAt(QtCore.QPoint(0, viewport_rect.bottom()))
+        if not last_index.isValid():
+
+            # The items end above the bottom of the viewport.
+            return range(first_index.row(), row_count)
+
+        last_row = last_index.row()
+        line_top = self.visualRect(last_index).top()
+        while last_row + 1 < row_count and self._get_item_rect_(last_row + 1).top() == line_top:
+
+            last_row += 1
+
+        return range(first_index.row(), last_row + 1)
+
+    def _reveal_visible_rows_(self) -> None:
+        """Start the border reveal of every visible row that has not been revealed yet."""
+
+        if not self.isVisible():
+
+            return
+
+        now = self._clock.elapsed()
+        for row in self._get_visible_rows_():
+
+            if self._border_states[row] == _BORDER_HIDDEN:
+
+                self._border_states[row] = _BORDER_ANIMATING
+                self._get_item_state_(row, in_create=True).border_start_time = now
+                self._ensure_ticking_()
+
+    def _get_item_rect_(self, in_row: int) -> QtCore.QRect:
+
+        return self.visualRect(self.model().index(in_row, 0))
+
+    def _get_diameter_(self) -> float:
+
+        return max(self._item_size.width(), self._item_size.height()) * 1.5
+
+    def _get_row_at_(self, in_position: QtCore.QPoint) -> int:
+
+        index = self.indexAt(in_position)
+
+        return index.row() if index.isValid() else -1
+
+    def _get_model_connections_(self, in_model: QtCore.QAbstractItemModel) -> tuple:
+
+        return (
+            (in_model.modelReset, self._on_model_reset_),
+            (in_model.layoutChanged, self._on_model_reset_),
+            (in_model.rowsInserted, self._on_rows_inserted_),
+            (in_model.rowsRemoved, self._on_rows_removed_),
+        )
+
+    def _ensure_ticking_(self) -> None:
+
+        if not self._timer.isActive():
+
+            self._timer.start()
+
+    def _advance_item_(self, in_row: int, in_state: _ItemState_, in_time: int) -> None:
+
+        for pulse in (in_state.enter, in_state.press, in_state.release):
+
+            if pulse.running:
+
+                pulse.advance(in_time)
+
+        if in_state.leave_queued and not in_state.enter.running:
+
+            in_state.leave_queued = False
+            self._play_leave_pulse_(in_state, in_time)
+
+        if in_state.release_queued and not in_state.press.running:
+
+            in_state.release_queued = False
+            self._play_release_pulse_(in_state, in_time)
+
+        if in_state.border_start_time is not None:
+
+            progress = min((in_time - in_state.border_start_time) / animations.scale_duration(_BORDER_DURATION), 1.0)
+            in_state.border_show_time = animations.get_easing_table()(progress)
+            if progress >= 1.0 or animations.should_snap():
+
+                in_state.border_start_time = None
+                self._border_states[in_row] = _BORDER_SHOWN
+
+        repaint.request_update(self.viewport(), self._get_item_rect_(in_row))
+        if in_state.is_idle():
+
+            del self._item_states[in_row]
+
+    def _play_enter_pulse_(self, in_state: _ItemState_, in_time: int) -> None:
+
+        theme = self._theme.theme
+        in_state.enter.start(
+            in_time,
+            _PULSE_DURATION,
+            (0.0, self._get_diameter_()),
+            (theme.mouse_enter_pulse_start_color, theme.mouse_enter_pulse_end_color),
+        )
+
+    def _play_leave_pulse_(self, in_state: _ItemState_, in_time: int) -> None:
+
+        theme = self._theme.theme
+        in_state.enter.location = in_state.leave_location
+        in_state.enter.start(
+            in_time,
+            _PULSE_DURATION,
+            (self._get_diameter_(), 0.0),
+            (theme.mouse_enter_pulse_end_color, theme.mouse_enter_pulse_start_color),
+        )
+
+    def _play_press_pulse_(self, in_state: _ItemState_, in_time: int) -> None:
+
+        theme = self._theme.theme
+        in_state.press.start(
+            in_time,
+            _PRESS_PULSE_DURATION,
+            (0.0, self._get_diameter_()),
+            (theme.mouse_press_pulse_start_color, theme.mouse_press_pulse_end_color),
+        )
+
+    def _play_release_pulse_(self, in_state: _ItemState_, in_time: int) -> None:
+
+        theme = self._theme.theme
+        in_state.release.start(
+            in_time,
+            _PRESS_PULSE_DURATION,
+            (self._get_diameter_(), 0.0),
+            (theme.mouse_release_pulse_start_color, theme.mouse_release_pulse_end_color),
+        )
+
+    def _enter_item_(self, in_row: int, in_position: QtCore.QPoint) -> None:
+
+        state = self._get_item_state_(in_row, in_create=True)
+        state.leave_queued = False
+        state.enter.location = in_position - self._get_item_rect_(in_row).topLeft()
+        self._play_enter_pulse_(state, self._clock.elapsed())
+        self._ensure_ticking_()
+        self.mouse_enter.emit(in_row)
+
+    def _leave_item_(self, in_row: int, in_position: QtCore.QPoint) -> None:
+
+        self.mouse_leave.emit(in_row)
+        state = self._get_item_state_(in_row)
+        if state is None:
+
+            return
+
+        state.leave_location = in_position - self._get_item_rect_(in_row).topLeft()
+        if state.enter.running:
+
+            state.leave_queued = True
+
+        else:
+
+            self._play_leave_pulse_(state, self._clock.elapsed())
+            self._ensure_ticking_()
+
+    def _set_hovered_row_(self, in_row: int, in_position: QtCore.QPoint) -> None:
+
+        if in_row == self._hovered_row:
+
+            return
+
+        if self._hovered_row >= 0:
+
+            self._leave_item_(self._hovered_row, in_position)
+
+        self._hovered_row = in_row
+        if in_row >= 0:
+
+            self._enter_item_(in_row, in_position)
+
+    # Qt Methods:
+    def setModel(self, model):
+
+        previous_model = self.model()
+        if previous_model is not None:
+
+            for signal, slot in self._get_model_connections_(previous_model):
+
+                signal.disconnect(slot)
+
+        super().setModel(model)
+        if model is not None:
+
+            for signal, slot in self._get_model_connections_(model):
+
+                signal.connect(slot)
+
+        self._on_model_reset_()
+
+    def mouseMoveEvent(self, event):
+
+        self._set_hovered_row_(self._get_row_at_(event.pos()), event.pos())
+
+        return super().mouseMoveEvent(event)
+
+    def mousePressEvent(self, event):
+
+        row = self._get_row_at_(event.pos())
+        if row >= 0:
+
+            self._pressed_row = row
+            state = self._get_item_state_(row, in_create=True)
+            state.pressed = True
+            state.release_queued = False
+            state.press.location = event.pos() - self._get_item_rect_(row).topLeft()
+            self.mouse_press.emit(row)
+            self._play_press_pulse_(state, self._clock.elapsed())
+            self._ensure_ticking_()
+
+        return super().mousePressEvent(event)
+
+    def mouseReleaseEvent(self, event):
+
+        row, self._pressed_row = self._pressed_row, -1
+        if row >= 0:
+
+            state = self._get_item_state_(row, in_create=True)
+            state.pressed = False
+            state.release.location = event.pos() - self._get_item_rect_(row).topLeft()
+            self.mouse_release.emit(row)
+            if state.press.running:
+
+                state.release_queued = True
+
+            else:
+
+                self._play_release_pulse_(state, self._clock.elapsed())
+
+            self._ensure_ticking_()
+
+        return super().mouseReleaseEvent(event)
+
+    def viewportEvent(self, event):
+
+        if event.type() == QtCore.QEvent.Leave:
+
+            self._set_hovered_row_(-1, self.viewport().mapFromGlobal(QtGui.QCursor.pos()))
+
+        return super().viewportEvent(event)
+
+    def hideEvent(self, event):
+
+        # Hidden items do not need frames, they catch up when shown again.
+        self._timer.stop()
+
+        return super().hideEvent(event)
+
+    def showEvent(self, event):
+
+        if any(state.is_animating() for state in self._item_states.values()):
+
+            self._ensure_ticking_()
+
+        return super().showEvent(event)
+
+    def updateGeometries(self):
+
+        # Runs after every layout pass, so rows are revealed once they are laid out in view.
+        super().updateGeometries()
+        self._reveal_visible_rows_()
+
+    def scrollContentsBy(self, dx, dy):
+
+        super().scrollContentsBy(dx, dy)
+        self._reveal_visible_rows_()
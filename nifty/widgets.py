@@ -1,11 +1,20 @@
+import contextlib
 import enum
+import functools
 import re
+import sys
+import time
+import weakref
 
 from Qt import QtCore
 from Qt import QtGui
 from Qt import QtWidgets
 
 from . import animations
+from . import rendering
+from . import repaint
+from . import themes
+from . import utilities
 
 
 class LayoutDirection(enum.Enum):
@@ -15,16 +24,483 @@ class LayoutDirection(enum.Enum):
     diagonal = 2
 
 
+class ShowMode(enum.Enum):
+    """How _AnimatedMixin_.show reveals a widget.
+
+    resize animates the real size of the widget, re-running its layout every
+    frame. clip and scale render the laid out widget to a snapshot once and
+    animate a clip or scale of the snapshot instead, then swap the live widget
+    back in.
+    """
+
+    resize = 0
+    clip = 1
+    scale = 2
+
+
+class SuspendPolicy(enum.Enum):
+
+    pause = 0
+    fast_forward = 1
+
+
+# Animations paused by suspend_animations, keyed by the widget they target.
+_suspended_animations = weakref.WeakKeyDictionary()
+_exposure_watcher = None
+
+
+class _ExposureWatcher_(QtCore.QObject):
+    """Resumes the suspended animations of a widget once it is shown or painted again.
+
+    It is only installed on widgets with suspended animations, so visible
+    widgets never pay for the event filter.
+    """
+
+    def eventFilter(self, in_object, in_event):
+
+        if in_event.type() in (QtCore.QEvent.Show, QtCore.QEvent.Paint):
+
+            resume_animations(in_object)
+
+        return False
+
+
+def _get_exposure_watcher_() -> _ExposureWatcher_:
+
+    global _exposure_watcher
+    if _exposure_watcher is None:
+
+        _exposure_watcher = _ExposureWatcher_()
+
+    return _exposure_watcher
+
+
+def suspend_animations(in_widget: QtWidgets.QWidget, in_policy: SuspendPolicy = SuspendPolicy.pause) -> None:
+    """Suspend every running nifty animation targeting a widget with no visible region.
+
+    Args:
+        in_widget (QtWidgets.QWidget): The hidden, obscured or minimized widget.
+        in_policy (SuspendPolicy): Whether to pause the animations until the
+            widget is exposed again, or fast forward them to their end values.
+
+    Returns:
+        None
+    """
+
+    for animation in animations.active_animations(in_widget):
+
+        if not animation.is_running():
+
+            continue
+
+        if in_policy == SuspendPolicy.fast_forward:
+
+            animations.fast_forward(animation)
+
+        else:
+
+            animation.pause()
+            _suspended_animations.setdefault(in_widget, []).append(animation)
+
+    if in_widget in _suspended_animations:
+
+        in_widget.installEventFilter(_get_exposure_watcher_())
+
+
+def resume_animations(in_widget: QtWidgets.QWidget) -> None:
+    """Resume the animations suspend_animations paused on a widget."""
+
+    in_widget.removeEventFilter(_get_exposure_watcher_())
+    for animation in _suspended_animations.pop(in_widget, ()):
+
+        if animation.state() == QtCore.QAbstractAnimation.Paused:
+
+            animation.resume()
+
+
+@contextlib.contextmanager
+def batch_build(in_widget: QtWidgets.QWidget):
+    """Suspend updates, layout and signals of a widget while many children are added to it.
+
+    The layout runs a single pass when the block exits.
+
+    Args:
+        in_widget (QtWidgets.QWidget): The widget being built.
+    """
+
+    layout = in_widget.layout()
+    layout_enabled = layout is not None and layout.isEnabled()
+    updates_enabled = in_widget.updatesEnabled()
+    signals_blocked = in_widget.blockSignals(True)
+    in_widget.setUpdatesEnabled(False)
+    if layout_enabled:
+
+        layout.setEnabled(False)
+
+    try:
+
+        yield in_widget
+
+    finally:
+
+        if layout_enabled:
+
+            layout.setEnabled(True)
+            layout.invalidate()
+
+        in_widget.setUpdatesEnabled(updates_enabled)
+        in_widget.blockSignals(signals_blocked)
+
+
+@functools.lru_cache(maxsize=None)
+def convert_attribute_name(in_attribute_name: str) -> str:
+    """Convert a snake case attribute name to camel case, or vice versa.
+
+    Args:
+        in_attribute_name (str): The name of the attribute.
+
+    Returns:
+        str: set_maximum_height becomes setMaximumHeight and
+            setShowAnimationDirection becomes set_show_animation_direction.
+    """
+
+    if "_" in in_attribute_name:
+
+        split = in_attribute_name.split("_")
+        pascal_case_attribute_name = "".join((word.title() for word in split[1:]))
+
+        return f"{split[0]}{pascal_case_attribute_name}"
+
+    split = re.sub(r"([A-Z])", r" \1", in_attribute_name).split()
+
+    return "_".join(split).lower()
+
+
+def _get_pulse_atlas_cache_():
+    """Get the enabled pulse atlas cache, None while atlases have never been enabled.
+
+    atlases is only imported by enable_pulse_atlases, so buttons never load
+    its thread pool and disk cache just to find atlases are disabled.
+    """
+
+    atlases = utilities.get_loaded_module("atlases")
+
+    return None if atlases is None else atlases.get_pulse_atlas_cache()
+
+
+class _SnapshotOverlay_(QtWidgets.QWidget):
+    """Covers a widget with a snapshot of itself, revealed by clipping or scaling it.
+
+    The overlay follows its parent as it is resized, so it keeps covering the
+    whole widget until the reveal finishes.
+    """
+
+    def __init__(self, in_parent: QtWidgets.QWidget):
+
+        super().__init__(in_parent)
+
+        self._pixmap = None
+        self._progress = 0.0
+        self._show_mode = ShowMode.clip
+        self._layout_direction = LayoutDirection.horizontal
+
+        # Opaque, so the live widgets underneath are not painted while it is shown.
+        self.setAutoFillBackground(True)
+        self.reveal_animation = animations.PropertyAnimation(self, "progress", (0.0, 1.0))
+        self.reveal_animation.set_priority(animations.AnimationPriority.show)
+        self.hide()
+        in_parent.installEventFilter(self)
+
+    # Qt Properties:
+    @QtCore.Property(float)
+    def progress(self):
+
+        return self._progress
+
+    @progress.setter
+    def progress(self, value):
+
+        self._progress = value
+        repaint.request_update(self)
+
+    # Public Methods:
+    def cover(self, in_pixmap: QtGui.QPixmap, in_show_mode: ShowMode, in_layout_direction: LayoutDirection) -> None:
+
+        self._pixmap = in_pixmap
+        self._show_mode = in_show_mode
+        self._layout_direction = in_layout_direction
+        self._progress = 0.0
+        self.setGeometry(self.parentWidget().rect())
+        self.raise_()
+        self.show()
+
+    def uncover(self) -> None:
+
+        self.hide()
+        self._pixmap = None
+
+    # Private Methods:
+    def _get_reveal_scale_(self) -> tuple:
+
+        if self._layout_direction == LayoutDirection.horizontal:
+
+            return self._progress, 1.0
+
+        elif self._layout_direction == LayoutDirection.vertical:
+
+            return 1.0, self._progress
+
+        return self._progress, self._progress
+
+    # Qt Methods:
+    def paintEvent(self, event):
+
+        horizontal_scale, vertical_scale = self._get_reveal_scale_()
+        if self._pixmap is None or horizontal_scale <= 0.0 or vertical_scale <= 0.0:
+
+            return
+
+        painter = QtGui.QPainter(self)
+        if self._show_mode == ShowMode.scale:
+
+            painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform, rendering.antialiasing_enabled())
+            painter.scale(horizontal_scale, vertical_scale)
+
+        else:
+
+            painter.setClipRect(
+                QtCore.QRectF(0, 0, self.width() * horizontal_scale, self.height() * vertical_scale)
+            )
+
+        painter.drawPixmap(0, 0, self._pixmap)
+        painter.end()
+
+    def eventFilter(self, in_object, in_event):
+
+        if in_event.type() == QtCore.QEvent.Resize and in_object is self.parentWidget():
+
+            self.setGeometry(in_object.rect())
+
+        return False
+
+
+class ShowOperation(QtCore.QObject):
+    """A show in progress, returned by _AnimatedMixin_.show.
+
+    The show animation starts from the first paint of the widget, which only
+    happens once it has been laid out and exposed, rather than after a fixed
+    delay. The operation can be chained with then, cancelled, waited on with
+    wait or awaited from a coroutine running on a Qt aware asyncio loop.
+    Cancelling jumps the widget straight to its shown state.
+
+    Args:
+        in_widget: The nifty widget being shown, its shown signal ends the operation.
+        in_ready_widget: The widget whose first paint starts the animation, None for
+            an operation that has already finished.
+        in_start: Starts the show animation and returns it.
+    """
+
+    finished = QtCore.Signal()
+    cancelled = QtCore.Signal()
+
+    _WAITING = 0
+    _ANIMATING = 1
+    _FINISHED = 2
+    _CANCELLED = 3
+
+    def __init__(self, in_widget: QtWidgets.QWidget, in_ready_widget: QtWidgets.QWidget = None, in_start=None):
+
+        # Not parented to the widget, so replaced operations are freed with their last reference.
+        super().__init__()
+
+        self._widget = in_widget
+        self._ready_widget = in_ready_widget
+        self._start = in_start
+        self._animation = None
+        self._callbacks = []
+        self._state = self._WAITING if in_ready_widget is not None else self._FINISHED
+        if self._state == self._WAITING:
+
+            in_widget.shown.connect(self._on_shown_)
+
+    # Slots:
+    @QtCore.Slot()
+    def _on_ready_(self) -> None:
+
+        if self._state != self._WAITING:
+
+            return
+
+        self._state = self._ANIMATING
+        self._animation = self._start()
+
+    @QtCore.Slot()
+    def _on_shown_(self) -> None:
+
+        if self._state != self._ANIMATING:
+
+            return
+
+        self._end_(self._FINISHED)
+        self.finished.emit()
+        self._run_callbacks_()
+
+    # Public Methods:
+    def start(self, in_delay: int = None) -> None:
+        """Start the animation on the first paint of the ready widget, or after in_delay milliseconds."""
+
+        if in_delay is None:
+
+            self._ready_widget.installEventFilter(self)
+
+        else:
+
+            QtCore.QTimer.singleShot(in_delay, self._on_ready_)
+
+    def cancel(self) -> None:
+        """Stop waiting, or stop animating, and jump the widget to its shown state."""
+
+        if not self.is_pending():
+
+            return
+
+        state = self._state
+        self._end_(self._CANCELLED)
+        if state == self._WAITING:
+
+            self._animation = self._start()
+
+        animations.fast_forward(self._animation)
+        self.cancelled.emit()
+        self._run_callbacks_()
+
+    def then(self, in_callback) -> "ShowOperation":
+        """Call in_callback once the widget is fully shown, by finishing or being cancelled.
+
+        Args:
+            in_callback (callable): Called with no arguments, straight away if the operation has already ended.
+
+        Returns:
+            ShowOperation: This operation, so calls can be chained.
+        """
+
+        if self.is_pending():
+
+            self._callbacks.append(in_callback)
+
+        else:
+
+            in_callback()
+
+        return self
+
+    def wait(self, in_timeout: int = -1) -> bool:
+        """Run a local event loop until the operation ends or in_timeout milliseconds pass.
+
+        Returns:
+            bool: Whether the operation finished.
+        """
+
+        if self.is_pending():
+
+            event_loop = QtCore.QEventLoop()
+            self.then(event_loop.quit)
+            if in_timeout >= 0:
+
+                QtCore.QTimer.singleShot(in_timeout, event_loop.quit)
+
+            event_loop.exec_()
+
+        return self.is_finished()
+
+    def is_pending(self) -> bool:
+
+        return self._state in (self._WAITING, self._ANIMATING)
+
+    def is_finished(self) -> bool:
+
+        return self._state == self._FINISHED
+
+    def is_cancelled(self) -> bool:
+
+        return self._state == self._CANCELLED
+
+    # Private Methods:
+    def _end_(self, in_state: int) -> None:
+
+        if self._state == self._WAITING:
+
+            self._ready_widget.removeEventFilter(self)
+
+        self._state = in_state
+        self._widget.shown.disconnect(self._on_shown_)
+
+    def _run_callbacks_(self) -> None:
+
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+
+            callback()
+
+    # Qt Methods:
+    def eventFilter(self, in_object, in_event):
+
+        if in_event.type() == QtCore.QEvent.Paint:
+
+            self._ready_widget.removeEventFilter(self)
+            # Started once this paint has been flushed, never from inside it.
+            QtCore.QTimer.singleShot(0, self._on_ready_)
+
+        return False
+
+    # Magic Methods:
+    def __await__(self):
+
+        # Imported here, so only code that awaits a show pays for importing asyncio.
+        import asyncio
+
+        future = asyncio.get_running_loop().create_future()
+
+        def _resolve_():
+
+            if future.done():
+
+                return
+
+            if self.is_finished():
+
+                future.set_result(self._widget)
+
+            else:
+
+                future.cancel()
+
+        self.then(_resolve_)
+
+        return future.__await__()
+
+
 class _AnimatedMixin_(object):
     """"""
 
     shown = QtCore.Signal()
 
+    # How running animations are suspended while the widget has no visible region.
+    suspend_policy = SuspendPolicy.pause
+
+    # Whether size animations lay the children out once, at the final size,
+    # and clip them while the widget grows instead of relaying them out every frame.
+    freeze_layout = False
+
+    # Milliseconds the show animation, or the snapshot reveal standing in for it, lasts.
+    _SHOW_DURATION = 150
+
     def __init__(
         self,
         in_width: int,
         in_height: int,
         in_layout_direction: LayoutDirection = LayoutDirection.horizontal,
+        in_show_mode: ShowMode = ShowMode.resize,
     ):
 
         object.__init__(self)
@@ -32,6 +508,10 @@ class _AnimatedMixin_(object):
         self._width = in_width
         self._height = in_height
         self._layout_direction = in_layout_direction
+        self._show_mode = in_show_mode
+        self._snapshot_overlay = None
+        self._layout_frozen = False
+        self._show_operation = None
 
         self.set_layout_direction(self._layout_direction)
 
@@ -39,6 +519,13 @@ class _AnimatedMixin_(object):
     @QtCore.Slot()
     def _on_shown_(self) -> None:
 
+        self._thaw_layout_()
+        self.shown.emit()
+
+    @QtCore.Slot()
+    def _on_snapshot_revealed_(self) -> None:
+
+        self._snapshot_overlay.uncover()
         self.shown.emit()
 
     # Public Methods:
@@ -54,27 +541,65 @@ class _AnimatedMixin_(object):
         """
 
         self._layout_direction = in_layout_direction
-        if in_layout_direction == LayoutDirection.horizontal:
+        # Built on first use, see _get_show_animation_.
+        self._show_animation = None
 
-            self._show_animation = animations.create_combined_property_animation(
-                self, ("size",), (QtCore.QSize(0, self._height), QtCore.QSize(self._width, self._height))
-            )
+    def set_show_mode(self, in_show_mode: ShowMode) -> None:
+        """Set how show reveals the widget.
 
-        elif in_layout_direction == LayoutDirection.vertical:
+        Args:
+            in_show_mode (ShowMode): Resize the live widget, or clip or scale a snapshot of it.
 
-            self._show_animation = animations.create_combined_property_animation(
-                self, ("size",), (QtCore.QSize(self._width, 0), QtCore.QSize(self._width, self._height))
-            )
+        Returns:
+            None
+        """
 
-        self._show_animation.finished.connect(self._on_shown_)
+        self._show_mode = in_show_mode
 
     def set_height(self, in_height: int):
 
+        final_size = QtCore.QSize(self._width, in_height)
         resize_animation = animations.PropertyAnimation(
-            self, "size", (QtCore.QSize(self._width, self.height()), QtCore.QSize(self._width, in_height))
+            self, "size", (QtCore.QSize(self._width, self.height()), final_size)
         )
+        if self.freeze_layout:
+
+            self._freeze_layout_(final_size)
+            resize_animation.finished.connect(self._thaw_layout_)
+
         return resize_animation.start()
 
+    def _get_show_animation_(self):
+        """Get the size animation played by show, building it on first use.
+
+        Most nifty widgets are shown along with their parent rather than by
+        their own show, so they never pay for the animation.
+        """
+
+        if self._show_animation is not None:
+
+            return self._show_animation
+
+        if self._layout_direction == LayoutDirection.horizontal:
+
+            start_size = QtCore.QSize(0, self._height)
+
+        elif self._layout_direction == LayoutDirection.vertical:
+
+            start_size = QtCore.QSize(self._width, 0)
+
+        else:
+
+            start_size = QtCore.QSize(0, 0)
+
+        self._show_animation = animations.create_combined_property_animation(
+            self, ("size",), (start_size, QtCore.QSize(self._width, self._height)), in_duration=self._SHOW_DURATION
+        )
+        self._show_animation.set_priority(animations.AnimationPriority.show)
+        self._show_animation.finished.connect(self._on_shown_)
+
+        return self._show_animation
+
     def reset_size(self) -> bool:
 
         if self._layout_direction == LayoutDirection.horizontal:
@@ -85,15 +610,129 @@ class _AnimatedMixin_(object):
 
             return self.resize(self._width, 1)
 
+        return self.resize(1, 1)
+
+    def _freeze_layout_(self, in_final_size: QtCore.QSize) -> None:
+        """Lay the children out at in_final_size, then hold them there until _thaw_layout_."""
+
+        layout = self.layout()
+        if not self.freeze_layout or layout is None or self._layout_frozen:
+
+            return
+
+        layout.setGeometry(QtCore.QRect(QtCore.QPoint(0, 0), in_final_size))
+        layout.setEnabled(False)
+        self._layout_frozen = True
+
+    @QtCore.Slot()
+    def _thaw_layout_(self) -> None:
+        """Re-enable the layout frozen by _freeze_layout_, with a single layout pass."""
+
+        if not self._layout_frozen:
+
+            return
+
+        self._layout_frozen = False
+        layout = self.layout()
+        layout.setEnabled(True)
+        layout.invalidate()
+        layout.activate()
+
+    def _start_show_animation_(self):
+        """Start the show animation of the current show mode, returning it."""
+
+        if self._show_mode == ShowMode.resize:
+
+            self._freeze_layout_(QtCore.QSize(self._width, self._height))
+            animation = self._get_show_animation_()
+
+        else:
+
+            animation = self._snapshot_overlay.reveal_animation
+
+        animation.start()
+
+        return animation
+
+    def _get_snapshot_overlay_(self) -> _SnapshotOverlay_:
+
+        if self._snapshot_overlay is None:
+
+            self._snapshot_overlay = _SnapshotOverlay_(self)
+            self._snapshot_overlay.reveal_animation.finished.connect(self._on_snapshot_revealed_)
+
+        return self._snapshot_overlay
+
+    def _cover_with_snapshot_(self) -> None:
+        """Cover the laid out widget with a snapshot of itself, for the reveal animation to uncover."""
+
+        layout = self.layout()
+        if layout is not None:
+
+            layout.activate()
+
+        self._get_snapshot_overlay_().reveal_animation.stop()
+        self._snapshot_overlay.reveal_animation.setDuration(self._SHOW_DURATION)
+        self._snapshot_overlay.cover(self.grab(), self._show_mode, self._layout_direction)
+
+    def _on_obscured_(self) -> None:
+        """Called by the repaint batcher when an animated repaint has no visible region to draw."""
+
+        suspend_animations(self, self.suspend_policy)
+
     # Qt Methods:
-    def show(self, animate: bool = True, delay_animation: int = 50) -> bool:
+    def hideEvent(self, event):
 
-        self.reset_size()
-        if animate:
+        suspend_animations(self, self.suspend_policy)
 
-            QtCore.QTimer.singleShot(delay_animation, self._show_animation.start)
+        return super().hideEvent(event)
 
-        return super().show()
+    def show(self, animate: bool = True, delay_animation: int = None) -> ShowOperation:
+        """Show the widget, animating it in as soon as it is ready to be drawn.
+
+        Args:
+            animate (bool): Whether to play the show animation.
+            delay_animation (int): Start the animation after this many milliseconds,
+                instead of on the first paint of the widget.
+
+        Returns:
+            ShowOperation: The show, which can be chained, waited on, awaited or cancelled.
+        """
+
+        if self._show_operation is not None:
+
+            self._show_operation.cancel()
+            self._show_operation = None
+
+        if not animate:
+
+            self.resize(self._width, self._height)
+            super().show()
+
+            return ShowOperation(self)
+
+        if self._show_mode == ShowMode.resize:
+
+            self.reset_size()
+            super().show()
+            ready_widget = self
+
+        else:
+
+            # Snapshot modes lay the widget out once, at its final size.
+            self.resize(self._width, self._height)
+            super().show()
+            ready_widget = self._get_snapshot_overlay_()
+
+        # Assigned before the snapshot is grabbed, so children painted into it see the pending show.
+        self._show_operation = ShowOperation(self, ready_widget, self._start_show_animation_)
+        if ready_widget is not self:
+
+            self._cover_with_snapshot_()
+
+        self._show_operation.start(delay_animation)
+
+        return self._show_operation
 
     # Magic Methods:
     def __getattr__(self, in_attribute_name: str):
@@ -110,50 +749,297 @@ class _AnimatedMixin_(object):
 
         Using both is not recommended, though you can obviously do as you choose!
 
+        Name conversions are cached, and once an alias resolves to a method it
+        is bound onto the class, so repeated calls such as set_maximum_height
+        in a resize handler only pay for the conversion once per class.
+
+        Args:
+            in_attribute_name (str): The name of the attribute.
+
+        Returns:
+            object: The attribute object, if it exists.
+            Raises an AttributeError if attribute not found.
+        """
+
+        alias_name = convert_attribute_name(in_attribute_name)
+        attribute = Widget.__getattribute__(self, alias_name)
+        type(self)._bind_attribute_alias_(in_attribute_name, alias_name)
+
+        return attribute
+
+    # Class Methods:
+    @classmethod
+    def _bind_attribute_alias_(cls, in_alias_name: str, in_attribute_name: str) -> None:
+        """Bind a method alias resolved by __getattr__ onto the class as a forwarding function.
+
+        Subsequent lookups of the alias are then plain attribute hits rather
+        than another trip through __getattr__. The forwarder looks the target
+        up on each call rather than copying it, so subclasses that override
+        the target, such as set_height, are still reached through the alias.
+        Instance attributes, Qt signals, Qt properties and other non-method
+        attributes are left alone, as they cannot be safely forwarded.
+
+        Args:
+            in_alias_name (str): The name that was looked up.
+            in_attribute_name (str): The name of the attribute it resolved to.
+
+        Returns:
+            None
+        """
+
+        for base in cls.__mro__:
+
+            if in_attribute_name in base.__dict__:
+
+                attribute = base.__dict__[in_attribute_name]
+                break
+
+        else:
+
+            return
+
+        if isinstance(attribute, (QtCore.Signal, QtCore.Property)) or not callable(attribute):
+
+            return
+
+        def _forward_(self, *args, **kwargs):
+
+            return getattr(self, in_attribute_name)(*args, **kwargs)
+
+        _forward_.__name__ = in_alias_name
+        _forward_.__doc__ = getattr(attribute, "__doc__", None)
+        setattr(cls, in_alias_name, _forward_)
+
+
+class ShowScheduler(QtCore.QObject):
+    """Reveals the descendants of a widget in waves, limited by a per-frame time budget.
+
+    Descendants are grouped into waves by their depth below the root and
+    hidden up front. Each frame shows widgets from the current wave until the
+    budget is spent, then yields to the event loop so the frame can be
+    painted. With a cascade delay, each wave also waits that long after the
+    previous one.
+
+    Exceptions raised while showing a widget are emitted through failed,
+    collected in errors and reported through sys.excepthook.
+
+    The scheduler deletes itself once it finishes or is cancelled, so
+    repeated reveals do not pile up under the root. Its errors and
+    is_finished stay readable afterwards.
+    """
+
+    progress = QtCore.Signal(int, int)
+    failed = QtCore.Signal(object, object)
+    finished = QtCore.Signal()
+
+    def __init__(
+        self,
+        in_root: QtWidgets.QWidget,
+        in_frame_budget: float = 8.0,
+        in_cascade_delay: int = 0,
+        in_animate: bool = True,
+    ):
+
+        super().__init__(in_root)
+
+        self._frame_budget = in_frame_budget / 1000
+        self._cascade_delay = in_cascade_delay
+        self._animate = in_animate
+        self._waves = self._collect_waves_(in_root)
+        self._wave_index = 0
+        self._widget_index = 0
+        self._shown_count = 0
+        self._total_count = sum(len(wave) for wave in self._waves)
+        self._cancelled = False
+
+        self.errors = []
+
+    # Slots:
+    @QtCore.Slot()
+    def _on_frame_(self) -> None:
+
+        if self._cancelled:
+
+            return
+
+        frame_start = time.perf_counter()
+        wave = self._waves[self._wave_index] if self._waves else ()
+        while self._widget_index < len(wave):
+
+            self._show_widget_(wave[self._widget_index])
+            self._widget_index += 1
+            if time.perf_counter() - frame_start >= self._frame_budget:
+
+                break
+
+        self.progress.emit(self._shown_count, self._total_count)
+
+        delay = 0
+        if self._widget_index >= len(wave):
+
+            self._wave_index += 1
+            self._widget_index = 0
+            if self._wave_index >= len(self._waves):
+
+                self.finished.emit()
+                self.deleteLater()
+                return
+
+            delay = self._cascade_delay
+
+        QtCore.QTimer.singleShot(delay, self._on_frame_)
+
+    # Public Methods:
+    def start(self) -> None:
+        """Hide every descendant, then start revealing them from the next event loop iteration."""
+
+        for wave in self._waves:
+
+            for widget in wave:
+
+                widget.setVisible(False)
+
+        QtCore.QTimer.singleShot(0, self._on_frame_)
+
+    def cancel(self) -> None:
+
+        if self._cancelled or self.is_finished():
+
+            return
+
+        self._cancelled = True
+        self.deleteLater()
+
+    def is_finished(self) -> bool:
+
+        return self._wave_index >= len(self._waves)
+
+    # Private Methods:
+    @staticmethod
+    def _collect_waves_(in_root: QtWidgets.QWidget) -> list:
+
+        def _get_child_widgets_(in_widget):
+
+            return [
+                child for child in in_widget.children()
+                if isinstance(child, QtWidgets.QWidget) and not child.isWindow() and not (
+                    # Leave widgets that were explicitly hidden alone.
+                    child.testAttribute(QtCore.Qt.WA_WState_ExplicitShowHide)
+                    and child.testAttribute(QtCore.Qt.WA_WState_Hidden)
+                )
+            ]
+
+        waves = []
+        wave = _get_child_widgets_(in_root)
+        while wave:
+
+            waves.append(wave)
+            wave = [child for widget in wave for child in _get_child_widgets_(widget)]
+
+        return waves
+
+    def _show_widget_(self, in_widget: QtWidgets.QWidget) -> None:
+
+        try:
+
+            if isinstance(in_widget, _AnimatedMixin_):
+
+                in_widget.show(animate=self._animate)
+
+            else:
+
+                in_widget.show()
+
+        except Exception as exception:
+
+            self.errors.append((in_widget, exception))
+            self.failed.emit(in_widget, exception)
+            sys.excepthook(type(exception), exception, exception.__traceback__)
+
+        self._shown_count += 1
+
+
+class Widget(_AnimatedMixin_, QtWidgets.QWidget):
+    def __init__(self, *args, in_layout=None, **kwargs):
+
+        QtWidgets.QWidget.__init__(self)
+        _AnimatedMixin_.__init__(self, *args, **kwargs)
+
+        QtWidgets.QVBoxLayout(self) if in_layout is None else in_layout(self)
+        self._show_scheduler = None
+
+    def addWidget(self, *args, **kwargs):
+
+        return self.layout().addWidget(*args, **kwargs)
+
+    def addWidgets(self, in_widgets, in_column_count: int = None) -> None:
+        """Add many widgets in one batch, see batch_build.
+
         Args:
-            in_attribute_name (str): The name of the attribute.
+            in_widgets (iterable): The widgets to add, in order.
+            in_column_count (int): For a QGridLayout, the number of columns to fill row by row.
 
         Returns:
-            object: The attribute object, if it exists.
-            Raises an AttributeError if attribute not found.
+            None
         """
 
-        if "_" in in_attribute_name:
+        layout = self.layout()
+        with batch_build(self):
 
-            split = in_attribute_name.split("_")
-            pascal_case_attribute_name = "".join((word.title() for word in split[1:]))
-            pascal_case_attribute_name = f"{split[0]}{pascal_case_attribute_name}"
+            if in_column_count is None:
 
-            return Widget.__getattribute__(self, pascal_case_attribute_name)
+                for widget in in_widgets:
 
-        split = re.sub(r"([A-Z])", r" \1", in_attribute_name).split()
-        snake_case_attribute_name = "_".join(split).lower()
+                    layout.addWidget(widget)
 
-        return Widget.__getattribute__(self, snake_case_attribute_name)
+            else:
 
+                for index, widget in enumerate(in_widgets):
 
-class Widget(_AnimatedMixin_, QtWidgets.QWidget):
-    def __init__(self, *args, in_layout=None, **kwargs):
+                    layout.addWidget(widget, index // in_column_count, index % in_column_count)
 
-        QtWidgets.QWidget.__init__(self)
-        _AnimatedMixin_.__init__(self, *args, **kwargs)
+    def show_descendants(
+        self, animate: bool = True, frame_budget: float = 8.0, cascade_delay: int = 0
+    ) -> ShowScheduler:
+        """Reveal every descendant widget in waves instead of all in one frame.
 
-        QtWidgets.QVBoxLayout(self) if in_layout is None else in_layout(self)
+        Args:
+            animate (bool): Whether nifty descendants animate as they are shown.
+            frame_budget (float): Milliseconds of showing to do per frame.
+            cascade_delay (int): Milliseconds to wait between waves.
 
-    def addWidget(self, *args, **kwargs):
+        Returns:
+            ShowScheduler: Reports progress, errors and completion via its signals.
+        """
 
-        return self.layout().addWidget(*args, **kwargs)
+        if self._show_scheduler is not None:
+
+            # Cancelling deletes the previous scheduler, a finished one has already deleted itself.
+            self._show_scheduler.cancel()
+
+        self._show_scheduler = ShowScheduler(
+            self, in_frame_budget=frame_budget, in_cascade_delay=cascade_delay, in_animate=animate
+        )
+        self._show_scheduler.start()
 
-    def show(self, animate: bool = True, delay_animation: int = 50, show_children: bool = False) -> bool:
+        return self._show_scheduler
 
-        result = super().show(animate=animate, delay_animation=delay_animation)
+    def show(
+        self,
+        animate: bool = True,
+        delay_animation: int = None,
+        show_children: bool = False,
+        frame_budget: float = 8.0,
+        cascade_delay: int = 0,
+    ) -> ShowOperation:
+
+        operation = super().show(animate=animate, delay_animation=delay_animation)
         if show_children:
-            for child in self.children():
-                try:
-                    child.show()
-                except: pass
 
-        return result
+            self.show_descendants(animate=animate, frame_budget=frame_budget, cascade_delay=cascade_delay)
+
+        return operation
+
 
 class MainWindow(_AnimatedMixin_, QtWidgets.QMainWindow):
     def __init__(self, *args, **kwargs):
@@ -169,7 +1055,23 @@ class PushButton(_AnimatedMixin_, QtWidgets.QPushButton):
     mouse_release = QtCore.Signal()
     mouse_leave = QtCore.Signal()
 
-    def __init__(self, in_text, *args, in_icon: QtGui.QIcon = None, **kwargs):
+    # Pulse name -> the method playing the animation that waits for it to finish.
+    _FOLLOW_UP_ANIMATIONS = {
+        "mouse_enter": "_play_mouse_leave_animation_",
+        "mouse_press": "_play_mouse_release_animation_",
+    }
+    # Milliseconds a size must hold before its pulse atlases are prerendered, see resizeEvent.
+    _PRERENDER_SETTLE_INTERVAL = 100
+    # The animation budget priority of each pulse, the enter pulse drops to trailing while it plays as a leave pulse.
+    _PULSE_PRIORITIES = {
+        "mouse_enter": animations.AnimationPriority.hover,
+        "mouse_press": animations.AnimationPriority.feedback,
+        "mouse_release": animations.AnimationPriority.feedback,
+    }
+
+    def __init__(
+        self, in_text, *args, in_icon: QtGui.QIcon = None, in_theme: themes.ThemeHandle = None, **kwargs
+    ):
 
         if in_icon:
 
@@ -181,31 +1083,15 @@ class PushButton(_AnimatedMixin_, QtWidgets.QPushButton):
 
         _AnimatedMixin_.__init__(self, *args, **kwargs)
 
-        # Mouse colors:
-        self._mouse_enter_pulse_end_color = QtGui.QColor("#00B0FF")
-        self._mouse_enter_pulse_end_color.setAlpha(75)
-        self._mouse_enter_pulse_start_color = self._mouse_enter_pulse_end_color.lighter()
-        self._mouse_enter_pulse_start_color.setAlpha(50)
-        self._mouse_enter_pulse_color = self._mouse_enter_pulse_start_color
-
-        self._mouse_leave_pulse_start_color = self._mouse_enter_pulse_end_color
-        self._mouse_leave_pulse_end_color = self._mouse_enter_pulse_start_color
-        # self._mouse_leave_pulse_end_color.setAlpha(50)
-        self._mouse_leave_pulse_color = self._mouse_leave_pulse_start_color
-
-        self._mouse_press_pulse_start_color = QtGui.QColor("#00B0FF")
-        self._mouse_press_pulse_start_color.setAlpha(75)
-        self._mouse_press_pulse_end_color = self._mouse_press_pulse_start_color.lighter()
-        self._mouse_press_pulse_end_color.setAlpha(250)
-        self._mouse_press_pulse_color = self._mouse_press_pulse_start_color
-
-        self._mouse_release_pulse_end_color = QtGui.QColor("#00B0FF")
-        self._mouse_release_pulse_end_color.setAlpha(75)
-        self._mouse_release_pulse_start_color = self._mouse_release_pulse_end_color.lighter()
-        self._mouse_release_pulse_start_color.setAlpha(250)
-        self._mouse_release_pulse_color = self._mouse_release_pulse_end_color
-
-        self._mouse_enter_pulse_brush = QtGui.QBrush(self._mouse_enter_pulse_color)
+        # Colours, brushes and pens are shared through the theme, only the
+        # animated colours below are held per button.
+        self._theme = themes.default_theme if in_theme is None else in_theme
+        self._theme.register(self)
+        theme = self._theme.theme
+        self._mouse_enter_pulse_color = theme.mouse_enter_pulse_start_color
+        self._mouse_leave_pulse_color = theme.mouse_leave_pulse_start_color
+        self._mouse_press_pulse_color = theme.mouse_press_pulse_start_color
+        self._mouse_release_pulse_color = theme.mouse_release_pulse_end_color
 
         self._border_show_time = 0
         self._mouse_enter_pulse_radius = 0
@@ -221,7 +1107,17 @@ class PushButton(_AnimatedMixin_, QtWidgets.QPushButton):
         self._mouse_currently_pressed = False
         self._rendered = False
 
-        self._setup_animation()
+        self._layer_regions = rendering.LayerRegions()
+
+        # Pulse and border animations are built on demand, see _get_pulse_animation_.
+        self._pulse_animations = {}
+        self._boarder_show_animation = None
+
+        # The pulses whose follow up animation plays once they finish, see _FOLLOW_UP_ANIMATIONS.
+        self._queued_follow_ups = set()
+        self._follow_up_timer = None
+        self._prerender_timer = None
+        self.shown.connect(self._on_shown2_)
 
     # Qt Properties:
     @QtCore.Property(float)
@@ -233,7 +1129,7 @@ class PushButton(_AnimatedMixin_, QtWidgets.QPushButton):
     def border_show_time(self, value):
 
         self._border_show_time = value
-        self.update()
+        repaint.request_update(self, self._layer_regions.invalidate("border", self._get_border_region_()))
 
     @QtCore.Property(float)
     def mouse_enter_pulse_radius(self):
@@ -244,7 +1140,7 @@ class PushButton(_AnimatedMixin_, QtWidgets.QPushButton):
     def mouse_enter_pulse_radius(self, value):
 
         self._mouse_enter_pulse_radius = value
-        self.update()
+        self._invalidate_pulse_("mouse_enter")
 
     @QtCore.Property(QtGui.QColor)
     def mouse_enter_pulse_color(self):
@@ -255,7 +1151,7 @@ class PushButton(_AnimatedMixin_, QtWidgets.QPushButton):
     def mouse_enter_pulse_color(self, value):
 
         self._mouse_enter_pulse_color = value
-        self.update()
+        self._invalidate_pulse_("mouse_enter")
 
     @QtCore.Property(float)
     def mouse_press_pulse_radius(self):
@@ -266,7 +1162,7 @@ class PushButton(_AnimatedMixin_, QtWidgets.QPushButton):
     def mouse_press_pulse_radius(self, value):
 
         self._mouse_press_pulse_radius = value
-        self.update()
+        self._invalidate_pulse_("mouse_press")
 
     @QtCore.Property(QtGui.QColor)
     def mouse_press_pulse_color(self):
@@ -277,7 +1173,7 @@ class PushButton(_AnimatedMixin_, QtWidgets.QPushButton):
     def mouse_press_pulse_color(self, value):
 
         self._mouse_press_pulse_color = value
-        self.update()
+        self._invalidate_pulse_("mouse_press")
 
     @QtCore.Property(float)
     def mouse_release_pulse_radius(self):
@@ -288,7 +1184,7 @@ class PushButton(_AnimatedMixin_, QtWidgets.QPushButton):
     def mouse_release_pulse_radius(self, value):
 
         self._mouse_release_pulse_radius = value
-        self.update()
+        self._invalidate_pulse_("mouse_release")
 
     @QtCore.Property(QtGui.QColor)
     def mouse_release_pulse_color(self):
@@ -299,7 +1195,7 @@ class PushButton(_AnimatedMixin_, QtWidgets.QPushButton):
     def mouse_release_pulse_color(self, value):
 
         self._mouse_release_pulse_color = value
-        self.update()
+        self._invalidate_pulse_("mouse_release")
 
     @QtCore.Property(float)
     def mouse_leave_pulse_radius(self):
@@ -310,7 +1206,7 @@ class PushButton(_AnimatedMixin_, QtWidgets.QPushButton):
     def mouse_leave_pulse_radius(self, value):
 
         self._mouse_leave_pulse_radius = value
-        self.update()
+        self._invalidate_pulse_("mouse_leave")
 
     @QtCore.Property(QtGui.QColor)
     def mouse_leave_pulse_color(self):
@@ -321,124 +1217,330 @@ class PushButton(_AnimatedMixin_, QtWidgets.QPushButton):
     def mouse_leave_pulse_color(self, value):
 
         self._mouse_leave_pulse_color = value
-        self.update()
+        self._invalidate_pulse_("mouse_leave")
+
+    # Public Methods:
+    def prerender_pulses(self) -> None:
+        """Queue the atlases of every pulse at the current size and theme, when pulse atlases are enabled."""
+
+        atlas_cache = _get_pulse_atlas_cache_()
+        if atlas_cache is None:
+
+            return
+
+        # The same size painting looks atlases up with, resizeEvent queues them again once the size settles.
+        diameter = self._get_pulse_diameter_()
+        for name in ("mouse_enter", "mouse_press", "mouse_release"):
+
+            atlas_cache.get_atlas(diameter, *self._get_pulse_ramp_(name), self.devicePixelRatioF())
 
     # Private Methods:
     def _setup_animation(self):
+        """Build every pulse animation and the border animation up front.
 
-        animation_duration = 250
+        Each animation is otherwise built the first time it is played, so
+        buttons that are never hovered or pressed never pay for them.
+        """
 
-        def _create_pulse_animation_(in_name, in_radius_range, in_color_range, in_signal, in_duration):
+        for name in ("mouse_enter", "mouse_press", "mouse_release"):
 
-            radius_animation = animations.PropertyAnimation(
-                self, f"{in_name}_pulse_radius", in_radius_range, in_duration=in_duration
-            )
+            self._get_pulse_animation_(name)
 
-            color_animation = animations.PropertyAnimation(
-                self, f"{in_name}_pulse_color", in_color_range, in_duration=in_duration
-            )
+        self._get_border_show_animation_()
 
-            animation_group = QtCore.QParallelAnimationGroup()
-            animation_group.addAnimation(radius_animation)
-            animation_group.addAnimation(color_animation)
+    def _create_pulse_animation_(self, in_name):
 
-            # in_signal.connect(animation_group.start)
+        animation_duration = 250
+        if in_name == "mouse_enter":
+
+            radius_range, duration = (0, 1), animation_duration
+
+        elif in_name == "mouse_press":
+
+            radius_range, duration = (0, 1), animation_duration * 0.75
 
-            return radius_animation, color_animation, animation_group
+        else:
+
+            radius_range, duration = (1, 0), animation_duration * 0.75
 
-        (
-            self._mouse_enter_pulse_radius_animation,
-            self._mouse_enter_pulse_color_animation,
-            self._mouse_enter_pulse_animation_group,
-        ) = _create_pulse_animation_(
-            "mouse_enter",
-            (0, 1),
-            (self._mouse_enter_pulse_start_color, self._mouse_enter_pulse_end_color),
-            self.mouse_enter,
-            animation_duration
+        theme = self._theme.theme
+        color_range = (
+            getattr(theme, f"{in_name}_pulse_start_color"), getattr(theme, f"{in_name}_pulse_end_color")
         )
-        (
-            self._mouse_press_pulse_radius_animation,
-            self._mouse_press_pulse_color_animation,
-            self._mouse_press_pulse_animation_group,
-        ) = _create_pulse_animation_(
-            "mouse_press",
-            (0, 1),
-            (self._mouse_press_pulse_start_color, self._mouse_press_pulse_end_color),
-            self.mouse_press,
-            animation_duration * 0.75
+        radius_animation = animations.PropertyAnimation(
+            self, f"{in_name}_pulse_radius", radius_range, in_duration=duration
         )
-        (
-            self._mouse_release_pulse_radius_animation,
-            self._mouse_release_pulse_color_animation,
-            self._mouse_release_pulse_animation_group,
-        ) = _create_pulse_animation_(
-            "mouse_release",
-            (1, 0),
-            (self._mouse_release_pulse_start_color, self._mouse_release_pulse_end_color),
-            self.mouse_release,
-            animation_duration * 0.75
+        color_animation = animations.PropertyAnimation(
+            self, f"{in_name}_pulse_color", color_range, in_duration=duration
         )
-        self._boarder_show_animation = animations.PropertyAnimation(
-            self, "border_show_time", (0.0, 1.0), in_duration=200
+        animation_group = animations.ParallelAnimationGroup((radius_animation, color_animation))
+        animation_group.set_priority(self._PULSE_PRIORITIES[in_name])
+        # Connected once for the lifetime of the animation, events never reconnect it.
+        animation_group.finished.connect(functools.partial(self._on_pulse_finished_, in_name))
+
+        return radius_animation, color_animation, animation_group
+
+    def _get_pulse_animation_(self, in_name):
+        """Get the radius, color and group animations of a pulse, building them on first use.
+
+        Args:
+            in_name (str): One of mouse_enter, mouse_press or mouse_release.
+
+        Returns:
+            tuple: The radius animation, color animation and their parallel group.
+        """
+
+        pulse_animation = self._pulse_animations.get(in_name)
+        if pulse_animation is None:
+
+            pulse_animation = self._create_pulse_animation_(in_name)
+            self._pulse_animations[in_name] = pulse_animation
+
+        return pulse_animation
+
+    def _is_pulse_running_(self, in_name) -> bool:
+
+        pulse_animation = self._pulse_animations.get(in_name)
+
+        return pulse_animation is not None and pulse_animation[2].is_running()
+
+    def _get_pulse_rect_(self, in_name) -> QtCore.QRect:
+
+        return rendering.get_circle_rect(
+            getattr(self, f"_{in_name}_location"), getattr(self, f"_{in_name}_pulse_radius")
         )
-        self.shown.connect(self._on_shown2_)
-        # (
-        #     self._mouse_leave_pulse_radius_animation,
-        #     self._mouse_leave_pulse_color_animation,
-        #     self._mouse_leave_pulse_animation_group,
-        # ) = _create_pulse_animation_(
-        #     "mouse_leave",
-        #     (1, 0),
-        #     (self._mouse_leave_pulse_start_color, self._mouse_leave_pulse_end_color),
-        #     self.mouse_leave,
-        # )
-        # _create_pulse_animation_("_mouse_press", b"mouse_press_pulse_radius", b"mouse_press_pulse_color")
+
+    def _get_border_rect_(self) -> QtCore.QRectF:
+
+        contents_rect = self.contentsRect()
+        border_left = animations.lerp(contents_rect.center().x(), contents_rect.left(), self._border_show_time)
+        border_width = animations.lerp(0.0, contents_rect.width(), self._border_show_time)
+
+        return QtCore.QRectF(border_left, 0, border_width, contents_rect.height())
+
+    def _get_border_bounds_(self) -> QtCore.QRect:
+
+        return self._get_border_rect_().toAlignedRect().adjusted(-1, -1, 1, 1)
+
+    def _get_border_region_(self) -> QtGui.QRegion:
+        """Get the four edge strips of the border, so its interior is never repainted for it."""
+
+        bounds = self._get_border_bounds_()
+
+        return QtGui.QRegion(bounds).subtracted(QtGui.QRegion(bounds.adjusted(2, 2, -2, -2)))
+
+    def _get_pulse_diameter_(self) -> float:
+
+        return max(self.contentsRect().height(), self.contentsRect().width()) * 1.5
+
+    def _get_pulse_ramp_(self, in_name) -> tuple:
+        """Get the colours of pulse in_name as its radius reaches 0 and at its full radius."""
+
+        theme = self._theme.theme
+        start_color = getattr(theme, f"{in_name}_pulse_start_color")
+        end_color = getattr(theme, f"{in_name}_pulse_end_color")
+        # The release pulse shrinks as it plays, so its ramp runs backwards.
+        return (end_color, start_color) if in_name == "mouse_release" else (start_color, end_color)
+
+    def _apply_theme_(self) -> None:
+        """Refresh resting pulse colours, and retarget running pulses, after ThemeHandle.set_theme."""
+
+        for name in ("mouse_enter", "mouse_press", "mouse_release"):
+
+            color_at_zero, color_at_full = self._get_pulse_ramp_(name)
+            pulse_animation = self._pulse_animations.get(name)
+            if pulse_animation is not None and pulse_animation[2].is_running():
+
+                radius_animation, color_animation, _ = pulse_animation
+                # The pulse keeps playing in the same direction, only its colours change.
+                growing = radius_animation.endValue() > radius_animation.startValue()
+                color_animation.setStartValue(color_at_zero if growing else color_at_full)
+                color_animation.setEndValue(color_at_full if growing else color_at_zero)
+
+            else:
+
+                radius = getattr(self, f"_{name}_pulse_radius")
+                setattr(self, f"_{name}_pulse_color", color_at_full if radius > 0 else color_at_zero)
+
+    def _draw_pulse_(self, in_painter, in_name, in_location, in_radius, in_color) -> None:
+        """Blit the frame of pulse in_name from its atlas, or draw it from the sprite cache until the atlas is ready."""
+
+        atlas_cache = _get_pulse_atlas_cache_()
+        if atlas_cache is not None and in_radius > 0:
+
+            atlas = atlas_cache.get_atlas(
+                self._get_pulse_diameter_(), *self._get_pulse_ramp_(in_name), in_painter.device().devicePixelRatioF()
+            )
+            if atlas is not None:
+
+                atlas.draw(in_painter, in_location, in_radius)
+
+                return
+
+        rendering.draw_pulse(in_painter, in_location, in_radius, in_color)
+
+    def _invalidate_pulse_(self, in_name) -> None:
+        """Repaint only the area the pulse covers now and covered on the previous frame."""
+
+        repaint.request_update(self, self._layer_regions.invalidate(in_name, self._get_pulse_rect_(in_name)))
+
+    def _release_layer_(self, in_name) -> None:
+
+        previous_rect = self._layer_regions.release(in_name)
+        if previous_rect is not None:
+
+            repaint.request_update(self, previous_rect)
+
+    def _get_border_show_animation_(self):
+
+        if self._boarder_show_animation is None:
+
+            self._boarder_show_animation = animations.PropertyAnimation(
+                self, "border_show_time", (0.0, 1.0), in_duration=200
+            )
+            self._boarder_show_animation.set_priority(animations.AnimationPriority.show)
+
+        return self._boarder_show_animation
 
     def _play_mouse_enter_animation_(self):
 
-        self._mouse_enter_pulse_animation_group.stop()
-        diameter = max(self.contentsRect().height(), self.contentsRect().width()) * 1.5
-        self._mouse_enter_pulse_radius_animation.setStartValue(0)
-        self._mouse_enter_pulse_radius_animation.setEndValue(diameter)
-        self._mouse_enter_pulse_color_animation.setStartValue(self._mouse_enter_pulse_start_color)
-        self._mouse_enter_pulse_color_animation.setEndValue(self._mouse_enter_pulse_end_color)
-        self._mouse_enter_pulse_animation_group.start()
+        radius_animation, color_animation, animation_group = self._get_pulse_animation_("mouse_enter")
+        animation_group.stop()
+        diameter = self._get_pulse_diameter_()
+        radius_animation.setStartValue(0)
+        radius_animation.setEndValue(diameter)
+        color_animation.setStartValue(self._theme.theme.mouse_enter_pulse_start_color)
+        color_animation.setEndValue(self._theme.theme.mouse_enter_pulse_end_color)
+        animation_group.set_priority(animations.AnimationPriority.hover)
+        animation_group.start()
 
     def _play_mouse_leave_animation_(self):
 
-        self._mouse_enter_pulse_animation_group.stop()
+        radius_animation, color_animation, animation_group = self._get_pulse_animation_("mouse_enter")
+        animation_group.stop()
         self._mouse_enter_location = self._mouse_leave_location
-        diameter = max(self.contentsRect().height(), self.contentsRect().width()) * 1.5
-        self._mouse_enter_pulse_radius_animation.setStartValue(diameter)
-        self._mouse_enter_pulse_radius_animation.setEndValue(0)
-        self._mouse_enter_pulse_color_animation.setStartValue(self._mouse_enter_pulse_end_color)
-        self._mouse_enter_pulse_color_animation.setEndValue(self._mouse_enter_pulse_start_color)
-        self._mouse_enter_pulse_animation_group.start()
+        diameter = self._get_pulse_diameter_()
+        radius_animation.setStartValue(diameter)
+        radius_animation.setEndValue(0)
+        color_animation.setStartValue(self._theme.theme.mouse_enter_pulse_end_color)
+        color_animation.setEndValue(self._theme.theme.mouse_enter_pulse_start_color)
+        # The leave pulse trails behind the cursor, so it gives way to everything else.
+        animation_group.set_priority(animations.AnimationPriority.trailing)
+        animation_group.start()
 
     def _play_mouse_press_animation_(self):
 
-        self._mouse_press_pulse_animation_group.stop()
-        diameter = max(self.contentsRect().height(), self.contentsRect().width()) * 1.5
-        self._mouse_press_pulse_radius_animation.setEndValue(diameter)
-        self._mouse_press_pulse_animation_group.start()
+        radius_animation, color_animation, animation_group = self._get_pulse_animation_("mouse_press")
+        animation_group.stop()
+        diameter = self._get_pulse_diameter_()
+        radius_animation.setEndValue(diameter)
+        color_animation.setStartValue(self._theme.theme.mouse_press_pulse_start_color)
+        color_animation.setEndValue(self._theme.theme.mouse_press_pulse_end_color)
+        animation_group.start()
 
     def _play_mouse_release_animation_(self):
 
-        self._mouse_release_pulse_animation_group.stop()
-        diameter = max(self.contentsRect().height(), self.contentsRect().width()) * 1.5
-        self._mouse_release_pulse_radius_animation.setStartValue(diameter)
-        self._mouse_release_pulse_animation_group.start()
+        radius_animation, color_animation, animation_group = self._get_pulse_animation_("mouse_release")
+        animation_group.stop()
+        diameter = self._get_pulse_diameter_()
+        radius_animation.setStartValue(diameter)
+        color_animation.setStartValue(self._theme.theme.mouse_release_pulse_start_color)
+        color_animation.setEndValue(self._theme.theme.mouse_release_pulse_end_color)
+        animation_group.start()
+
+    def _queue_follow_up_(self, in_name):
+        """Play the follow up animation of pulse in_name once it finishes, see _FOLLOW_UP_ANIMATIONS."""
+
+        self._queued_follow_ups.add(in_name)
+
+    def _get_follow_up_timer_(self):
+
+        if self._follow_up_timer is None:
+
+            self._follow_up_timer = QtCore.QTimer(self)
+            self._follow_up_timer.setSingleShot(True)
+            self._follow_up_timer.setInterval(0)
+            self._follow_up_timer.timeout.connect(self._play_follow_up_animations_)
+
+        return self._follow_up_timer
+
+    def _get_prerender_timer_(self):
+
+        if self._prerender_timer is None:
+
+            self._prerender_timer = QtCore.QTimer(self)
+            self._prerender_timer.setSingleShot(True)
+            self._prerender_timer.setInterval(self._PRERENDER_SETTLE_INTERVAL)
+            self._prerender_timer.timeout.connect(self.prerender_pulses)
+
+        return self._prerender_timer
+
+    @QtCore.Slot()
+    def _play_follow_up_animations_(self):
+
+        for name, play_method_name in self._FOLLOW_UP_ANIMATIONS.items():
+
+            if name in self._queued_follow_ups and not self._is_pulse_running_(name):
+
+                self._queued_follow_ups.discard(name)
+                getattr(self, play_method_name)()
+
+    def _on_pulse_finished_(self, in_name):
+
+        if in_name in self._queued_follow_ups:
+
+            # Deferred to the next event loop pass so the finished pulse is
+            # fully stopped, and untracked, before its group is restarted.
+            self._get_follow_up_timer_().start()
+
+        if in_name == "mouse_enter" or (in_name == "mouse_press" and self._mouse_currently_pressed):
+
+            return
+
+        self._release_layer_(in_name)
+
+    def _queue_border_reveal_(self) -> None:
+        """Reveal the border once the button, and every widget it is being shown with, has finished showing."""
+
+        if self._show_operation is not None and self._show_operation.is_pending():
+
+            # Its own shown signal starts the border.
+            return
+
+        parent = self.parentWidget()
+        while parent is not None:
+
+            operation = getattr(parent, "_show_operation", None)
+            if operation is not None and operation.is_pending():
+
+                operation.then(self._on_shown2_)
+
+                return
+
+            parent = parent.parentWidget()
+
+        QtCore.QTimer.singleShot(0, self._on_shown2_)
 
     @QtCore.Slot()
     def _on_shown2_(self):
 
-        self._boarder_show_animation.start()
+        self._get_border_show_animation_().start()
+        self.prerender_pulses()
 
     # Qt Methods:
+    def resizeEvent(self, event):
+
+        if self._rendered and _get_pulse_atlas_cache_() is not None:
+
+            # Restarted on every frame of a size animation, so only the settled size is prerendered.
+            self._get_prerender_timer_().start()
+
+        return super().resizeEvent(event)
+
     def enterEvent(self, event):
 
         self._mouse_enter_location = event.pos()
+        self._queued_follow_ups.discard("mouse_enter")
         self._play_mouse_enter_animation_()
         self.mouse_enter.emit()
 
@@ -448,15 +1550,9 @@ class PushButton(_AnimatedMixin_, QtWidgets.QPushButton):
 
         self._mouse_leave_location = self.mapFromGlobal(QtGui.QCursor.pos())
         self.mouse_leave.emit()
-        if self._mouse_enter_pulse_radius_animation.state() == animations.PropertyAnimation.Running:
+        if self._is_pulse_running_("mouse_enter"):
 
-            @QtCore.Slot()
-            def _finished_():
-
-                QtCore.QTimer.singleShot(0, self._play_mouse_leave_animation_)
-                self._mouse_enter_pulse_radius_animation.finished.disconnect(_finished_)
-
-            self._mouse_enter_pulse_radius_animation.finished.connect(_finished_)
+            self._queue_follow_up_("mouse_enter")
 
         else:
 
@@ -469,6 +1565,7 @@ class PushButton(_AnimatedMixin_, QtWidgets.QPushButton):
         self._mouse_press_location = event.pos()
         self.mouse_press.emit()
         self._mouse_currently_pressed = True
+        self._queued_follow_ups.discard("mouse_press")
         self._play_mouse_press_animation_()
 
         return super().mousePressEvent(event)
@@ -478,72 +1575,387 @@ class PushButton(_AnimatedMixin_, QtWidgets.QPushButton):
         self._mouse_release_location = event.pos()
         self.mouse_release.emit()
         self._mouse_currently_pressed = False
+        if self._is_pulse_running_("mouse_press"):
 
-        if self._mouse_press_pulse_radius_animation.state() == animations.PropertyAnimation.Running:
-
-            @QtCore.Slot()
-            def _finished_():
-
-                QtCore.QTimer.singleShot(0, self._play_mouse_release_animation_)
-                self._mouse_press_pulse_radius_animation.finished.disconnect(_finished_)
-
-            self._mouse_press_pulse_radius_animation.finished.connect(_finished_)
+            self._queue_follow_up_("mouse_press")
 
         else:
 
+            self._release_layer_("mouse_press")
             self._play_mouse_release_animation_()
 
-        return super().mousePressEvent(event)
+        return super().mouseReleaseEvent(event)
 
     def paintEvent(self, event):
 
-        contents_rect = self.contentsRect()
         if not self._rendered:
-            QtCore.QTimer.singleShot(200, self._on_shown2_)
             self._rendered = True
+            self._queue_border_reveal_()
 
         # super().paintEvent(event)
 
-        running = animations.PropertyAnimation.Running
+        # Only the exposed region is repainted, layers outside of it are skipped.
+        exposed_region = event.region()
         painter = QtGui.QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setClipRegion(exposed_region)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, rendering.antialiasing_enabled())
+
+        if exposed_region.intersects(self._get_pulse_rect_("mouse_enter")):
+
+            self._draw_pulse_(
+                painter, "mouse_enter", self._mouse_enter_location, self._mouse_enter_pulse_radius, self._mouse_enter_pulse_color
+            )
+
+        if (
+            (self._is_pulse_running_("mouse_press") or self._mouse_currently_pressed)
+            and exposed_region.intersects(self._get_pulse_rect_("mouse_press"))
+        ):
+
+            self._draw_pulse_(
+                painter, "mouse_press", self._mouse_press_location, self._mouse_press_pulse_radius, self._mouse_press_pulse_color
+            )
+
+        if self._is_pulse_running_("mouse_release") and exposed_region.intersects(
+            self._get_pulse_rect_("mouse_release")
+        ):
+
+            self._draw_pulse_(
+                painter,
+                "mouse_release",
+                self._mouse_release_location,
+                self._mouse_release_pulse_radius,
+                self._mouse_release_pulse_color,
+            )
+
+        if self._border_show_time > 0.0:
+
+            if exposed_region.intersects(self._get_border_bounds_()):
+
+                painter.setBrush(QtCore.Qt.transparent)
+                painter.setPen(self._theme.theme.border_pen)
+                painter.drawRect(self._get_border_rect_())
+
+        painter.end()
+
+
+class AnimatedToggle(_AnimatedMixin_, QtWidgets.QCheckBox):
+    """A checkbox drawn as a sliding toggle, with a pulse that follows the handle.
+
+    The bar track and its checked overlay are static, so they are drawn
+    from sprites shared by every toggle of the same size, colour and device
+    pixel ratio. Animation frames only rasterize the moving handle and pulse.
+
+    Args:
+        in_width (int): The width of the toggle.
+        in_height (int): The height of the toggle.
+        in_bar_color: Overrides the theme's bar colour.
+        in_checked_color: Overrides the theme's checked colour.
+        in_handle_color: Overrides the theme's handle colour.
+        in_pulse_unchecked_color: Overrides the theme's unchecked pulse colour.
+        in_theme (themes.ThemeHandle): The theme to draw with, defaults to themes.default_theme.
+            Passing any colour derives a theme for this toggle alone, prefer sharing a theme.
+    """
+
+    def __init__(
+        self,
+        in_width: int = 120,
+        in_height: int = 50,
+        in_bar_color=None,
+        in_checked_color=None,
+        in_handle_color=None,
+        in_pulse_unchecked_color=None,
+        in_theme: themes.ThemeHandle = None,
+        **kwargs
+    ):
+
+        QtWidgets.QCheckBox.__init__(self)
+        _AnimatedMixin_.__init__(self, in_width, in_height, **kwargs)
+
+        colors = {
+            "bar_color": in_bar_color,
+            "checked_color": in_checked_color,
+            "handle_color": in_handle_color,
+            "pulse_unchecked_color": in_pulse_unchecked_color,
+        }
+        colors = {name: color for name, color in colors.items() if color is not None}
+        self._theme = themes.default_theme if in_theme is None else in_theme
+        if colors:
+
+            self._theme = themes.ThemeHandle(self._theme.theme.derive(**colors))
+
+        self._theme.register(self)
+
+        self.setContentsMargins(0, 0, 8, 0)
+        self._handle_position = 0
+        self._handle_color = self._theme.theme.handle_color
+        self._pulse_radius = 0
+        self._layer_regions = rendering.LayerRegions()
+
+        animation_duration = 250
+        self._handle_position_animation = animations.PropertyAnimation(
+            self, "handle_position", in_duration=animation_duration
+        )
+        self._handle_position_animation.setEasingCurve(QtCore.QEasingCurve.InOutCubic)
+
+        self._handle_color_animation = animations.PropertyAnimation(
+            self, "handle_color", in_duration=animation_duration
+        )
+        self._handle_color_animation.setEasingCurve(QtCore.QEasingCurve.InCubic)
+
+        self._pulse_animation = animations.PropertyAnimation(
+            self, "pulse_radius", (10, 20), in_duration=animation_duration * 1.2
+        )
+        self._pulse_animation.setEasingCurve(QtCore.QEasingCurve.Linear)
+        self._pulse_animation.finished.connect(self._on_pulse_finished_)
 
-        painter.setPen(QtCore.Qt.transparent)
-        painter.setBrush(self._mouse_enter_pulse_brush)
-        self._mouse_enter_pulse_brush.setColor(self.mouse_enter_pulse_color)
-        painter.drawEllipse(
-            self._mouse_enter_location, self.mouse_enter_pulse_radius, self.mouse_enter_pulse_radius
+        self._animation_group = animations.ParallelAnimationGroup(
+            (self._handle_position_animation, self._pulse_animation, self._handle_color_animation)
         )
+        self._animation_group.set_priority(animations.AnimationPriority.feedback)
+
+        self.stateChanged.connect(self._on_state_changed_)
+
+    # Qt Properties:
+    @QtCore.Property(QtGui.QColor)
+    def handle_color(self):
+
+        return self._handle_color
+
+    @handle_color.setter
+    def handle_color(self, value):
+
+        self._handle_color = value
+        self._invalidate_layers_("handle")
+
+    @QtCore.Property(float)
+    def handle_position(self):
+
+        return self._handle_position
+
+    @handle_position.setter
+    def handle_position(self, value):
+
+        self._handle_position = value
+        self._invalidate_layers_("handle", "pulse", "overlay")
+
+    @QtCore.Property(float)
+    def pulse_radius(self):
+
+        return self._pulse_radius
+
+    @pulse_radius.setter
+    def pulse_radius(self, value):
+
+        self._pulse_radius = value
+        self._invalidate_layers_("pulse")
+
+    # Slots:
+    @QtCore.Slot(int)
+    def _on_state_changed_(self, in_value):
 
-        if self._mouse_press_pulse_animation_group.state() == running or self._mouse_currently_pressed:
+        theme = self._theme.theme
+        self._animation_group.stop()
+        if in_value:
 
-            brush = QtGui.QBrush(self.mouse_press_pulse_color)
-            painter.setBrush(brush)
-            painter.drawEllipse(
-                self._mouse_press_location, self.mouse_press_pulse_radius, self.mouse_press_pulse_radius
+            self._handle_color_animation.setStartValue(theme.handle_color)
+            self._handle_color_animation.setEndValue(theme.checked_color)
+            self._handle_position_animation.setEndValue(1)
+
+        else:
+
+            self._handle_color_animation.setStartValue(theme.checked_color)
+            self._handle_color_animation.setEndValue(theme.handle_color)
+            self._handle_position_animation.setEndValue(0)
+
+        self._animation_group.start()
+
+    @QtCore.Slot()
+    def _on_pulse_finished_(self):
+
+        previous_rect = self._layer_regions.release("pulse")
+        if previous_rect is not None:
+
+            repaint.request_update(self, previous_rect)
+
+    # Private Methods:
+    def _apply_theme_(self) -> None:
+        """Refresh the resting handle colour, and retarget a running handle animation, after ThemeHandle.set_theme."""
+
+        theme = self._theme.theme
+        if self._animation_group.is_running():
+
+            start_color, end_color = (
+                (theme.handle_color, theme.checked_color) if self.isChecked()
+                else (theme.checked_color, theme.handle_color)
             )
+            self._handle_color_animation.setStartValue(start_color)
+            self._handle_color_animation.setEndValue(end_color)
+
+        else:
+
+            self._handle_color = theme.checked_color if self.isChecked() else theme.handle_color
+
+    def _get_geometry_(self) -> tuple:
+        """Get the handle radius, bar rect, bar overlay rect and handle centre for the current handle position."""
+
+        contents_rect = self.contentsRect()
+        handle_radius = round(0.24 * contents_rect.height())
+
+        bar_height = 0.35 * contents_rect.height()
+        bar_rect = QtCore.QRectF(0, 0, contents_rect.width() - handle_radius, bar_height)
+        bar_rect.moveCenter(contents_rect.center())
+
+        # The handle moves along this line.
+        trail_length = contents_rect.width() - 2 * handle_radius
+        x_position = contents_rect.x() + handle_radius + trail_length * self._handle_position
+
+        bar_overlay = QtCore.QRectF(0, 0, x_position, bar_height)
+        bar_overlay.moveBottomLeft(bar_rect.bottomLeft())
+
+        return handle_radius, bar_rect, bar_overlay, QtCore.QPointF(x_position, bar_rect.center().y())
+
+    def _invalidate_layers_(self, *in_layers) -> None:
+        """Repaint only the area the given layers cover now and covered on the previous frame."""
+
+        handle_radius, _, bar_overlay, handle_center = self._get_geometry_()
+        region = QtGui.QRegion()
+        for layer in in_layers:
+
+            if layer == "handle":
+
+                rect = rendering.get_circle_rect(handle_center, handle_radius)
+
+            elif layer == "pulse":
+
+                rect = rendering.get_circle_rect(handle_center, self._pulse_radius)
+
+            else:
+
+                rect = bar_overlay.toAlignedRect().adjusted(-1, -1, 1, 1)
+
+            region = region.united(self._layer_regions.invalidate(layer, rect))
+
+        repaint.request_update(self, region)
 
-        if self._mouse_release_pulse_animation_group.state() == running:
+    # Qt Methods:
+    def hitButton(self, pos):
+
+        return self.contentsRect().contains(pos)
+
+    def sizeHint(self):
+
+        return QtCore.QSize(self._width, self._height)
+
+    def paintEvent(self, event):
+
+        handle_radius, bar_rect, bar_overlay, handle_center = self._get_geometry_()
+        rounding = bar_rect.height() / 2
+        theme = self._theme.theme
+        device_pixel_ratio = self.devicePixelRatioF()
+        # The static sprites are drawn one logical pixel in from their top left.
+        sprite_position = bar_rect.topLeft() - QtCore.QPointF(1, 1)
+
+        # Only the exposed region is repainted, layers outside of it are skipped.
+        exposed_region = event.region()
+        painter = QtGui.QPainter(self)
+        painter.setClipRegion(exposed_region)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, rendering.antialiasing_enabled())
+
+        if self._pulse_animation.is_running():
+
+            if exposed_region.intersects(rendering.get_circle_rect(handle_center, self._pulse_radius)):
+
+                color = theme.pulse_checked_color if self.isChecked() else theme.pulse_unchecked_color
+                rendering.draw_pulse(painter, handle_center, self._pulse_radius, color)
 
-            brush = QtGui.QBrush(self.mouse_release_pulse_color)
-            painter.setBrush(brush)
-            painter.drawEllipse(
-                self._mouse_release_location, self.mouse_release_pulse_radius, self.mouse_release_pulse_radius
+        if exposed_region.intersects(bar_rect.toAlignedRect().adjusted(-1, -1, 1, 1)):
+
+            painter.drawPixmap(
+                sprite_position,
+                rendering.pulse_sprite_cache.get_rounded_rect_sprite(
+                    bar_rect.size(), rounding, theme.bar_brush.color(), None, device_pixel_ratio
+                ),
+            )
+
+        overlay_bounds = bar_overlay.toAlignedRect().adjusted(-1, -1, 1, 1)
+        if exposed_region.intersects(overlay_bounds):
+
+            # The overlay is the full length track clipped to the handle, its
+            # rounded right end is always hidden under the handle.
+            painter.save()
+            painter.setClipRect(overlay_bounds, QtCore.Qt.IntersectClip)
+            painter.drawPixmap(
+                sprite_position,
+                rendering.pulse_sprite_cache.get_rounded_rect_sprite(
+                    bar_rect.size(),
+                    rounding,
+                    theme.bar_checked_brush.color(),
+                    theme.light_grey_pen.color(),
+                    device_pixel_ratio,
+                ),
             )
+            painter.restore()
+
+        if exposed_region.intersects(rendering.get_circle_rect(handle_center, handle_radius)):
+
+            painter.setPen(theme.light_grey_pen)
+            painter.setBrush(self._handle_color)
+            painter.drawEllipse(handle_center, handle_radius, handle_radius)
 
-        # if self._mouse_leave_pulse_animation_group.state() == running:
-
-        #     brush = QtGui.QBrush(self.mouse_leave_pulse_color)
-        #     painter.setBrush(brush)
-        #     painter.drawEllipse(
-        #         self._mouse_leave_location, self.mouse_leave_pulse_radius, self.mouse_leave_pulse_radius
-        #     )
-
-        if self.border_show_time > 0.0:
-            painter.setBrush(QtCore.Qt.transparent)
-            painter.setPen("black")
-            border_left = animations.lerp(contents_rect.center().x(), contents_rect.left(), self.border_show_time)
-            border_width = animations.lerp(0.0, contents_rect.width(), self.border_show_time)
-            border_rect = QtCore.QRectF(border_left, 0, border_width, contents_rect.height())
-            painter.drawRect(border_rect)
         painter.end()
+
+
+def create_push_buttons(in_texts, in_width: int, in_height: int, **kwargs) -> list:
+    """Create a PushButton for each text, ready to be added in one batch with Widget.addWidgets.
+
+    The buttons share the same theme handle and keyword arguments. They are
+    built unparented, so nothing is laid out or painted until they are added.
+
+    Args:
+        in_texts (iterable): The text of each button.
+        in_width (int): The width of each button.
+        in_height (int): The height of each button.
+        **kwargs: Passed to every PushButton.
+
+    Returns:
+        list: The new buttons, in the order of in_texts.
+    """
+
+    return [PushButton(text, in_width, in_height, **kwargs) for text in in_texts]
+
+
+def create_push_button_grid(
+    in_row_count: int, in_column_count: int, in_button_width: int, in_button_height: int, in_text="BUTTON", **kwargs
+) -> tuple:
+    """Create a Widget of rows, each a Widget of PushButtons, in one batch.
+
+    Each row is filled before it is added to the root, and every layout
+    runs a single pass once its children are added.
+
+    Args:
+        in_row_count (int): The number of rows.
+        in_column_count (int): The number of buttons in each row.
+        in_button_width (int): The width of each button.
+        in_button_height (int): The height of each button.
+        in_text (str): The text of every button.
+        **kwargs: Passed to every PushButton.
+
+    Returns:
+        tuple: The root Widget and a list of button rows.
+    """
+
+    row_width = in_button_width * in_column_count
+    root = Widget(row_width, in_button_height * in_row_count)
+    row_widgets = []
+    button_rows = []
+    for _ in range(in_row_count):
+
+        row_widget = Widget(row_width, in_button_height, in_layout=QtWidgets.QHBoxLayout)
+        buttons = create_push_buttons((in_text,) * in_column_count, in_button_width, in_button_height, **kwargs)
+        row_widget.addWidgets(buttons)
+        row_widgets.append(row_widget)
+        button_rows.append(buttons)
+
+    root.addWidgets(row_widgets)
+
+    return root, button_rows
@@ -3,7 +3,6 @@ import site
 
 from PySide2.QtWidgets import QApplication, QWidget, QVBoxLayout, QLabel
 from Qt import QtCore
-from animated_toggle import AnimatedToggle
 
 
 def __setup__():
@@ -15,17 +14,15 @@ def __setup__():
 
 
 __setup__()
+import nifty
+
 app = QApplication([])
 
 window = QWidget()
 
-mainToggle = AnimatedToggle()
-secondaryToggle = AnimatedToggle(
-    checked_color="#FFB000", pulse_checked_color="#44FFB000"
-)
-tripToggle = AnimatedToggle(
-    checked_color="green", pulse_checked_color="green"
-)
+mainToggle = nifty.AnimatedToggle()
+secondaryToggle = nifty.AnimatedToggle(in_checked_color="#FFB000")
+tripToggle = nifty.AnimatedToggle(in_checked_color="green")
 mainToggle.resize(QtCore.QSize(120, 60))
 mainToggle.setFixedHeight(50)
 secondaryToggle.resize(QtCore.QSize(120, 60))
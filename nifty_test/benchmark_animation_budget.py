@@ -0,0 +1,96 @@
+"""Sweeps a simulated mouse across a dense PushButton grid with and without an animation budget.
+
+The cursor enters a new button every frame and leaves the previous one, so
+each step starts an enter pulse and a trailing leave pulse. Reported per
+budget are the peak number of running animations, the time taken by the
+sweep, including every repaint, and how many animations the budget snapped
+to their end, by priority.
+"""
+import argparse
+import os
+import site
+import sys
+import time
+
+from Qt import QtCore
+from Qt import QtGui
+from Qt import QtWidgets
+
+
+def __setup__():
+
+    nifty_package_path = os.path.normpath(
+        os.path.join(__file__, os.path.pardir, os.path.pardir)
+    )
+    site.addsitedir(nifty_package_path)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def _sweep_(in_buttons, in_frame_seconds):
+    """Enter one button per frame, leaving the one before it, and return the peak running animation count."""
+
+    import nifty.animations as nifty_animations
+
+    center = QtCore.QPointF(10, 10)
+    peak_count = 0
+    previous_button = None
+    for button in in_buttons:
+
+        QtWidgets.QApplication.sendEvent(button, QtGui.QEnterEvent(center, center, center))
+        if previous_button is not None:
+
+            QtWidgets.QApplication.sendEvent(previous_button, QtCore.QEvent(QtCore.QEvent.Leave))
+
+        previous_button = button
+        end_time = time.perf_counter() + in_frame_seconds
+        while time.perf_counter() < end_time:
+            QtWidgets.QApplication.processEvents(QtCore.QEventLoop.AllEvents, 5)
+
+        peak_count = max(peak_count, nifty_animations.running_animation_count())
+
+    return peak_count
+
+
+def run(in_button_count, in_budgets, in_columns=40):
+
+    import nifty.animations as nifty_animations
+    import nifty.widgets as nifty
+
+    widget, button_rows = nifty.create_push_button_grid(
+        max(in_button_count // in_columns, 1), in_columns, 20, 20
+    )
+    widget.show(animate=False)
+    buttons = [button for row in button_rows for button in row]
+
+    print(f"{'budget':>8}{'peak':>8}{'sweep':>11}  evictions")
+    for budget in in_budgets:
+
+        nifty_animations.set_animation_budget(budget)
+        nifty_animations.reset_eviction_counts()
+        start_time = time.perf_counter()
+        peak_count = _sweep_(buttons, 1 / 60)
+        time_taken = time.perf_counter() - start_time
+        evictions = ", ".join(
+            f"{priority.name} {count}" for priority, count in nifty_animations.eviction_counts().items() if count
+        )
+        print(f"{str(budget):>8}{peak_count:>8}{time_taken:>10.3f}s  {evictions or '-'}")
+
+        # Let every pulse finish before the next budget is measured.
+        nifty_animations.set_animation_budget(None)
+        end_time = time.perf_counter() + 0.5
+        while time.perf_counter() < end_time:
+            QtWidgets.QApplication.processEvents(QtCore.QEventLoop.AllEvents, 5)
+
+
+if __name__ == "__main__":
+
+    __setup__()
+
+    parser = argparse.ArgumentParser(description="Compare mouse sweeps across a PushButton grid by animation budget.")
+    parser.add_argument("--count", type=int, default=400)
+    parser.add_argument("--budgets", type=int, nargs="+", default=(0, 32, 8))
+    arguments = parser.parse_args()
+
+    app = QtWidgets.QApplication(sys.argv)
+    # A budget of 0 on the command line means no budget.
+    run(arguments.count, [budget or None for budget in arguments.budgets])
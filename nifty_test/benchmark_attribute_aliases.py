@@ -0,0 +1,73 @@
+import os
+import re
+import site
+import sys
+
+from Qt import QtWidgets
+
+
+def __setup__():
+
+    nifty_package_path = os.path.normpath(
+        os.path.join(__file__, os.path.pardir, os.path.pardir)
+    )
+    site.addsitedir(nifty_package_path)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def _legacy_getattr_(in_widget, in_attribute_name):
+    """The uncached conversion _AnimatedMixin_.__getattr__ used to run on every miss.
+
+    Includes the failed normal lookup that has to raise before Python falls
+    back to __getattr__.
+    """
+
+    try:
+
+        return QtWidgets.QWidget.__getattribute__(in_widget, in_attribute_name)
+
+    except AttributeError:
+
+        pass
+
+    if "_" in in_attribute_name:
+
+        split = in_attribute_name.split("_")
+        pascal_case_attribute_name = "".join((word.title() for word in split[1:]))
+        pascal_case_attribute_name = f"{split[0]}{pascal_case_attribute_name}"
+
+        return QtWidgets.QWidget.__getattribute__(in_widget, pascal_case_attribute_name)
+
+    split = re.sub(r"([A-Z])", r" \1", in_attribute_name).split()
+    snake_case_attribute_name = "_".join(split).lower()
+
+    return QtWidgets.QWidget.__getattribute__(in_widget, snake_case_attribute_name)
+
+
+if __name__ == "__main__":
+
+    __setup__()
+
+    import nifty.widgets as nifty
+    import nifty.utilities as nifty_utils
+
+    app = QtWidgets.QApplication(sys.argv)
+    loop_count = 100000
+    widgets = (
+        nifty.Widget(100, 100),
+        nifty.MainWindow(100, 100),
+        nifty.PushButton("BUTTON", 100, 100),
+    )
+
+    print(f"{'class':<12}{'before (us)':>14}{'after (us)':>14}{'speedup':>10}")
+    for widget in widgets:
+
+        before = nifty_utils.time_per_call(
+            lambda: _legacy_getattr_(widget, "set_maximum_height")(100), in_loop_count=loop_count
+        )
+        after = nifty_utils.time_per_call(
+            lambda: widget.set_maximum_height(100), in_loop_count=loop_count
+        )
+        print(
+            f"{type(widget).__name__:<12}{before * 1e6:>14.3f}{after * 1e6:>14.3f}{before / after:>9.1f}x"
+        )
@@ -0,0 +1,76 @@
+import argparse
+import os
+import site
+import sys
+import time
+
+from Qt import QtWidgets
+
+
+def __setup__():
+
+    nifty_package_path = os.path.normpath(
+        os.path.join(__file__, os.path.pardir, os.path.pardir)
+    )
+    site.addsitedir(nifty_package_path)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def _build_loop_(in_row_count, in_column_count):
+    """Build the grid one widget at a time, as nifty_test.py does."""
+
+    import nifty.widgets as nifty
+
+    widget = nifty.Widget(in_column_count * 20, in_row_count * 20)
+    for _ in range(in_row_count):
+
+        sub_widget = nifty.Widget(in_column_count * 20, 20, in_layout=QtWidgets.QHBoxLayout)
+        for _ in range(in_column_count):
+            sub_widget.addWidget(nifty.PushButton("BUTTON", 20, 20))
+        widget.addWidget(sub_widget)
+
+    return widget
+
+
+def _build_bulk_(in_row_count, in_column_count):
+
+    import nifty.widgets as nifty
+
+    widget, _ = nifty.create_push_button_grid(in_row_count, in_column_count, 20, 20)
+
+    return widget
+
+
+def _measure_(in_build, in_row_count, in_column_count):
+    """Seconds to build the grid and run its pending layout work."""
+
+    start_time = time.perf_counter()
+    widget = in_build(in_row_count, in_column_count)
+    QtWidgets.QApplication.sendPostedEvents()
+    widget.layout().activate()
+    time_taken = time.perf_counter() - start_time
+
+    widget.deleteLater()
+    QtWidgets.QApplication.sendPostedEvents()
+
+    return time_taken
+
+
+if __name__ == "__main__":
+
+    __setup__()
+
+    parser = argparse.ArgumentParser(description="Compare building PushButton grids in a loop and in bulk.")
+    parser.add_argument("--counts", type=int, nargs="+", default=(1000, 10000))
+    parser.add_argument("--columns", type=int, default=50)
+    parser.add_argument("--repeats", type=int, default=3)
+    arguments = parser.parse_args()
+
+    app = QtWidgets.QApplication(sys.argv)
+    print(f"{'buttons':>8}{'loop':>12}{'bulk':>12}{'speed up':>10}")
+    for button_count in arguments.counts:
+
+        row_count = max(button_count // arguments.columns, 1)
+        loop_time = min(_measure_(_build_loop_, row_count, arguments.columns) for _ in range(arguments.repeats))
+        bulk_time = min(_measure_(_build_bulk_, row_count, arguments.columns) for _ in range(arguments.repeats))
+        print(f"{button_count:>8}{loop_time:>11.3f}s{bulk_time:>11.3f}s{loop_time / bulk_time:>9.2f}x")
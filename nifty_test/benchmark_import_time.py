@@ -0,0 +1,75 @@
+"""Measures the cold start cost of importing nifty.
+
+Each measurement runs in a fresh interpreter, so nothing is already cached
+in sys.modules, and the median of several runs is reported. Pass
+--importtime to also print Python's own per module breakdown.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+
+_STATEMENTS = {
+    "import nifty": "import nifty",
+    "nifty.Widget": "import nifty; nifty.Widget",
+    "nifty.lerp": "import nifty; nifty.lerp",
+    "import nifty.widgets": "import nifty.widgets",
+}
+
+_TIMER = (
+    "import time; _start_time = time.perf_counter(); {statement}; "
+    "print(time.perf_counter() - _start_time)"
+)
+
+
+def _get_environment_():
+
+    nifty_package_path = os.path.normpath(
+        os.path.join(__file__, os.path.pardir, os.path.pardir)
+    )
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(
+        path for path in (nifty_package_path, environment.get("PYTHONPATH")) if path
+    )
+
+    return environment
+
+
+def measure(in_statement, in_run_count):
+    """Get the median seconds taken by in_statement in a fresh interpreter."""
+
+    environment = _get_environment_()
+    timings = []
+    for _ in range(in_run_count):
+
+        output = subprocess.run(
+            (sys.executable, "-c", _TIMER.format(statement=in_statement)),
+            env=environment,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        timings.append(float(output))
+
+    return statistics.median(timings)
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Measure the cold start import cost of nifty.")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--importtime", action="store_true", help="Print python -X importtime for import nifty.widgets.")
+    arguments = parser.parse_args()
+
+    print(f"{'statement':<24}{'median':>12}")
+    for name, statement in _STATEMENTS.items():
+
+        print(f"{name:<24}{measure(statement, arguments.runs) * 1000:>9.2f} ms")
+
+    if arguments.importtime:
+
+        subprocess.run(
+            (sys.executable, "-X", "importtime", "-c", "import nifty.widgets"), env=_get_environment_(), check=True
+        )
@@ -0,0 +1,58 @@
+import os
+import random
+import site
+import sys
+
+from Qt import QtCore
+
+
+def __setup__():
+
+    nifty_package_path = os.path.normpath(
+        os.path.join(__file__, os.path.pardir, os.path.pardir)
+    )
+    site.addsitedir(nifty_package_path)
+
+
+def _evaluate_scalar_(in_starts, in_ends, in_progress, in_easing_curve):
+    """The per value path: one QEasingCurve and one lerp call per animation."""
+
+    import nifty.animations as nifty_anim
+
+    return [
+        nifty_anim.lerp(start, end, in_easing_curve.valueForProgress(progress))
+        for start, end, progress in zip(in_starts, in_ends, in_progress)
+    ]
+
+
+if __name__ == "__main__":
+
+    __setup__()
+
+    import nifty.animations as nifty_anim
+    import nifty.utilities as nifty_utils
+
+    if nifty_anim.numpy is None:
+
+        print("NumPy is not installed, the batch path falls back to pure Python.", file=sys.stderr)
+
+    easing_curve = QtCore.QEasingCurve(QtCore.QEasingCurve.InQuad)
+    print(f"{'animations':>10}{'scalar (us)':>14}{'batch (us)':>14}{'speedup':>10}")
+    for count in (100, 1000, 10000, 100000):
+
+        starts = [random.random() * 100 for _ in range(count)]
+        ends = [random.random() * 100 for _ in range(count)]
+        progress = [random.random() for _ in range(count)]
+        loop_count = max(100000 // count, 3)
+
+        scalar = nifty_utils.time_per_call(
+            _evaluate_scalar_, starts, ends, progress, easing_curve, in_loop_count=loop_count
+        )
+        if nifty_anim.numpy is not None:
+
+            starts, ends, progress = (nifty_anim.numpy.asarray(values) for values in (starts, ends, progress))
+
+        batch = nifty_utils.time_per_call(
+            nifty_anim.evaluate_batch, starts, ends, progress, in_loop_count=loop_count
+        )
+        print(f"{count:>10}{scalar * 1e6:>14.1f}{batch * 1e6:>14.1f}{scalar / batch:>9.1f}x")
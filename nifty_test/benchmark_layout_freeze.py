@@ -0,0 +1,112 @@
+"""Counts relayouts while the nifty_test.py scene plays its show animation.
+
+The scene is shown once with Widget.freeze_layout off and once with it on.
+Every LayoutRequest and every child Resize event received during the
+animation is counted, along with the number of frames painted.
+"""
+import argparse
+import os
+import site
+import sys
+import time
+
+from Qt import QtCore
+from Qt import QtWidgets
+
+
+def __setup__():
+
+    nifty_package_path = os.path.normpath(
+        os.path.join(__file__, os.path.pardir, os.path.pardir)
+    )
+    site.addsitedir(nifty_package_path)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+class _LayoutCounter_(QtCore.QObject):
+    """Counts the layout requests and resizes received by the descendants of a widget."""
+
+    def __init__(self, in_root):
+
+        super().__init__()
+        self._root = in_root
+        self.counts = {"layout_requests": 0, "child_resizes": 0, "frames": 0}
+
+    def eventFilter(self, in_object, in_event):
+
+        if not isinstance(in_object, QtWidgets.QWidget):
+            return False
+
+        event_type = in_event.type()
+        if event_type == QtCore.QEvent.UpdateRequest and in_object is self._root:
+            self.counts["frames"] += 1
+
+        elif self._root.isAncestorOf(in_object):
+            if event_type == QtCore.QEvent.LayoutRequest:
+                self.counts["layout_requests"] += 1
+
+            elif event_type == QtCore.QEvent.Resize:
+                self.counts["child_resizes"] += 1
+
+        return False
+
+
+def _build_scene_():
+    """The nested widget scene from nifty_test.py."""
+
+    import nifty.widgets as nifty
+
+    widget = nifty.Widget(500, 200, in_layout_direction=nifty.LayoutDirection.vertical)
+    for num in range(4):
+
+        sub_widget = nifty.Widget(500, 500, in_layout=QtWidgets.QHBoxLayout)
+        for sub_num in range(4):
+            button = nifty.PushButton("BUTTON", 100, 100, in_layout_direction=nifty.LayoutDirection.vertical)
+            button.setMinimumHeight(30)
+            sub_widget.addWidget(button)
+        widget.addWidget(sub_widget)
+
+    return widget
+
+
+def run(in_freeze_layout, in_timeout):
+
+    widget = _build_scene_()
+    widget.freeze_layout = in_freeze_layout
+
+    shown = []
+    widget.shown.connect(lambda: shown.append(True))
+    counter = _LayoutCounter_(widget)
+    QtWidgets.QApplication.instance().installEventFilter(counter)
+
+    start_time = time.perf_counter()
+    widget.show(animate=True)
+    while not shown and time.perf_counter() - start_time < in_timeout:
+        QtWidgets.QApplication.processEvents(QtCore.QEventLoop.AllEvents, 5)
+
+    time_taken = time.perf_counter() - start_time
+    QtWidgets.QApplication.instance().removeEventFilter(counter)
+    widget.hide()
+    widget.deleteLater()
+    QtWidgets.QApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+
+    return counter.counts, time_taken
+
+
+if __name__ == "__main__":
+
+    __setup__()
+
+    parser = argparse.ArgumentParser(description="Count relayouts during the nifty_test.py show animation.")
+    parser.add_argument("--timeout", type=float, default=5.0)
+    arguments = parser.parse_args()
+
+    app = QtWidgets.QApplication(sys.argv)
+    print(f"{'freeze_layout':<15}{'layout requests':>17}{'child resizes':>15}{'frames':>8}{'time':>10}")
+    for freeze_layout in (False, True):
+
+        counts, time_taken = run(freeze_layout, arguments.timeout)
+        print(
+            f"{str(freeze_layout):<15}{counts['layout_requests']:>17}{counts['child_resizes']:>15}"
+            f"{counts['frames']:>8}{time_taken:>9.3f}s"
+        )
@@ -0,0 +1,61 @@
+import os
+import site
+
+from Qt import QtWidgets
+
+
+def __setup__():
+
+    nifty_package_path = os.path.normpath(
+        os.path.join(__file__, os.path.pardir, os.path.pardir)
+    )
+    site.addsitedir(nifty_package_path)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def _build_grid_(in_button_class, in_button_count, in_columns=50):
+
+    import nifty.widgets as nifty
+
+    widget = nifty.Widget(1000, 1000, in_layout=QtWidgets.QGridLayout)
+    for index in range(in_button_count):
+
+        button = in_button_class("BUTTON", 20, 20)
+        widget.layout().addWidget(button, index // in_columns, index % in_columns)
+
+    return widget
+
+
+def _build_eager_(in_button_count):
+
+    import nifty.widgets as nifty
+
+    class EagerPushButton(nifty.PushButton):
+
+        def __init__(self, *args, **kwargs):
+
+            super().__init__(*args, **kwargs)
+            self._setup_animation()
+
+    return _build_grid_(EagerPushButton, in_button_count)
+
+
+def _build_lazy_(in_button_count):
+
+    import nifty.widgets as nifty
+
+    return _build_grid_(nifty.PushButton, in_button_count)
+
+
+if __name__ == "__main__":
+
+    __setup__()
+
+    import benchmark_utilities
+
+    benchmark_utilities.run_mode_benchmark(
+        "Compare eager and lazy PushButton animation setup.",
+        {"eager": _build_eager_, "lazy": _build_lazy_},
+        in_default_count=5000,
+        in_count_title="buttons",
+    )
@@ -0,0 +1,122 @@
+"""Measures the startup cost of PushButton pulse atlases with a cold and a warm disk cache.
+
+Each run is a fresh interpreter. The cold run starts with an empty cache
+directory and renders every atlas on the thread pool, the warm runs
+memory-map the atlases written by it. Columns are the time the GUI thread
+spends queueing or mapping atlases, the time until every atlas is ready, and
+the cost of one pulse frame drawn from an atlas and from the sprite cache.
+"""
+import argparse
+import os
+import site
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def __setup__():
+
+    nifty_package_path = os.path.normpath(
+        os.path.join(__file__, os.path.pardir, os.path.pardir)
+    )
+    site.addsitedir(nifty_package_path)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def _measure_frame_(in_draw, in_full_radius, in_frame_count=64):
+    """Average seconds to draw one frame of a pulse sweeping from 0 to in_full_radius."""
+
+    from Qt import QtCore
+    from Qt import QtGui
+
+    size = int(in_full_radius)
+    target = QtGui.QImage(size, size, QtGui.QImage.Format_ARGB32_Premultiplied)
+    target.fill(QtCore.Qt.transparent)
+    painter = QtGui.QPainter(target)
+    center = QtCore.QPointF(size / 2, size / 2)
+    start_time = time.perf_counter()
+    for index in range(1, in_frame_count + 1):
+
+        in_draw(painter, center, in_full_radius * index / in_frame_count)
+
+    time_taken = time.perf_counter() - start_time
+    painter.end()
+
+    return time_taken / in_frame_count
+
+
+def _run_(in_cache_directory, in_sizes):
+    """Prerender the pulses of one button per size in this process and print the timings."""
+
+    from Qt import QtWidgets
+    import nifty.atlases as nifty_atlases
+    import nifty.rendering as nifty_rendering
+    import nifty.widgets as nifty
+
+    app = QtWidgets.QApplication(sys.argv)
+    atlas_cache = nifty_atlases.enable_pulse_atlases(in_cache_directory=in_cache_directory)
+    buttons = [nifty.PushButton("BUTTON", size, size) for size in in_sizes]
+    for button, size in zip(buttons, in_sizes):
+
+        button.resize(size, size)
+
+    start_time = time.perf_counter()
+    for button in buttons:
+
+        button.prerender_pulses()
+
+    queue_time = time.perf_counter() - start_time
+    atlas_cache.wait_for_pending()
+    ready_time = time.perf_counter() - start_time
+
+    color_at_zero, color_at_full = buttons[-1]._get_pulse_ramp_("mouse_enter")
+    full_radius = buttons[-1]._get_pulse_diameter_()
+    atlas = atlas_cache.get_atlas(full_radius, color_at_zero, color_at_full)
+    atlas_time = _measure_frame_(atlas.draw, full_radius)
+    sprite_time = _measure_frame_(
+        lambda in_painter, in_center, in_radius: nifty_rendering.draw_pulse(
+            in_painter, in_center, in_radius, color_at_full
+        ),
+        full_radius,
+    )
+
+    statistics = atlas_cache.statistics()
+    print(
+        f"{queue_time * 1000:>9.2f}ms{ready_time * 1000:>9.2f}ms"
+        f"{statistics['renders']:>9}{statistics['disk_loads']:>7}"
+        f"{atlas_time * 1e6:>9.1f}us{sprite_time * 1e6:>9.1f}us"
+    )
+
+    return app
+
+
+if __name__ == "__main__":
+
+    __setup__()
+
+    parser = argparse.ArgumentParser(description="Benchmark pulse atlases with a cold and a warm disk cache.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=(20, 50, 100, 200))
+    parser.add_argument("--warm-runs", type=int, default=3)
+    parser.add_argument("--run", metavar="CACHE_DIRECTORY", help=argparse.SUPPRESS)
+    arguments = parser.parse_args()
+
+    if arguments.run:
+
+        _run_(arguments.run, arguments.sizes)
+
+    else:
+
+        with tempfile.TemporaryDirectory() as directory:
+
+            print(f"{len(arguments.sizes) * 3} atlases")
+            print(
+                f"{'cache':<6}{'queue':>11}{'ready':>11}{'renders':>9}{'loads':>7}{'atlas':>11}{'sprite':>11}"
+            )
+            for cache in ("cold",) + ("warm",) * arguments.warm_runs:
+
+                print(f"{cache:<6}", end="", flush=True)
+                subprocess.run(
+                    (sys.executable, __file__, "--run", directory, "--sizes", *map(str, arguments.sizes)),
+                    check=True,
+                )
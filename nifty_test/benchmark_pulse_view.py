@@ -0,0 +1,66 @@
+import os
+import site
+
+from Qt import QtCore
+from Qt import QtGui
+from Qt import QtWidgets
+
+
+def __setup__():
+
+    nifty_package_path = os.path.normpath(
+        os.path.join(__file__, os.path.pardir, os.path.pardir)
+    )
+    site.addsitedir(nifty_package_path)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def _build_widgets_(in_button_count, in_columns=50):
+
+    import nifty.widgets as nifty
+
+    widget = nifty.Widget(1000, 1000, in_layout=QtWidgets.QGridLayout)
+    for index in range(in_button_count):
+
+        button = nifty.PushButton("BUTTON", 20, 20)
+        widget.layout().addWidget(button, index // in_columns, index % in_columns)
+
+    return widget
+
+
+def _build_view_(in_button_count):
+
+    import nifty.views as nifty_views
+
+    view = nifty_views.PulseButtonView(in_item_size=QtCore.QSize(20, 20))
+    view.setModel(QtCore.QStringListModel(["BUTTON"] * in_button_count, view))
+
+    return view
+
+
+def _report_(in_mode, in_button_count, in_widget):
+    """Time one full frame of the built buttons."""
+
+    import nifty.utilities as nifty_utils
+
+    in_widget.resize(1000, 1000)
+    image = QtGui.QImage(in_widget.size(), QtGui.QImage.Format_ARGB32_Premultiplied)
+    seconds_per_frame = nifty_utils.time_per_call(in_widget.render, image, in_loop_count=20)
+
+    return (f"{seconds_per_frame * 1000:.2f} ms",)
+
+
+if __name__ == "__main__":
+
+    __setup__()
+
+    import benchmark_utilities
+
+    benchmark_utilities.run_mode_benchmark(
+        "Compare PushButton widgets with a delegate drawn PulseButtonView.",
+        {"widgets": _build_widgets_, "view": _build_view_},
+        in_default_count=20000,
+        in_count_title="buttons",
+        in_report=_report_,
+        in_report_columns=(("frame", 15),),
+    )
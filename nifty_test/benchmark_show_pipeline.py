@@ -0,0 +1,104 @@
+"""Measures time to interactive of the nifty_test.py scene, shown on first paint and after a fixed delay.
+
+Reported per mode are the time until the root show animation starts, until
+it finishes, and until every PushButton border reveal has finished, which is
+when the window has fully settled. The fixed mode passes delay_animation=50,
+the delay show used before animations started from the first paint.
+"""
+import argparse
+import os
+import site
+import sys
+import time
+
+from Qt import QtCore
+from Qt import QtWidgets
+
+
+def __setup__():
+
+    nifty_package_path = os.path.normpath(
+        os.path.join(__file__, os.path.pardir, os.path.pardir)
+    )
+    site.addsitedir(nifty_package_path)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def _build_scene_():
+
+    import nifty.widgets as nifty
+
+    widget = nifty.Widget(500, 500)
+    buttons = []
+    for _ in range(4):
+
+        sub_widget = nifty.Widget(500, 500, in_layout=QtWidgets.QHBoxLayout)
+        for _ in range(4):
+            button = nifty.PushButton("BUTTON", 100, 100, in_layout_direction=nifty.LayoutDirection.vertical)
+            button.setMinimumHeight(30)
+            sub_widget.addWidget(button)
+            buttons.append(button)
+        widget.addWidget(sub_widget)
+
+    return widget, buttons
+
+
+def run(in_delay, in_show_mode, in_timeout):
+    """Show the scene, returning the seconds until its animation started, finished and every border settled."""
+
+    import nifty.widgets as nifty
+
+    widget, buttons = _build_scene_()
+    widget.set_show_mode(in_show_mode)
+    timings = {}
+
+    start_time = time.perf_counter()
+    operation = widget.show(animate=True, delay_animation=in_delay)
+    widget._get_show_animation_().started.connect(
+        lambda: timings.setdefault("started", time.perf_counter() - start_time)
+    )
+    if in_show_mode != nifty.ShowMode.resize:
+
+        widget._snapshot_overlay.reveal_animation.started.connect(
+            lambda: timings.setdefault("started", time.perf_counter() - start_time)
+        )
+
+    operation.then(lambda: timings.setdefault("shown", time.perf_counter() - start_time))
+    while time.perf_counter() - start_time < in_timeout:
+
+        QtWidgets.QApplication.processEvents(QtCore.QEventLoop.AllEvents, 5)
+        if "shown" in timings and all(button.border_show_time >= 1.0 for button in buttons):
+
+            timings["settled"] = time.perf_counter() - start_time
+            break
+
+    widget.hide()
+    widget.deleteLater()
+    QtWidgets.QApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+
+    return timings
+
+
+if __name__ == "__main__":
+
+    __setup__()
+
+    parser = argparse.ArgumentParser(description="Compare time to interactive of first paint and fixed delay shows.")
+    parser.add_argument("--timeout", type=float, default=5.0)
+    parser.add_argument("--show-mode", default="resize", choices=("resize", "clip", "scale"))
+    arguments = parser.parse_args()
+
+    app = QtWidgets.QApplication(sys.argv)
+    import nifty.widgets as nifty
+
+    print(f"{'start':<12}{'started':>10}{'shown':>10}{'settled':>10}")
+    for name, delay in (("first paint", None), ("fixed 50ms", 50)):
+
+        timings = run(delay, nifty.ShowMode[arguments.show_mode], arguments.timeout)
+        print(
+            f"{name:<12}"
+            + "".join(
+                f"{timings[key] * 1000:>8.1f}ms" if key in timings else f"{'-':>10}"
+                for key in ("started", "shown", "settled")
+            )
+        )
@@ -0,0 +1,105 @@
+"""Measures startup time of a 2,000 widget spec with a cold and a warm plan cache.
+
+Each run is a fresh interpreter. The cold run starts with an empty cache
+directory and compiles the spec, the warm runs load the plan cached by it.
+"""
+import argparse
+import json
+import os
+import site
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def __setup__():
+
+    nifty_package_path = os.path.normpath(
+        os.path.join(__file__, os.path.pardir, os.path.pardir)
+    )
+    site.addsitedir(nifty_package_path)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def write_spec(in_path, in_widget_count, in_columns=50):
+    """Write a spec of rows of PushButtons, spelt out in full rather than with repeat."""
+
+    row_count = max(in_widget_count // (in_columns + 1), 1)
+    rows = [
+        {
+            "type": "Widget",
+            "width": in_columns * 20,
+            "height": 20,
+            "layout": "horizontal",
+            "children": [
+                {
+                    "type": "PushButton",
+                    "text": f"BUTTON {row_number}.{column_number}",
+                    "width": 20,
+                    "height": 20,
+                    "layout_direction": "vertical",
+                    "properties": {"minimum_height": 20},
+                }
+                for column_number in range(in_columns)
+            ],
+        }
+        for row_number in range(row_count)
+    ]
+    spec = {"type": "Widget", "width": in_columns * 20, "height": row_count * 20, "children": rows}
+    with open(in_path, "w") as spec_file:
+        json.dump(spec, spec_file, indent=4)
+
+    return 1 + row_count * (in_columns + 1)
+
+
+def _run_(in_spec_path, in_cache_directory):
+    """Load the spec in this process and print the time taken by each step."""
+
+    start_time = time.perf_counter()
+    from Qt import QtWidgets
+    import nifty.loader as nifty_loader
+
+    app = QtWidgets.QApplication(sys.argv)
+    import_time = time.perf_counter()
+    plan = nifty_loader.load_plan(in_spec_path, in_cache_directory)
+    plan_time = time.perf_counter()
+    widget = nifty_loader.build_plan(plan)
+    build_time = time.perf_counter()
+
+    print(
+        f"{import_time - start_time:>10.3f}s{plan_time - import_time:>10.3f}s"
+        f"{build_time - plan_time:>10.3f}s{build_time - start_time:>10.3f}s"
+    )
+
+    return widget, app
+
+
+if __name__ == "__main__":
+
+    __setup__()
+
+    parser = argparse.ArgumentParser(description="Benchmark loading a spec with a cold and a warm plan cache.")
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--warm-runs", type=int, default=3)
+    parser.add_argument("--run", nargs=2, metavar=("SPEC", "CACHE_DIRECTORY"), help=argparse.SUPPRESS)
+    arguments = parser.parse_args()
+
+    if arguments.run:
+
+        _run_(*arguments.run)
+
+    else:
+
+        with tempfile.TemporaryDirectory() as directory:
+
+            spec_path = os.path.join(directory, "spec.json")
+            cache_directory = os.path.join(directory, "cache")
+            widget_count = write_spec(spec_path, arguments.count)
+
+            print(f"{widget_count} widgets")
+            print(f"{'cache':<6}{'import':>11}{'plan':>11}{'build':>11}{'total':>11}")
+            for cache in ("cold",) + ("warm",) * arguments.warm_runs:
+
+                print(f"{cache:<6}", end="", flush=True)
+                subprocess.run((sys.executable, __file__, "--run", spec_path, cache_directory), check=True)
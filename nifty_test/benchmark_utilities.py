@@ -0,0 +1,104 @@
+"""Shared scaffolding for benchmarks that compare ways of building the same scene.
+
+Each mode is built in a fresh interpreter, so resident memory is comparable
+between them. A benchmark supplies only its scenario, how to build a mode
+and, optionally, extra columns to report about what was built:
+
+    run_mode_benchmark("Compare A and B.", {"a": _build_a_, "b": _build_b_}, in_default_count=1000)
+"""
+import argparse
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from Qt import QtWidgets
+
+
+def measure_build(in_build, *args):
+    """Call in_build with args, measuring the time and memory it takes.
+
+    Args:
+        in_build (callable): Builds the scene and returns its root.
+        args: Passed on to in_build.
+
+    Returns:
+        tuple: The root, the seconds taken, the peak Python memory in bytes
+            and the resident memory growth in bytes, None where unsupported.
+    """
+
+    import nifty.utilities as nifty_utils
+
+    memory_before = nifty_utils.get_resident_memory()
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    root = in_build(*args)
+    time_taken = time.perf_counter() - start_time
+    _, python_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    memory_after = nifty_utils.get_resident_memory()
+
+    resident = None if memory_before is None else memory_after - memory_before
+
+    return root, time_taken, python_peak, resident
+
+
+def run_mode_benchmark(
+    in_description,
+    in_builds,
+    in_default_count,
+    in_count_title="count",
+    in_report=None,
+    in_report_columns=(),
+):
+    """Parse the command line, then build every mode in its own process and print one row per mode.
+
+    Args:
+        in_description (str): The description of the command line.
+        in_builds (dict): Mode name -> callable building the scene from a count and returning its root.
+        in_default_count (int): The count used when --count is not given.
+        in_count_title (str): The title of the count column.
+        in_report (callable): Called with the mode, count and root once built,
+            returning one string per column of in_report_columns.
+        in_report_columns (tuple): The (title, width) of each extra column.
+
+    Returns:
+        None
+    """
+
+    parser = argparse.ArgumentParser(description=in_description)
+    parser.add_argument("--count", type=int, default=in_default_count)
+    parser.add_argument("--mode", choices=tuple(in_builds))
+    arguments = parser.parse_args()
+
+    if arguments.mode:
+
+        _run_mode_(arguments.mode, arguments.count, in_builds[arguments.mode], in_report, in_report_columns)
+
+        return
+
+    print(
+        f"{'mode':<8}{in_count_title:>8}{'build time':>13}{'python peak':>18}{'resident':>14}"
+        + "".join(f"{title:>{width}}" for title, width in in_report_columns)
+    )
+    for mode in in_builds:
+
+        subprocess.run(
+            (sys.executable, sys.argv[0], "--mode", mode, "--count", str(arguments.count)), check=True
+        )
+
+
+def _run_mode_(in_mode, in_count, in_build, in_report, in_report_columns):
+    """Build one mode in this process and print its row."""
+
+    app = QtWidgets.QApplication(sys.argv)
+    root, time_taken, python_peak, resident = measure_build(in_build, in_count)
+    report = () if in_report is None else in_report(in_mode, in_count, root)
+
+    resident = "n/a" if resident is None else f"{resident / 2 ** 20:.1f} MiB"
+    print(
+        f"{in_mode:<8}{in_count:>8}{time_taken:>12.3f}s{python_peak / 2 ** 20:>14.1f} MiB{resident:>14}"
+        + "".join(f"{value:>{width}}" for value, (_, width) in zip(report, in_report_columns))
+    )
+
+    return root, app
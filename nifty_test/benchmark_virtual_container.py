@@ -0,0 +1,63 @@
+import os
+import site
+
+from Qt import QtCore
+from Qt import QtWidgets
+
+
+def __setup__():
+
+    nifty_package_path = os.path.normpath(
+        os.path.join(__file__, os.path.pardir, os.path.pardir)
+    )
+    site.addsitedir(nifty_package_path)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def _get_entries_(in_entry_count):
+
+    return [f"ENTRY {index}" for index in range(in_entry_count)]
+
+
+def _build_plain_(in_entry_count):
+
+    import nifty.widgets as nifty
+
+    widget = nifty.Widget(300, 600)
+    for entry in _get_entries_(in_entry_count):
+
+        widget.addWidget(nifty.PushButton(entry, 300, 30))
+
+    return widget
+
+
+def _build_virtual_(in_entry_count):
+
+    import nifty.containers as nifty_containers
+
+    widget = nifty_containers.VirtualWidget(300, 600, QtCore.QStringListModel(_get_entries_(in_entry_count)))
+    widget.resize(300, 600)
+
+    return widget
+
+
+def _report_(in_mode, in_entry_count, in_widget):
+    """Count the buttons actually built for the entries."""
+
+    return (str(len(in_widget.findChildren(QtWidgets.QPushButton))),)
+
+
+if __name__ == "__main__":
+
+    __setup__()
+
+    import benchmark_utilities
+
+    benchmark_utilities.run_mode_benchmark(
+        "Compare a plain Widget panel with a VirtualWidget.",
+        {"plain": _build_plain_, "virtual": _build_virtual_},
+        in_default_count=10000,
+        in_count_title="entries",
+        in_report=_report_,
+        in_report_columns=(("buttons", 9),),
+    )
@@ -0,0 +1,309 @@
+"""Headless benchmark suite for nifty widgets.
+
+Runs under the offscreen Qt platform and measures construction cost, paint
+cost per frame, sustained frames per second and pulse sprite cache hit rate
+with many animating buttons, a panel of toggles flipped at once and memory
+per widget. Results are written as JSON and can be compared against a
+stored baseline:
+
+    python benchmarks.py --output results.json
+    python benchmarks.py --baseline results.json --tolerance 0.15
+"""
+import argparse
+import json
+import os
+import platform
+import site
+import sys
+import time
+import tracemalloc
+
+from Qt import QtCore
+from Qt import QtGui
+from Qt import QtWidgets
+
+
+# Metrics where a larger value is better, everything else is a cost.
+_HIGHER_IS_BETTER = ("fps", "hit_rate")
+
+
+def __setup__():
+
+    nifty_package_path = os.path.normpath(
+        os.path.join(__file__, os.path.pardir, os.path.pardir)
+    )
+    site.addsitedir(nifty_package_path)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def _get_widget_factories_():
+
+    import nifty.widgets as nifty
+
+    return {
+        "Widget": lambda: nifty.Widget(100, 100),
+        "MainWindow": lambda: nifty.MainWindow(100, 100),
+        "PushButton": lambda: nifty.PushButton("BUTTON", 100, 100),
+        "AnimatedToggle": lambda: nifty.AnimatedToggle(),
+    }
+
+
+def benchmark_construction(in_count):
+    """Construction time and memory per widget for each nifty widget class."""
+
+    import nifty.utilities as nifty_utils
+
+    results = {}
+    for name, factory in _get_widget_factories_().items():
+
+        memory_before = nifty_utils.get_resident_memory()
+        tracemalloc.start()
+        start_time = time.perf_counter()
+        widgets = [factory() for _ in range(in_count)]
+        time_taken = time.perf_counter() - start_time
+        python_memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        memory_after = nifty_utils.get_resident_memory()
+
+        results[f"construction.{name}.seconds_per_widget"] = time_taken / in_count
+        results[f"memory.{name}.python_bytes_per_widget"] = python_memory / in_count
+        if memory_before is not None:
+            results[f"memory.{name}.resident_bytes_per_widget"] = (memory_after - memory_before) / in_count
+
+        for widget in widgets:
+            widget.deleteLater()
+
+        QtWidgets.QApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+
+    return results
+
+
+def benchmark_paint(in_sizes, in_frame_count):
+    """paintEvent cost per frame, with the pulses mid animation, at several sizes."""
+
+    import nifty.utilities as nifty_utils
+    import nifty.widgets as nifty
+
+    results = {}
+    for size in in_sizes:
+
+        button = nifty.PushButton("BUTTON", size, size)
+        button.resize(size, size)
+        button._mouse_enter_location = QtCore.QPoint(size // 2, size // 2)
+        button.mouse_enter_pulse_radius = size / 2
+        button.border_show_time = 1.0
+
+        toggle = nifty.AnimatedToggle()
+        toggle.resize(size * 2, size)
+        toggle.handle_position = 0.5
+
+        for name, widget in (("PushButton", button), ("AnimatedToggle", toggle)):
+
+            image = QtGui.QImage(widget.size(), QtGui.QImage.Format_ARGB32_Premultiplied)
+            seconds_per_frame = nifty_utils.time_per_call(widget.render, image, in_loop_count=in_frame_count)
+            results[f"paint.{name}.{size}px.seconds_per_frame"] = seconds_per_frame
+
+    return results
+
+
+class _FrameCounter_(QtCore.QObject):
+    """Counts the frames a top level window is asked to paint."""
+
+    def __init__(self):
+
+        super().__init__()
+        self.frame_count = 0
+
+    def eventFilter(self, in_object, in_event):
+
+        if in_event.type() == QtCore.QEvent.UpdateRequest:
+            self.frame_count += 1
+
+        return False
+
+
+def benchmark_animation_throughput(in_button_counts, in_seconds):
+    """Sustained frames per second, and pulse sprite hit rate, while N buttons play their enter pulse back to back."""
+
+    import nifty.rendering as nifty_rendering
+    import nifty.widgets as nifty
+
+    results = {}
+    for button_count in in_button_counts:
+
+        columns = max(int(button_count ** 0.5), 1)
+        window = nifty.Widget(columns * 40, columns * 40, in_layout=QtWidgets.QGridLayout)
+        buttons = []
+        for index in range(button_count):
+
+            button = nifty.PushButton("BUTTON", 40, 40)
+            window.layout().addWidget(button, index // columns, index % columns)
+            buttons.append(button)
+
+        window.show(animate=False)
+        QtWidgets.QApplication.processEvents()
+
+        frame_counter = _FrameCounter_()
+        window.installEventFilter(frame_counter)
+        for button in buttons:
+
+            button._play_mouse_enter_animation_()
+            # Keep every pulse animating for the whole measurement.
+            button._get_pulse_animation_("mouse_enter")[2].finished.connect(button._play_mouse_enter_animation_)
+
+        nifty_rendering.pulse_sprite_cache.reset_statistics()
+        end_time = time.perf_counter() + in_seconds
+        start_time = time.perf_counter()
+        while time.perf_counter() < end_time:
+            QtWidgets.QApplication.processEvents(QtCore.QEventLoop.AllEvents, 5)
+
+        results[f"animation.{button_count}_buttons.fps"] = frame_counter.frame_count / (time.perf_counter() - start_time)
+        results[f"animation.{button_count}_buttons.sprite_hit_rate"] = (
+            nifty_rendering.pulse_sprite_cache.statistics()["hit_rate"]
+        )
+
+        window.removeEventFilter(frame_counter)
+        for button in buttons:
+            button._get_pulse_animation_("mouse_enter")[2].finished.disconnect(button._play_mouse_enter_animation_)
+            button._get_pulse_animation_("mouse_enter")[2].stop()
+
+        window.hide()
+        window.deleteLater()
+        QtWidgets.QApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+
+    return results
+
+
+def benchmark_toggle_flip(in_toggle_count, in_flip_count):
+    """Frames per second and time per flip while N toggles follow a main toggle, as in app.py."""
+
+    import nifty.rendering as nifty_rendering
+    import nifty.widgets as nifty
+
+    columns = max(int(in_toggle_count ** 0.5), 1)
+    window = nifty.Widget(columns * 60, columns * 30, in_layout=QtWidgets.QGridLayout)
+    main_toggle = nifty.AnimatedToggle(60, 30)
+    toggles = [nifty.AnimatedToggle(60, 30) for _ in range(in_toggle_count)]
+    window.addWidgets(toggles, in_column_count=columns)
+    for toggle in toggles:
+        main_toggle.stateChanged.connect(toggle.setChecked)
+
+    window.show(animate=False)
+    QtWidgets.QApplication.processEvents()
+
+    frame_counter = _FrameCounter_()
+    window.installEventFilter(frame_counter)
+    nifty_rendering.pulse_sprite_cache.reset_statistics()
+    signal_seconds = 0.0
+    start_time = time.perf_counter()
+    for _ in range(in_flip_count):
+
+        flip_start_time = time.perf_counter()
+        main_toggle.setChecked(not main_toggle.isChecked())
+        signal_seconds += time.perf_counter() - flip_start_time
+        # Let every toggle finish its handle and pulse animations.
+        end_time = time.perf_counter() + 0.35
+        while time.perf_counter() < end_time:
+            QtWidgets.QApplication.processEvents(QtCore.QEventLoop.AllEvents, 5)
+
+    time_taken = time.perf_counter() - start_time
+    window.removeEventFilter(frame_counter)
+    sprite_statistics = nifty_rendering.pulse_sprite_cache.statistics()
+
+    window.hide()
+    window.deleteLater()
+    main_toggle.deleteLater()
+    QtWidgets.QApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+
+    return {
+        f"toggle.{in_toggle_count}_toggles.fps": frame_counter.frame_count / time_taken,
+        f"toggle.{in_toggle_count}_toggles.seconds_per_flip_signal": signal_seconds / in_flip_count,
+        f"toggle.{in_toggle_count}_toggles.sprite_misses": sprite_statistics["misses"],
+        f"toggle.{in_toggle_count}_toggles.sprite_hit_rate": sprite_statistics["hit_rate"],
+    }
+
+
+def compare_to_baseline(in_results, in_baseline, in_tolerance):
+    """Compare results to a baseline, returning the metrics that regressed by more than in_tolerance."""
+
+    regressions = []
+    for name, value in sorted(in_results.items()):
+
+        baseline_value = in_baseline.get(name)
+        if not baseline_value:
+            continue
+
+        change = (value - baseline_value) / baseline_value
+        if name.endswith(_HIGHER_IS_BETTER):
+            change = -change
+
+        print(f"{name:<60}{baseline_value:>14.6g}{value:>14.6g}{change:>+10.1%}")
+        if change > in_tolerance:
+            regressions.append(name)
+
+    return regressions
+
+
+def run(in_arguments):
+
+    import nifty.rendering as nifty_rendering
+    import nifty.repaint as nifty_repaint
+
+    results = {}
+    results.update(benchmark_construction(in_arguments.construction_count))
+    results.update(benchmark_paint(in_arguments.paint_sizes, in_arguments.frame_count))
+    results.update(benchmark_animation_throughput(in_arguments.button_counts, in_arguments.seconds))
+    results.update(benchmark_toggle_flip(in_arguments.toggle_count, in_arguments.flip_count))
+
+    return {
+        "metadata": {
+            "timestamp": time.time(),
+            "python": sys.version,
+            "platform": platform.platform(),
+            "qt_platform": os.environ.get("QT_QPA_PLATFORM"),
+            "repaint": nifty_repaint.statistics(),
+            "sprite_cache": nifty_rendering.pulse_sprite_cache.statistics(),
+        },
+        "results": results,
+    }
+
+
+if __name__ == "__main__":
+
+    __setup__()
+
+    parser = argparse.ArgumentParser(description="Run the nifty widget benchmark suite.")
+    parser.add_argument("--construction-count", type=int, default=500)
+    parser.add_argument("--paint-sizes", type=int, nargs="+", default=(50, 100, 200, 400))
+    parser.add_argument("--frame-count", type=int, default=200)
+    parser.add_argument("--button-counts", type=int, nargs="+", default=(100, 1000))
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--toggle-count", type=int, default=500)
+    parser.add_argument("--flip-count", type=int, default=6)
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    parser.add_argument("--baseline", help="Compare the results to this JSON file.")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Allowed regression, as a fraction.")
+    arguments = parser.parse_args()
+
+    app = QtWidgets.QApplication(sys.argv)
+    report = run(arguments)
+
+    if arguments.output:
+        with open(arguments.output, "w") as output_file:
+            json.dump(report, output_file, indent=4, sort_keys=True)
+
+    if arguments.baseline:
+        with open(arguments.baseline) as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+
+        print(f"{'metric':<60}{'baseline':>14}{'current':>14}{'change':>10}")
+        regressions = compare_to_baseline(report["results"], baseline, arguments.tolerance)
+        if regressions:
+            print(f"{len(regressions)} metric(s) regressed by more than {arguments.tolerance:.0%}:")
+            for name in regressions:
+                print(f"    {name}")
+
+            sys.exit(1)
+
+    elif not arguments.output:
+        print(json.dumps(report, indent=4, sort_keys=True))
@@ -0,0 +1,21 @@
+import os
+import sys
+
+import pytest
+
+
+# The tests import nifty from this checkout, the same as the scripts' __setup__.
+sys.path.insert(0, os.path.normpath(os.path.join(__file__, os.path.pardir, os.path.pardir)))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# The demo script matches pytest's *_test.py pattern, it is not a test module.
+collect_ignore = ["nifty_test.py"]
+
+
+@pytest.fixture(scope="session")
+def app():
+
+    pytest.importorskip("Qt")
+    from Qt import QtWidgets
+
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
@@ -21,6 +21,7 @@ if __name__ == "__main__":
     import nifty.widgets as nifty
     import nifty.utilities as nifty_utils
     import nifty.animations as nifty_anim
+    import nifty.profiling as nifty_profiling
 
     app = QtWidgets.QApplication(sys.argv)
     # widget = nifty_utils.time_execution(
@@ -29,7 +30,14 @@ if __name__ == "__main__":
     # )
 
     # print(nifty_anim.lerp(2.0, 10.0, 0.5))
-    widget = nifty.Widget(500, 200, in_layout_direction=nifty.LayoutDirection.vertical)
+    show_mode = nifty.ShowMode.resize
+    for argument in sys.argv:
+
+        if argument.startswith("--show-mode="):
+
+            show_mode = nifty.ShowMode[argument.split("=", 1)[1]]
+
+    widget = nifty.Widget(500, 200, in_layout_direction=nifty.LayoutDirection.vertical, in_show_mode=show_mode)
     for num in range(4):
 
         sub_widget = nifty.Widget(500, 500, in_layout=QtWidgets.QHBoxLayout)
@@ -39,5 +47,10 @@ if __name__ == "__main__":
             sub_widget.addWidget(button)
         widget.addWidget(sub_widget)
 
+    if "--hud" in sys.argv:
+
+        hud = nifty_profiling.PerformanceOverlay()
+        hud.attach(widget)
+
     widget.show(animate=True)
     app.exec_()
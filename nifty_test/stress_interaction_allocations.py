@@ -0,0 +1,107 @@
+"""Sweeps a simulated mouse across a grid of PushButtons and reports allocations per round.
+
+Every round enters, presses, releases and leaves each button in turn, lets
+the animations settle and then takes a tracemalloc snapshot. Once the
+animations of every button have been built, the live block count and
+traced memory should stay flat from round to round.
+"""
+import argparse
+import gc
+import os
+import site
+import sys
+import time
+import tracemalloc
+
+from Qt import QtCore
+from Qt import QtGui
+from Qt import QtWidgets
+
+
+def __setup__():
+
+    nifty_package_path = os.path.normpath(
+        os.path.join(__file__, os.path.pardir, os.path.pardir)
+    )
+    site.addsitedir(nifty_package_path)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def _process_events_for_(in_seconds):
+
+    end_time = time.perf_counter() + in_seconds
+    while time.perf_counter() < end_time:
+        QtWidgets.QApplication.processEvents(QtCore.QEventLoop.AllEvents, 5)
+
+
+def _sweep_(in_buttons):
+    """Move the mouse through every button, pressing and releasing each one on the way."""
+
+    center = QtCore.QPointF(10, 10)
+    for button in in_buttons:
+
+        QtWidgets.QApplication.sendEvent(button, QtGui.QEnterEvent(center, center, center))
+        for event_type in (QtCore.QEvent.MouseButtonPress, QtCore.QEvent.MouseButtonRelease):
+
+            QtWidgets.QApplication.sendEvent(
+                button,
+                QtGui.QMouseEvent(event_type, center, QtCore.Qt.LeftButton, QtCore.Qt.LeftButton, QtCore.Qt.NoModifier),
+            )
+
+        QtWidgets.QApplication.sendEvent(button, QtCore.QEvent(QtCore.QEvent.Leave))
+        QtWidgets.QApplication.processEvents()
+
+
+def _get_block_count_():
+
+    return sum(statistic.count for statistic in tracemalloc.take_snapshot().statistics("filename"))
+
+
+def run(in_button_count, in_round_count, in_settle_seconds, in_columns=20):
+
+    import nifty.widgets as nifty
+
+    window = nifty.Widget(in_columns * 20, in_columns * 20, in_layout=QtWidgets.QGridLayout)
+    buttons = []
+    for index in range(in_button_count):
+
+        button = nifty.PushButton("", 20, 20)
+        window.layout().addWidget(button, index // in_columns, index % in_columns)
+        buttons.append(button)
+
+    window.show(animate=False)
+    _process_events_for_(in_settle_seconds)
+
+    tracemalloc.start()
+    print(f"{'round':>5}{'blocks':>10}{'change':>10}{'traced':>14}{'QTimers':>10}")
+    previous_block_count = None
+    for round_index in range(in_round_count):
+
+        _sweep_(buttons)
+        _process_events_for_(in_settle_seconds)
+        gc.collect()
+
+        block_count = _get_block_count_()
+        traced_memory, _ = tracemalloc.get_traced_memory()
+        timer_count = len(window.findChildren(QtCore.QTimer))
+        change = "" if previous_block_count is None else f"{block_count - previous_block_count:+d}"
+        print(f"{round_index:>5}{block_count:>10}{change:>10}{traced_memory / 1024:>10.1f} KiB{timer_count:>10}")
+        previous_block_count = block_count
+
+    tracemalloc.stop()
+
+    return window
+
+
+if __name__ == "__main__":
+
+    __setup__()
+
+    parser = argparse.ArgumentParser(description="Report allocations while sweeping the mouse over PushButtons.")
+    parser.add_argument("--count", type=int, default=400)
+    parser.add_argument("--rounds", type=int, default=8)
+    parser.add_argument("--settle", type=float, default=0.5, help="Seconds to let animations finish per round.")
+    arguments = parser.parse_args()
+
+    app = QtWidgets.QApplication(sys.argv)
+    window = run(arguments.count, arguments.rounds, arguments.settle)
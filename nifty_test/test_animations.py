@@ -0,0 +1,185 @@
+import pytest
+
+pytest.importorskip("Qt")
+
+from Qt import QtCore
+from Qt import QtGui
+from Qt import QtWidgets
+
+from nifty import animations
+
+
+def test_property_animation_group_animates_every_property(app):
+
+    widget = QtWidgets.QWidget()
+    animation_group = animations.PropertyAnimationGroup(
+        widget, ("minimumWidth", "maximumWidth"), (10, 50), in_duration=100
+    )
+    assert animation_group.animationCount() == 2
+
+    animation_group.start()
+    animations.fast_forward(animation_group)
+    assert widget.minimumWidth() == 50
+    assert widget.maximumWidth() == 50
+
+
+def test_create_combined_property_animation_returns_a_property_animation_group(app):
+
+    widget = QtWidgets.QWidget()
+    animation_group = animations.create_combined_property_animation(widget, ("minimumHeight",), (0, 20))
+
+    assert isinstance(animation_group, animations.PropertyAnimationGroup)
+
+
+@pytest.fixture(params=("numpy", "pure python"))
+def batch_backend(request, monkeypatch):
+    """Run a batch test with NumPy, and again with the pure Python fallback used without it."""
+
+    if request.param == "numpy":
+
+        pytest.importorskip("numpy")
+
+    else:
+
+        monkeypatch.setattr(animations, "_get_numpy_", lambda: None)
+
+    return request.param
+
+
+def _as_rows_(in_values):
+
+    return [[float(value) for value in row] for row in in_values]
+
+
+def test_lerp_colors_endpoints_and_midpoint(app, batch_backend):
+
+    start_colors = [QtGui.QColor(0, 0, 0, 255), QtGui.QColor(255, 255, 255, 0)]
+    end_colors = [QtGui.QColor(255, 0, 255, 255), QtGui.QColor(255, 255, 255, 255)]
+
+    assert _as_rows_(animations.lerp_colors(start_colors, end_colors, 0.0)) == [[0, 0, 0, 1], [1, 1, 1, 0]]
+    assert _as_rows_(animations.lerp_colors(start_colors, end_colors, 1.0)) == [[1, 0, 1, 1], [1, 1, 1, 1]]
+    assert _as_rows_(animations.lerp_colors(start_colors, end_colors, [0.5, 0.5])) == [
+        [0.5, 0, 0.5, 1], [1, 1, 1, 0.5]
+    ]
+
+
+def test_lerp_points_and_sizes_midpoint(app, batch_backend):
+
+    points = animations.lerp_points([QtCore.QPointF(0, 10)], [QtCore.QPointF(10, 30)], 0.5)
+    sizes = animations.lerp_sizes([QtCore.QSize(0, 100)], [QtCore.QSize(50, 200)], 0.5)
+
+    assert _as_rows_(points) == [[5, 20]]
+    assert _as_rows_(sizes) == [[25, 150]]
+
+
+@pytest.mark.parametrize(
+    "in_easing_type", (QtCore.QEasingCurve.Linear, QtCore.QEasingCurve.InQuad, QtCore.QEasingCurve.OutCubic)
+)
+def test_easing_table_matches_the_easing_curve(app, batch_backend, in_easing_type):
+
+    easing_curve = QtCore.QEasingCurve(in_easing_type)
+    easing_table = animations.EasingTable(in_easing_type)
+    progress = [index / 100 for index in range(101)]
+
+    for value, expected in zip(easing_table(progress), map(easing_curve.valueForProgress, progress)):
+
+        assert float(value) == pytest.approx(expected, abs=1e-4)
+
+    assert easing_table(0.37) == pytest.approx(easing_curve.valueForProgress(0.37), abs=1e-4)
+    assert easing_table(-1.0) == 0.0
+    assert easing_table(2.0) == pytest.approx(1.0)
+
+
+def test_get_easing_table_is_cached(app):
+
+    easing_table = animations.get_easing_table(QtCore.QEasingCurve.InQuad)
+
+    assert animations.get_easing_table(QtCore.QEasingCurve.InQuad) is easing_table
+
+
+def test_evaluate_batch_matches_the_scalar_evaluation(app, batch_backend):
+
+    start_values = [0.0, 10.0, -5.0, 100.0]
+    end_values = [1.0, 20.0, 5.0, 0.0]
+    progress = [0.0, 0.25, 0.5, 1.0]
+    easing_table = animations.get_easing_table(QtCore.QEasingCurve.InQuad)
+
+    batch_values = animations.evaluate_batch(start_values, end_values, progress)
+    scalar_values = [
+        animations.lerp(start, end, easing_table(value))
+        for start, end, value in zip(start_values, end_values, progress)
+    ]
+
+    assert [float(value) for value in batch_values] == pytest.approx(scalar_values)
+
+
+@pytest.fixture
+def budget_animations(app):
+    """Start long running animations of chosen priorities, restoring the budget and stopping them afterwards."""
+
+    started_animations = []
+    # The animations are parented to their widget, so the widgets are kept alive with them.
+    animated_widgets = []
+    animations.reset_eviction_counts()
+
+    def _start_(in_priority):
+
+        # One widget each, as Qt stops a property animation when another starts on the same property.
+        widget = QtWidgets.QWidget()
+        animation = animations.PropertyAnimation(widget, "minimumWidth", (0, 100), in_duration=10000)
+        animated_widgets.append(widget)
+        animation.set_priority(in_priority)
+        animation.start()
+        started_animations.append(animation)
+
+        return animation
+
+    yield _start_
+
+    animations.set_animation_budget(None)
+    for animation in started_animations:
+        animation.stop()
+
+    animations.reset_eviction_counts()
+
+
+def test_animation_budget_evicts_the_lowest_priority_first(budget_animations):
+
+    animations.set_animation_budget(2)
+    feedback_animation = budget_animations(animations.AnimationPriority.feedback)
+    hover_animation = budget_animations(animations.AnimationPriority.hover)
+    show_animation = budget_animations(animations.AnimationPriority.show)
+
+    assert not animations.is_running(hover_animation)
+    assert hover_animation.currentTime() == hover_animation.totalDuration()
+    assert animations.is_running(feedback_animation)
+    assert animations.is_running(show_animation)
+    assert animations.eviction_counts()[animations.AnimationPriority.hover] == 1
+
+    trailing_animation = budget_animations(animations.AnimationPriority.trailing)
+    assert not animations.is_running(trailing_animation)
+    assert animations.is_running(feedback_animation)
+    assert animations.is_running(show_animation)
+
+
+def test_animation_budget_evicts_the_oldest_of_equal_priority(budget_animations):
+
+    animations.set_animation_budget(2)
+    oldest_animation = budget_animations(animations.AnimationPriority.hover)
+    newer_animations = [budget_animations(animations.AnimationPriority.hover) for _ in range(2)]
+
+    assert not animations.is_running(oldest_animation)
+    assert all(animations.is_running(animation) for animation in newer_animations)
+
+
+def test_animation_budget_evicts_nothing_under_the_cap(budget_animations):
+
+    animations.set_animation_budget(3)
+    started_animations = [
+        budget_animations(priority)
+        for priority in (animations.AnimationPriority.trailing, animations.AnimationPriority.hover)
+    ]
+    animations.set_animation_budget(2)
+
+    assert all(animations.is_running(animation) for animation in started_animations)
+    assert not any(animations.eviction_counts().values())
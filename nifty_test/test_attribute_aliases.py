@@ -0,0 +1,29 @@
+import pytest
+
+pytest.importorskip("Qt")
+
+from nifty import widgets
+
+
+class _OverridingWidget_(widgets.Widget):
+
+    def set_height(self, in_height):
+
+        self.overridden_height = in_height
+
+
+def test_alias_reaches_subclass_override(app):
+
+    # Resolving the alias on the base class first must not bind the base implementation for subclasses.
+    widgets.Widget(100, 100).setHeight
+    widget = _OverridingWidget_(100, 100)
+    widget.setHeight(50)
+    assert widget.overridden_height == 50
+
+
+def test_alias_is_bound_after_first_lookup(app):
+
+    widget = widgets.Widget(100, 100)
+    widget.set_maximum_height(60)
+    assert "set_maximum_height" in type(widget).__dict__
+    assert widget.maximumHeight() == 60
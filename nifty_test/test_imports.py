@@ -0,0 +1,48 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+# Loaded only once something enables them, or once a batch helper needs NumPy.
+_DEFERRED_MODULES = ("numpy", "nifty.atlases", "nifty.quality")
+
+_REPORT = "print(' '.join(name for name in {modules!r} if name in sys.modules))"
+
+
+def _get_loaded_modules_(in_statement):
+    """Run in_statement in a fresh interpreter, returning which of _DEFERRED_MODULES it loaded."""
+
+    nifty_package_path = os.path.normpath(os.path.join(__file__, os.path.pardir, os.path.pardir))
+    environment = dict(os.environ, PYTHONPATH=nifty_package_path)
+    output = subprocess.run(
+        (
+            sys.executable,
+            "-c",
+            f"import sys; {in_statement}; " + _REPORT.format(modules=_DEFERRED_MODULES),
+        ),
+        env=environment,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+    return output.split()
+
+
+@pytest.mark.parametrize("in_statement", ("import nifty", "import nifty; nifty.Widget; nifty.PushButton"))
+def test_importing_nifty_defers_optional_modules(in_statement):
+
+    if in_statement != "import nifty":
+
+        pytest.importorskip("Qt")
+
+    assert _get_loaded_modules_(in_statement) == []
+
+
+def test_enabling_pulse_atlases_loads_them():
+
+    pytest.importorskip("Qt")
+
+    assert _get_loaded_modules_("import nifty; nifty.enable_pulse_atlases") == ["nifty.atlases"]
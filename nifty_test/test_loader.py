@@ -0,0 +1,125 @@
+import json
+import os
+
+import pytest
+
+pytest.importorskip("Qt")
+
+from nifty import loader
+from nifty import widgets
+
+
+_SPEC = {
+    "type": "Widget",
+    "width": 300,
+    "height": 200,
+    "layout": "grid",
+    "columns": 2,
+    "children": [
+        {"type": "PushButton", "text": "BUTTON", "width": 100, "height": 50, "repeat": 3},
+        {"type": "AnimatedToggle", "width": 60, "height": 30, "properties": {"minimum_height": 30}},
+    ],
+}
+
+
+def _write_spec_(in_directory, in_spec):
+
+    path = os.path.join(str(in_directory), "spec.json")
+    with open(path, "w") as spec_file:
+        json.dump(in_spec, spec_file)
+
+    return path
+
+
+@pytest.mark.parametrize(
+    "in_spec, in_message",
+    (
+        ({"type": "Slider", "width": 1, "height": 1}, "root: 'type' must be one of"),
+        ({"type": "Widget", "width": -1, "height": 1}, "root: 'width' must be an integer of at least 0"),
+        ({"type": "Widget", "width": 1, "height": 1, "colour": "red"}, "root: unknown key(s) colour"),
+        ({"type": "Widget", "width": 1, "height": 1, "repeat": 2}, "root: the root widget cannot be repeated"),
+        (
+            {"type": "Widget", "width": 1, "height": 1, "children": [{"type": "PushButton", "width": 1}]},
+            "root.children[0]: 'height' must be an integer",
+        ),
+        (
+            {"type": "PushButton", "width": 1, "height": 1, "children": [{"type": "PushButton"}]},
+            "root: only a Widget can have children",
+        ),
+        (
+            {"type": "PushButton", "width": 1, "height": 1, "properties": {"minimumWidth": 10}},
+            "root: property 'minimumWidth' must be snake case",
+        ),
+        (
+            {"type": "PushButton", "width": 1, "height": 1, "properties": {"fixed_sizzle": 10}},
+            "root: PushButton has no setter setFixedSizzle",
+        ),
+    ),
+)
+def test_compile_spec_rejects_invalid_specs(app, in_spec, in_message):
+
+    with pytest.raises(ValueError) as error:
+        loader.compile_spec(in_spec)
+
+    assert str(error.value).startswith(in_message)
+
+
+def test_load_plan_reuses_the_cached_plan(app, tmp_path, monkeypatch):
+
+    cache_directory = str(tmp_path / "cache")
+    spec_path = _write_spec_(tmp_path, _SPEC)
+    plan = loader.load_plan(spec_path, cache_directory)
+    assert len(os.listdir(cache_directory)) == 1
+
+    def _compile_spec_(in_spec):
+        raise AssertionError("the cached plan should have been used")
+
+    monkeypatch.setattr(loader, "compile_spec", _compile_spec_)
+    assert loader.load_plan(spec_path, cache_directory) == plan
+
+
+def test_load_plan_recompiles_a_changed_spec(app, tmp_path):
+
+    cache_directory = str(tmp_path / "cache")
+    spec_path = _write_spec_(tmp_path, _SPEC)
+    plan = loader.load_plan(spec_path, cache_directory)
+
+    _write_spec_(tmp_path, dict(_SPEC, width=400))
+    changed_plan = loader.load_plan(spec_path, cache_directory)
+
+    assert changed_plan["nodes"][0][1] == 400
+    assert changed_plan != plan
+    assert len(os.listdir(cache_directory)) == 2
+
+
+def test_load_plan_recompiles_a_plan_of_another_version(app, tmp_path):
+
+    cache_directory = str(tmp_path / "cache")
+    spec_path = _write_spec_(tmp_path, _SPEC)
+    loader.load_plan(spec_path, cache_directory)
+    (cache_name,) = os.listdir(cache_directory)
+    cache_path = os.path.join(cache_directory, cache_name)
+    with open(cache_path, "w") as cache_file:
+        json.dump({"version": loader.FORMAT_VERSION - 1, "nodes": [], "children": []}, cache_file)
+
+    assert loader.load_plan(spec_path, cache_directory)["version"] == loader.FORMAT_VERSION
+
+
+def test_load_spec_builds_the_widget_tree(app, tmp_path):
+
+    root = loader.load_spec(_write_spec_(tmp_path, _SPEC), str(tmp_path / "cache"))
+
+    assert isinstance(root, widgets.Widget)
+    layout = root.layout()
+    children = [layout.itemAt(index).widget() for index in range(layout.count())]
+    assert [type(child) for child in children] == [widgets.PushButton] * 3 + [widgets.AnimatedToggle]
+    assert [child.text() for child in children[:3]] == ["BUTTON"] * 3
+    assert children[3].minimumHeight() == 30
+    # Two columns, filled row by row.
+    assert [layout.getItemPosition(index)[:2] for index in range(layout.count())] == [(0, 0), (0, 1), (1, 0), (1, 1)]
+
+
+def test_build_plan_rejects_a_plan_of_another_version(app):
+
+    with pytest.raises(ValueError):
+        loader.build_plan({"version": loader.FORMAT_VERSION + 1, "nodes": [], "children": []})
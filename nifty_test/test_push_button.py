@@ -0,0 +1,63 @@
+import pytest
+
+pytest.importorskip("Qt")
+
+from Qt import QtCore
+from Qt import QtGui
+
+from nifty import animations
+from nifty import widgets
+
+
+def _spin_event_loop_(in_milliseconds=50):
+    """Run an event loop for a while, so queued follow-ups get to play."""
+
+    event_loop = QtCore.QEventLoop()
+    QtCore.QTimer.singleShot(in_milliseconds, event_loop.quit)
+    event_loop.exec_()
+
+
+def _create_button_with_counted_leave_():
+    """Create a hovered button, recording each time its leave pulse would play."""
+
+    button = widgets.PushButton("BUTTON", 100, 100)
+    leave_calls = []
+    button._play_mouse_leave_animation_ = lambda: leave_calls.append(True)
+    button._play_mouse_enter_animation_()
+
+    return button, leave_calls
+
+
+def test_follow_up_plays_once_the_pulse_finishes(app):
+
+    button, leave_calls = _create_button_with_counted_leave_()
+    button.leaveEvent(QtCore.QEvent(QtCore.QEvent.Leave))
+    assert leave_calls == []
+
+    animations.fast_forward(button._get_pulse_animation_("mouse_enter")[2])
+    _spin_event_loop_()
+    assert leave_calls == [True]
+    assert button._queued_follow_ups == set()
+
+
+def test_repeated_events_do_not_stack_follow_ups(app):
+
+    button, leave_calls = _create_button_with_counted_leave_()
+    for _ in range(3):
+        button.leaveEvent(QtCore.QEvent(QtCore.QEvent.Leave))
+
+    animations.fast_forward(button._get_pulse_animation_("mouse_enter")[2])
+    _spin_event_loop_()
+    assert leave_calls == [True]
+
+
+def test_entering_again_cancels_a_queued_follow_up(app):
+
+    button, leave_calls = _create_button_with_counted_leave_()
+    button.leaveEvent(QtCore.QEvent(QtCore.QEvent.Leave))
+    center = QtCore.QPointF(50, 50)
+    button.enterEvent(QtGui.QEnterEvent(center, center, center))
+
+    animations.fast_forward(button._get_pulse_animation_("mouse_enter")[2])
+    _spin_event_loop_()
+    assert leave_calls == []
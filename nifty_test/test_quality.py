@@ -0,0 +1,56 @@
+import pytest
+
+pytest.importorskip("Qt")
+
+from nifty import quality
+
+
+class _Clock_(object):
+    """Stands in for QElapsedTimer, returning a fixed gap between ticks."""
+
+    def __init__(self, in_elapsed):
+
+        self.elapsed = in_elapsed
+
+    def restart(self):
+
+        return self.elapsed
+
+
+def _tick_(in_controller, in_elapsed, in_tick_count):
+
+    in_controller._clock = _Clock_(in_elapsed)
+    for _ in range(in_tick_count):
+
+        in_controller._on_frame_()
+
+
+def test_downgrades_while_blocked_and_recovers_once_idle():
+
+    controller = quality.QualityController(in_frame_budget=16, in_sample_count=4)
+    interval = controller._timer.interval()
+
+    # Every tick arrives a whole budget late.
+    _tick_(controller, interval + 40, 4)
+    assert controller.level() == quality.QualityLevel.no_antialiasing
+    _tick_(controller, interval + 40, 4)
+    assert controller.level() == quality.QualityLevel.short_durations
+
+    # Ticks arriving on time record no overrun, stepping back up one level per sample window.
+    _tick_(controller, interval, 4)
+    assert controller.level() == quality.QualityLevel.no_antialiasing
+    _tick_(controller, interval, 4)
+    assert controller.level() == quality.QualityLevel.full
+    assert [(old, new) for _, old, new, _ in controller.history] == [
+        (quality.QualityLevel.full, quality.QualityLevel.no_antialiasing),
+        (quality.QualityLevel.no_antialiasing, quality.QualityLevel.short_durations),
+        (quality.QualityLevel.short_durations, quality.QualityLevel.no_antialiasing),
+        (quality.QualityLevel.no_antialiasing, quality.QualityLevel.full),
+    ]
+
+
+def test_scheduler_jitter_does_not_downgrade():
+
+    controller = quality.QualityController(in_frame_budget=16, in_sample_count=4)
+    _tick_(controller, controller._timer.interval() + 3, 8)
+    assert controller.level() == quality.QualityLevel.full
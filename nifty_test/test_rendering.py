@@ -0,0 +1,26 @@
+import pytest
+
+pytest.importorskip("Qt")
+
+from Qt import QtGui
+
+from nifty import rendering
+
+
+def test_pulse_frames_with_close_colours_share_a_sprite(app):
+
+    cache = rendering.SpriteCache()
+    first_sprite = cache.get_pulse_sprite(20.2, QtGui.QColor(120, 180, 240))
+    second_sprite = cache.get_pulse_sprite(19.8, QtGui.QColor(118, 178, 241))
+
+    assert second_sprite is first_sprite
+    assert cache.statistics()["hit_rate"] == 0.5
+
+
+def test_pulse_frames_with_distant_colours_do_not_share_a_sprite(app):
+
+    cache = rendering.SpriteCache()
+    cache.get_pulse_sprite(20, QtGui.QColor(120, 180, 240))
+    cache.get_pulse_sprite(20, QtGui.QColor(42, 130, 218))
+
+    assert cache.statistics()["misses"] == 2
@@ -0,0 +1,25 @@
+import pytest
+
+pytest.importorskip("Qt")
+
+from nifty import widgets
+
+
+def test_snapshot_overlay_follows_the_widget_as_it_resizes(app):
+
+    widget = widgets.Widget(100, 100, in_show_mode=widgets.ShowMode.clip)
+    widget.show(animate=True)
+    widget.resize(200, 150)
+
+    overlay = widget._get_snapshot_overlay_()
+    assert overlay.isVisible()
+    assert overlay.geometry() == widget.rect()
+
+
+def test_snapshot_reveal_lasts_as_long_as_the_show_animation(app):
+
+    widget = widgets.Widget(100, 100, in_show_mode=widgets.ShowMode.clip)
+    widget.show(animate=True)
+
+    assert widget._get_snapshot_overlay_().reveal_animation.base_duration() == widget._SHOW_DURATION
+    assert widget._get_show_animation_().animationAt(0).base_duration() == widget._SHOW_DURATION
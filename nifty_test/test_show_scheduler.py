@@ -0,0 +1,48 @@
+import pytest
+
+pytest.importorskip("Qt")
+
+from Qt import QtCompat
+from Qt import QtCore
+from Qt import QtWidgets
+
+from nifty import widgets
+
+
+def _build_widget_():
+
+    widget = widgets.Widget(100, 100)
+    for _ in range(4):
+        widget.addWidget(QtWidgets.QLabel("LABEL"))
+
+    return widget
+
+
+def _spin_event_loop_(in_milliseconds=50):
+    """Run an event loop for a while, so objects deleted later from outside of one are deleted."""
+
+    event_loop = QtCore.QEventLoop()
+    QtCore.QTimer.singleShot(in_milliseconds, event_loop.quit)
+    event_loop.exec_()
+
+
+def test_replaced_schedulers_are_deleted(app):
+
+    widget = _build_widget_()
+    schedulers = [widget.show_descendants(animate=False) for _ in range(3)]
+
+    _spin_event_loop_()
+    assert not any(QtCompat.isValid(scheduler) for scheduler in schedulers[:-1])
+    assert len(widget.findChildren(widgets.ShowScheduler)) <= 1
+
+
+def test_finished_schedulers_are_deleted(app):
+
+    widget = _build_widget_()
+    scheduler = widget.show_descendants(animate=False)
+    while not scheduler.is_finished():
+        QtWidgets.QApplication.processEvents()
+
+    _spin_event_loop_()
+    assert widget.findChildren(widgets.ShowScheduler) == []
+    assert scheduler.errors == []
@@ -0,0 +1,40 @@
+import pytest
+
+pytest.importorskip("Qt")
+
+from nifty import animations
+from nifty import themes
+from nifty import widgets
+
+
+def test_set_theme_restyles_a_hovered_button_at_rest(app):
+
+    theme = themes.ThemeHandle()
+    button = widgets.PushButton("BUTTON", 100, 100, in_theme=theme)
+    button._play_mouse_enter_animation_()
+    animations.fast_forward(button._get_pulse_animation_("mouse_enter")[2])
+
+    theme.set_theme(theme.theme.derive(accent_color="#FF0000"))
+    assert button.mouse_enter_pulse_color == theme.theme.mouse_enter_pulse_end_color
+
+
+def test_set_theme_retargets_a_running_hover_pulse(app):
+
+    theme = themes.ThemeHandle()
+    button = widgets.PushButton("BUTTON", 100, 100, in_theme=theme)
+    button._play_mouse_enter_animation_()
+
+    theme.set_theme(theme.theme.derive(accent_color="#FF0000"))
+    animations.fast_forward(button._get_pulse_animation_("mouse_enter")[2])
+    assert button.mouse_enter_pulse_color == theme.theme.mouse_enter_pulse_end_color
+
+
+def test_set_theme_restyles_a_checked_toggle(app):
+
+    theme = themes.ThemeHandle()
+    toggle = widgets.AnimatedToggle(in_theme=theme)
+    toggle.setChecked(True)
+    animations.fast_forward(toggle._animation_group)
+
+    theme.set_theme(theme.theme.derive(checked_color="#FF0000"))
+    assert toggle.handle_color == theme.theme.checked_color
@@ -0,0 +1,81 @@
+import pytest
+
+pytest.importorskip("Qt")
+
+from Qt import QtCore
+from Qt import QtWidgets
+
+from nifty import views
+
+
+def _create_view_(in_row_count=20):
+
+    view = views.PulseButtonView(
+        QtCore.QStringListModel([f"BUTTON {row}" for row in range(in_row_count)]),
+        in_item_size=QtCore.QSize(20, 20),
+    )
+    view.resize(100, 100)
+
+    return view
+
+
+def _show_and_settle_(in_view):
+
+    in_view.show()
+    # Let the delayed item layout run.
+    QtWidgets.QApplication.processEvents()
+    QtWidgets.QApplication.processEvents()
+
+
+def test_painting_does_not_start_border_reveals(app):
+
+    view = _create_view_()
+    border_states = bytes(view._border_states)
+
+    assert view._get_border_show_time_(0) == 0.0
+    assert bytes(view._border_states) == border_states
+    assert view._item_states == {}
+
+
+def test_showing_reveals_only_the_visible_rows(app):
+
+    view = _create_view_(in_row_count=200)
+    _show_and_settle_(view)
+
+    visible_rows = view._get_visible_rows_()
+    assert len(visible_rows) > 0
+    assert all(view._border_states[row] == views._BORDER_ANIMATING for row in visible_rows)
+    assert view._border_states[199] == views._BORDER_HIDDEN
+
+
+def test_inserting_a_row_keeps_the_state_of_the_others(app):
+
+    view = _create_view_()
+    view._border_states[:] = bytes((views._BORDER_SHOWN,)) * len(view._border_states)
+    state = view._get_item_state_(5, in_create=True)
+    view._hovered_row = 5
+
+    view.model().insertRows(0, 1)
+
+    assert view._get_item_state_(6) is state
+    assert view._get_item_state_(5) is None
+    assert view._hovered_row == 6
+    assert view._border_states[0] == views._BORDER_HIDDEN
+    assert set(view._border_states[1:]) == {views._BORDER_SHOWN}
+
+
+def test_removing_rows_drops_only_their_state(app):
+
+    view = _create_view_()
+    removed_state = view._get_item_state_(2, in_create=True)
+    kept_state = view._get_item_state_(5, in_create=True)
+    view._pressed_row = 2
+    view._hovered_row = 5
+
+    view.model().removeRows(1, 2)
+
+    assert removed_state not in view._item_states.values()
+    assert view._get_item_state_(3) is kept_state
+    assert view._pressed_row == -1
+    assert view._hovered_row == 3
+    assert len(view._border_states) == 18